@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""GDB MCP 서버 벤치마크.
+
+MCP 도구 호출 경로(요청 검증, 핸들러, 결과 직렬화)를 프로세스 안에서 직접 호출하여
+다음 항목을 측정하고 JSON으로 저장합니다.
+
+- gdb_start: 첫 시작과 반복 시작의 지연 시간 (시작마다의 색인 캐시 상태 포함, 풀 미사용)
+- gdb_execute: 왕복 지연 시간 분포 (p50/p90/p99)
+- 처리량: 세션 하나와 N개 세션 동시 실행 시의 초당 명령 수
+- gdb_status: 호출 비용
+- qemu_start: GDB 스텁 준비까지 걸린 시간 (--qemu-arch 지정 시)
+
+사용법:
+    python benchmarks/bench_server.py --target fw.elf --output bench.json
+    python benchmarks/bench_server.py --output new.json --compare bench.json
+    python benchmarks/bench_server.py --stub --command "info registers"   # QEMU 없이 원격 경로 측정
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 비교 시 회귀로 판단하는 기본 변화율 (%)
+DEFAULT_THRESHOLD = 10.0
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값 목록의 백분위수를 선형 보간으로 계산합니다."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """초 단위 측정값을 밀리초 통계로 요약합니다."""
+    values = sorted(sample * 1000 for sample in samples)
+    if not values:
+        return {"n": 0}
+    return {
+        "n": len(values),
+        "mean_ms": round(sum(values) / len(values), 4),
+        "min_ms": round(values[0], 4),
+        "p50_ms": round(percentile(values, 50), 4),
+        "p90_ms": round(percentile(values, 90), 4),
+        "p99_ms": round(percentile(values, 99), 4),
+        "max_ms": round(values[-1], 4),
+    }
+
+
+class ToolClient:
+    """MCP 서버의 도구 호출 핸들러를 직접 부르는 클라이언트."""
+
+    def __init__(self, server: Any):
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        self.server = server
+        self._request_type = CallToolRequest
+        self._params_type = CallToolRequestParams
+        self._handler = server.server.request_handlers[CallToolRequest]
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Tuple[float, Any]:
+        """도구를 호출하고 (걸린 시간(초), CallToolResult)를 반환합니다."""
+        request = self._request_type(
+            method="tools/call", params=self._params_type(name=name, arguments=arguments)
+        )
+        started = time.perf_counter()
+        result = await self._handler(request)
+        # MCP 전송 계층이 하는 직렬화까지 포함합니다
+        result.model_dump_json()
+        elapsed = time.perf_counter() - started
+        return elapsed, result.root
+
+    async def call_checked(self, name: str, arguments: Dict[str, Any]) -> float:
+        """도구를 호출하고 걸린 시간(초)을 반환합니다. 도구가 실패(isError)하면 RuntimeError."""
+        elapsed, result = await self.call(name, arguments)
+        if result.isError:
+            raise RuntimeError(f"{name} 실패: {result.content[0].text}")
+        return elapsed
+
+
+async def bench_gdb_start(client: ToolClient, args: argparse.Namespace) -> Dict[str, Any]:
+    """gdb_start의 첫 시작과 반복 시작 지연 시간을 측정합니다.
+
+    미리 시작된 GDB를 받지 않도록 측정하는 동안 풀을 끕니다. 첫 시작이 색인 캐시
+    cold인지는 index_cache에 기록된 상태로 확인합니다 (--fresh-index-cache를 쓰면 cold).
+    """
+    pool_size = client.server.pool.size
+    client.server.pool.configure(size=0)
+    samples: List[float] = []
+    states: List[Optional[str]] = []
+    try:
+        for iteration in range(args.start_iterations + 1):
+            session_id = f"bench-start-{iteration}"
+            samples.append(await client.call_checked("gdb_start", _start_arguments(session_id, args)))
+            states.append(client.server.sessions.get(session_id).gdb.index_cache_state)
+            await client.call("process_stop", {"process_type": "session", "session_id": session_id})
+    finally:
+        client.server.pool.configure(size=pool_size)
+    return {"first": summarize(samples[:1]), "repeat": summarize(samples[1:]), "index_cache": states}
+
+
+def _start_arguments(session_id: str, args: argparse.Namespace) -> Dict[str, Any]:
+    arguments: Dict[str, Any] = {"session_id": session_id, "new_session": True}
+    if args.target:
+        arguments["target"] = args.target
+    if args.remote:
+        arguments["remote"] = args.remote
+    return arguments
+
+
+async def _start_session(client: ToolClient, session_id: str, args: argparse.Namespace) -> None:
+    await client.call_checked("gdb_start", _start_arguments(session_id, args))
+
+
+async def _execute_loop(client: ToolClient, session_id: str, command: str,
+                        iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        samples.append(await client.call_checked("gdb_execute", {"command": command, "session_id": session_id}))
+    return samples
+
+
+async def bench_execute(client: ToolClient, args: argparse.Namespace) -> Dict[str, Any]:
+    """gdb_execute 왕복 지연 시간과 세션 하나의 처리량을 측정합니다."""
+    session_id = "bench-execute"
+    await _start_session(client, session_id, args)
+    try:
+        await _execute_loop(client, session_id, args.command, args.warmup)
+        started = time.perf_counter()
+        samples = await _execute_loop(client, session_id, args.command, args.iterations)
+        wall = time.perf_counter() - started
+    finally:
+        await client.call("process_stop", {"process_type": "session", "session_id": session_id})
+    result = summarize(samples)
+    result["command"] = args.command
+    result["commands_per_sec"] = round(len(samples) / wall, 2)
+    return result
+
+
+async def bench_sessions(client: ToolClient, args: argparse.Namespace) -> Dict[str, Any]:
+    """N개 세션에서 동시에 명령을 실행할 때의 처리량을 측정합니다."""
+    session_ids = [f"bench-multi-{index}" for index in range(args.sessions)]
+    await asyncio.gather(*(_start_session(client, session_id, args) for session_id in session_ids))
+    try:
+        await asyncio.gather(*(
+            _execute_loop(client, session_id, args.command, args.warmup) for session_id in session_ids
+        ))
+        started = time.perf_counter()
+        per_session = await asyncio.gather(*(
+            _execute_loop(client, session_id, args.command, args.iterations) for session_id in session_ids
+        ))
+        wall = time.perf_counter() - started
+    finally:
+        await asyncio.gather(*(
+            client.call("process_stop", {"process_type": "session", "session_id": session_id})
+            for session_id in session_ids
+        ))
+    samples = [sample for session_samples in per_session for sample in session_samples]
+    result = summarize(samples)
+    result["sessions"] = args.sessions
+    result["commands_per_sec"] = round(len(samples) / wall, 2)
+    result["commands_per_sec_per_session"] = round(len(samples) / wall / args.sessions, 2)
+    return result
+
+
+async def bench_status(client: ToolClient, args: argparse.Namespace) -> Dict[str, Any]:
+    """GDB가 실행 중인 세션에 대한 gdb_status 호출 비용을 측정합니다."""
+    session_id = "bench-status"
+    await _start_session(client, session_id, args)
+    try:
+        samples = []
+        for _ in range(args.iterations):
+            samples.append(await client.call_checked("gdb_status", {"session_id": session_id}))
+    finally:
+        await client.call("process_stop", {"process_type": "session", "session_id": session_id})
+    return summarize(samples)
+
+
+async def bench_qemu_start(client: ToolClient, args: argparse.Namespace) -> Dict[str, Any]:
+    """qemu_start 호출부터 GDB 스텁 준비까지의 시간을 측정합니다."""
+    samples: List[float] = []
+    ready: List[float] = []
+    for iteration in range(args.qemu_iterations):
+        session_id = f"bench-qemu-{iteration}"
+        arguments: Dict[str, Any] = {
+            "arch": args.qemu_arch,
+            "options": args.qemu_option,
+            "session_id": session_id,
+            "new_session": True,
+        }
+        if args.qemu_kernel:
+            arguments["kernel"] = args.qemu_kernel
+        try:
+            samples.append(await client.call_checked("qemu_start", arguments))
+            startup_time = client.server.sessions.get(session_id).qemu.startup_time
+            if startup_time is not None:
+                ready.append(startup_time)
+        finally:
+            await client.call("process_stop", {"process_type": "session", "session_id": session_id})
+    return {"call": summarize(samples), "stub_ready": summarize(ready), "arch": args.qemu_arch}
+
+
+def _gdb_version() -> Optional[str]:
+    try:
+        output = subprocess.run(["gdb", "--version"], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.splitlines()[0] if output else None
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    """선택한 벤치마크를 실행하고 결과를 반환합니다."""
+    from gdb_mcp import __version__
+    from gdb_mcp.server import GDBMCPServer
+
+    stub = None
+    if args.stub:
+        from gdb_mcp.rsp_stub import RSPStub, StubTarget
+
+        # 세션마다 같은 엔드포인트로 접속해도 연결별로 독립된 타겟을 받습니다
+        target = StubTarget()
+        if args.target:
+            target.load_elf(args.target)
+        stub = RSPStub(target)
+        args.remote = await stub.start()
+
+    server = GDBMCPServer()
+    client = ToolClient(server)
+    results: Dict[str, Any] = {}
+    benches = [
+        ("gdb_start", bench_gdb_start),
+        ("gdb_execute", bench_execute),
+        ("sessions", bench_sessions),
+        ("gdb_status", bench_status),
+    ]
+    if args.qemu_arch:
+        benches.append(("qemu_start", bench_qemu_start))
+    try:
+        for name, bench in benches:
+            if args.only and name not in args.only:
+                continue
+            print(f"[bench] {name} ...", file=sys.stderr, flush=True)
+            results[name] = await bench(client, args)
+    finally:
+        await server.sessions.close_all()
+        await server.pool.close()
+        if stub is not None:
+            await stub.close()
+
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "version": __version__,
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "gdb": _gdb_version(),
+            "target": args.target,
+            "remote": "rsp_stub" if args.stub else args.remote,
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+
+
+def _flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and (key.endswith("_ms") or key.startswith("commands_per_sec")):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """두 결과를 비교하여 회귀 항목 목록을 반환하고 변화를 출력합니다.
+
+    지연 시간(_ms)은 늘어난 경우, 처리량(commands_per_sec)은 줄어든 경우를
+    threshold(%) 이상 변하면 회귀로 봅니다.
+    """
+    old = _flatten(baseline.get("results", {}))
+    new = _flatten(current.get("results", {}))
+    regressions = []
+    for name in sorted(old.keys() & new.keys()):
+        if not old[name]:
+            continue
+        change = (new[name] - old[name]) / old[name] * 100
+        worse = -change if "commands_per_sec" in name else change
+        marker = "  "
+        if worse >= threshold and not name.endswith(("min_ms", "max_ms")):
+            marker = "!!"
+            regressions.append(name)
+        print(f"{marker} {name:50} {old[name]:12.3f} -> {new[name]:12.3f} ({change:+.1f}%)", file=sys.stderr)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점."""
+    parser = argparse.ArgumentParser(description="GDB MCP 서버 벤치마크")
+    parser.add_argument("--target", help="gdb_start에 사용할 ELF (생략 시 타겟 없이 시작)")
+    parser.add_argument("--remote", help="gdb_start에서 접속할 원격 타겟 (예: localhost:1234)")
+    parser.add_argument("--stub", action="store_true",
+                        help="내장 RSP 스텁 시뮬레이터를 띄워 원격 타겟으로 사용 (QEMU 시간 제외)")
+    parser.add_argument("--command", default="print 1+1", help="gdb_execute로 반복 실행할 명령")
+    parser.add_argument("--iterations", type=int, default=500, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 예열 반복 횟수")
+    parser.add_argument("--start-iterations", type=int, default=5, help="warm gdb_start 측정 횟수")
+    parser.add_argument("--sessions", type=int, default=4, help="동시 실행 세션 수")
+    parser.add_argument("--qemu-arch", help="qemu_start 측정에 사용할 아키텍처 (생략 시 측정하지 않음)")
+    parser.add_argument("--qemu-kernel", help="qemu_start 측정에 사용할 커널/ELF")
+    parser.add_argument("--qemu-option", action="append", default=[], help="QEMU 옵션 (여러 번 지정 가능)")
+    parser.add_argument("--qemu-iterations", type=int, default=5, help="qemu_start 측정 횟수")
+    parser.add_argument("--only", action="append", help="실행할 벤치마크 이름 (여러 번 지정 가능)")
+    parser.add_argument("--fresh-index-cache", action="store_true",
+                        help="빈 GDB index-cache 디렉토리를 사용하여 첫 gdb_start를 색인 캐시 cold로 측정")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 판단할 변화율 (%%)")
+    args = parser.parse_args(argv)
+
+    if args.fresh_index_cache:
+        # 설정은 모듈을 불러올 때 읽으므로 서버를 불러오기 전에 바꿉니다
+        os.environ["GDB_MCP_INDEX_CACHE_DIR"] = tempfile.mkdtemp(prefix="gdb-mcp-bench-index-")
+
+    report = asyncio.run(run_benchmarks(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            print(f"회귀 {len(regressions)}개: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
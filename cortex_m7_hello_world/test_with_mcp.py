@@ -45,11 +45,13 @@ class CortexM7MCPServer:
                 text=True
             )
             
-            # QEMU가 시작될 때까지 대기
-            await asyncio.sleep(2)
+            # GDB 스텁이 접속을 받을 때까지 대기
+            started = time.perf_counter()
+            ready = await self.wait_for_gdb_stub("localhost:1234", timeout=10.0)
             
-            if self.qemu_process.poll() is None:
-                print("✅ QEMU 시뮬레이션 시작됨 (PID: {})".format(self.qemu_process.pid))
+            if ready and self.qemu_process.poll() is None:
+                print("✅ QEMU 시뮬레이션 시작됨 (PID: {}, 준비 시간: {:.1f}ms)".format(
+                    self.qemu_process.pid, (time.perf_counter() - started) * 1000))
                 return True
             else:
                 print("❌ QEMU 시작 실패")
@@ -59,6 +61,19 @@ class CortexM7MCPServer:
             print(f"❌ QEMU 시작 오류: {e}")
             return False
     
+    async def wait_for_gdb_stub(self, endpoint, timeout):
+        """GDB 스텁이 접속을 받을 때까지 기다립니다."""
+        from gdb_mcp.process_manager import probe_gdb_endpoint
+        
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if self.qemu_process.poll() is not None:
+                return False
+            if await probe_gdb_endpoint(endpoint):
+                return True
+            await asyncio.sleep(0.01)
+        return False
+    
     async def test_gdb_connection(self):
         """GDB 연결을 테스트합니다."""
         print("\nGDB 연결 테스트...")
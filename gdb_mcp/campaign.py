@@ -0,0 +1,363 @@
+"""여러 테스트 케이스를 독립된 QEMU/GDB 인스턴스에서 병렬로 실행하는 캠페인 실행기.
+
+사용법:
+    python -m gdb_mcp.campaign manifest.json -j 8 --junit report.xml --json report.json
+
+매니페스트 예:
+    {
+      "arch": "arm",
+      "gdb": "arm-none-eabi-gdb",
+      "qemu_options": ["-M", "mps2-an385", "-nographic", "-serial", "mon:stdio"],
+      "timeout": 60,
+      "cases": [
+        {"name": "uart", "elf": "build/uart.elf", "gdb_script": "scripts/run.gdb",
+         "expect": "TEST PASS", "fail": "TEST FAIL"}
+      ]
+    }
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import CampaignCase, CampaignCaseResult, CampaignManifest
+from .process_manager import is_execution_command
+from .session import DebugSession
+
+logger = logging.getLogger(__name__)
+
+# 케이스 종료 후 남길 콘솔 출력 크기 (바이트)
+_CONSOLE_TAIL_BYTES = 2048
+
+# 결과에 남길 GDB 출력의 최대 길이 (문자)
+_GDB_OUTPUT_LIMIT = 8192
+
+# `end`로 끝나는 블록을 여는 GDB 명령
+_BLOCK_START_RE = re.compile(r"^(define|document|commands|if|while|python|py)(?=\s|$)")
+
+# 본문이 GDB 명령이 아니어서 중첩 블록을 찾지 않는 블록
+_TEXT_BLOCKS = ("document", "python", "py")
+
+ResultCallback = Callable[[CampaignCaseResult], None]
+
+
+def load_manifest(path: str) -> CampaignManifest:
+    """JSON 매니페스트를 읽습니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        return CampaignManifest(**json.load(f))
+
+
+def _block_kind(line: str) -> Optional[str]:
+    """줄이 `end`로 끝나는 블록을 여는 명령이면 명령 이름을 반환합니다."""
+    match = _BLOCK_START_RE.match(line)
+    if match is None:
+        return None
+    kind = match.group(1)
+    # python/py는 인자가 없을 때만 블록을 엽니다
+    if kind in _TEXT_BLOCKS and kind != "document" and line[match.end():].strip():
+        return None
+    return kind
+
+
+def load_gdb_script(path: str) -> List[str]:
+    """GDB 스크립트에서 빈 줄과 주석을 제외한 명령 목록을 읽습니다.
+
+    define/document/commands/if/while/python ... end 블록은 줄바꿈으로 이은
+    항목 하나로 묶습니다. 블록이 닫히지 않았거나 짝이 없는 end가 있으면 ValueError.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+
+    commands: List[str] = []
+    block: List[str] = []
+    stack: List[str] = []
+    for number, line in enumerate(lines, 1):
+        in_text = bool(stack) and stack[-1] in _TEXT_BLOCKS
+        if not in_text and (not line or line.startswith("#")):
+            continue
+        if line == "end":
+            if not stack:
+                raise ValueError(f"{path}:{number}: 짝이 없는 end")
+            stack.pop()
+            block.append(line)
+            if not stack:
+                commands.append("\n".join(block))
+                block = []
+            continue
+        kind = None if in_text else _block_kind(line)
+        if kind is not None:
+            stack.append(kind)
+        if stack:
+            block.append(line)
+        else:
+            commands.append(line)
+    if stack:
+        raise ValueError(f"{path}: {stack[0]} 블록이 end로 닫히지 않았습니다")
+    return commands
+
+
+class CampaignRunner:
+    """매니페스트의 케이스를 코어 수만큼의 격리된 세션에서 동시에 실행합니다.
+
+    케이스마다 자체 QEMU(자동 할당된 GDB 스텁 엔드포인트)와 GDB를 가진
+    세션을 만들고, 끝나면 세션을 닫습니다. 결과는 끝나는 순서대로
+    콜백에 전달되며 요약은 매니페스트 순서로 정렬됩니다.
+    """
+
+    def __init__(self, manifest: CampaignManifest, base_dir: str = ".",
+                 jobs: Optional[int] = None):
+        self.manifest = manifest
+        self.base_dir = base_dir
+        self.jobs = max(jobs or os.cpu_count() or 1, 1)
+
+    async def run(self, on_result: Optional[ResultCallback] = None) -> Dict[str, Any]:
+        """모든 케이스를 실행하고 요약을 반환합니다."""
+        semaphore = asyncio.Semaphore(self.jobs)
+        started = time.perf_counter()
+
+        async def guarded(index: int, case: CampaignCase):
+            async with semaphore:
+                return index, await self.run_case(case)
+
+        results: List[Optional[CampaignCaseResult]] = [None] * len(self.manifest.cases)
+        tasks = [asyncio.ensure_future(guarded(index, case))
+                 for index, case in enumerate(self.manifest.cases)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                index, result = await future
+                results[index] = result
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        wall = time.perf_counter() - started
+        finished = [result for result in results if result is not None]
+        counts = {status: sum(result.status == status for result in finished)
+                  for status in ("passed", "failed", "error")}
+        return {
+            "jobs": self.jobs,
+            "total": len(finished),
+            **counts,
+            "wall_ms": round(wall * 1000, 3),
+            "case_ms_sum": round(sum(result.duration_ms for result in finished), 3),
+            "cases": [result.model_dump() for result in finished],
+        }
+
+    async def run_case(self, case: CampaignCase) -> CampaignCaseResult:
+        """케이스 하나를 독립된 세션에서 실행합니다."""
+        manifest = self.manifest
+        timeout = case.timeout or manifest.timeout
+        started = time.perf_counter()
+        deadline = started + timeout
+        timings: Dict[str, float] = {}
+        result = CampaignCaseResult(name=case.name, status="error")
+        session = DebugSession(f"campaign-{case.name}")
+
+        def lap(name: str, since: float) -> float:
+            now = time.perf_counter()
+            timings[name] = round((now - since) * 1000, 3)
+            return now
+
+        try:
+            elf = self._resolve(case.elf)
+            commands = load_gdb_script(self._resolve(case.gdb_script)) if case.gdb_script else []
+            commands.extend(case.commands)
+
+            phase = time.perf_counter()
+            success, error = await session.qemu.start(
+                arch=case.arch or manifest.arch,
+                kernel=elf,
+                options=list(case.qemu_options if case.qemu_options is not None else manifest.qemu_options),
+                gdb_transport="unix" if os.name != "nt" else "tcp",
+                startup_timeout=timeout,
+            )
+            phase = lap("qemu_start_ms", phase)
+            if not success:
+                result.message = f"QEMU 시작 실패: {error}"
+                return result
+
+            success, error = await session.gdb.start(
+                target=elf,
+                remote=session.qemu.endpoint,
+                options=list(case.gdb_options if case.gdb_options is not None else manifest.gdb_options),
+                gdb_path=case.gdb or manifest.gdb,
+                startup_timeout=max(deadline - time.perf_counter(), 0.1),
+            )
+            phase = lap("gdb_start_ms", phase)
+            if not success:
+                result.message = f"GDB 시작 실패: {error}"
+                return result
+
+            outputs = []
+            for position, command in enumerate(commands):
+                remaining = max(deadline - time.perf_counter(), 0.1)
+                # 마지막 실행 명령은 재개만 시키고, 이후 판정은 콘솔 출력으로 합니다
+                if "\n" in command:
+                    success, output, error = await self._source_block(session, command, remaining)
+                elif is_execution_command(command) and position < len(commands) - 1:
+                    success, output, error, _ = await session.gdb.execute_until_stopped(command, remaining)
+                else:
+                    success, output, error = await session.gdb.execute_command(command, remaining)
+                outputs.append(output)
+                if not success:
+                    result.status = "failed"
+                    result.message = f"GDB 명령 실패 ({command.splitlines()[0]}): {error}"
+                    return result
+            gdb_output = "\n".join(output for output in outputs if output)
+            result.gdb_output = gdb_output[-_GDB_OUTPUT_LIMIT:] or None
+            phase = lap("script_ms", phase)
+
+            result.status = "failed"
+            if case.expect or case.fail:
+                pattern = "|".join(f"(?:{p})" for p in (case.expect, case.fail) if p)
+                waited = await session.qemu.wait_output(
+                    pattern, cursor=0, timeout=max(deadline - time.perf_counter(), 0),
+                    tail_bytes=_CONSOLE_TAIL_BYTES,
+                )
+                lap("wait_ms", phase)
+                if not waited["matched"]:
+                    result.message = "QEMU 출력이 끝났습니다" if waited["exited"] else f"{timeout}초 안에 결과가 출력되지 않았습니다"
+                    result.console_tail = waited.get("tail")
+                    return result
+                result.match = waited["match"]
+                if case.fail and re.search(case.fail, result.match, re.MULTILINE):
+                    result.message = f"실패 출력: {result.match}"
+                    return result
+                if case.expect and not re.search(case.expect, result.match, re.MULTILINE):
+                    result.message = f"예상하지 않은 출력: {result.match}"
+                    return result
+            if case.expect_gdb:
+                match = re.search(case.expect_gdb, gdb_output, re.MULTILINE)
+                if match is None:
+                    result.message = f"GDB 출력이 일치하지 않습니다: {case.expect_gdb}"
+                    return result
+                result.match = result.match or match.group(0)
+            result.status = "passed"
+            return result
+
+        except Exception as e:
+            logger.error(f"케이스 실행 오류 ({case.name}): {e}")
+            result.status = "error"
+            result.message = str(e) or type(e).__name__
+            return result
+
+        finally:
+            if result.status != "passed" and result.console_tail is None:
+                data, _, _ = session.qemu.read_console("stdout", -_CONSOLE_TAIL_BYTES)
+                result.console_tail = data.decode(errors="replace") or None
+            teardown = time.perf_counter()
+            await session.close()
+            lap("teardown_ms", teardown)
+            result.timings = timings
+            result.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    @staticmethod
+    async def _source_block(session: DebugSession, block: str,
+                            timeout: float) -> Tuple[bool, str, Optional[str]]:
+        """여러 줄 블록을 임시 파일에 써서 GDB의 source 명령으로 실행합니다."""
+        with tempfile.NamedTemporaryFile("w", suffix=".gdb", delete=False, encoding="utf-8") as f:
+            f.write(block + "\n")
+        try:
+            return await session.gdb.execute_command(f"source {f.name}", timeout)
+        finally:
+            os.unlink(f.name)
+
+    def _resolve(self, path: str) -> str:
+        return path if os.path.isabs(path) else os.path.join(self.base_dir, path)
+
+
+def write_json(path: str, summary: Dict[str, Any]) -> None:
+    """요약을 JSON 파일로 저장합니다."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def write_junit(path: str, summary: Dict[str, Any], suite_name: str = "gdb-mcp-campaign") -> None:
+    """요약을 JUnit XML 파일로 저장합니다."""
+    suite = ET.Element("testsuite", {
+        "name": suite_name,
+        "tests": str(summary["total"]),
+        "failures": str(summary["failed"]),
+        "errors": str(summary["error"]),
+        "time": f"{summary['wall_ms'] / 1000:.3f}",
+    })
+    for case in summary["cases"]:
+        element = ET.SubElement(suite, "testcase", {
+            "name": case["name"],
+            "classname": suite_name,
+            "time": f"{case['duration_ms'] / 1000:.3f}",
+        })
+        if case["status"] != "passed":
+            tag = "failure" if case["status"] == "failed" else "error"
+            detail = ET.SubElement(element, tag, {"message": case.get("message") or case["status"]})
+            detail.text = case.get("console_tail") or ""
+        if case.get("gdb_output"):
+            ET.SubElement(element, "system-out").text = case["gdb_output"]
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def _format_result(result: CampaignCaseResult) -> str:
+    line = f"{result.status.upper():6} {result.name} ({result.duration_ms:.1f}ms)"
+    if result.message:
+        line += f": {result.message}"
+    return line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점."""
+    parser = argparse.ArgumentParser(prog="gdb-mcp-campaign", description="QEMU/GDB 테스트 캠페인 실행기")
+    parser.add_argument("manifest", help="JSON 매니페스트 경로")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="동시에 실행할 인스턴스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--gdb", help="실행할 GDB (예: arm-none-eabi-gdb, gdb-multiarch, 매니페스트 기본값보다 우선)")
+    parser.add_argument("-k", "--filter", help="이름이 정규식과 일치하는 케이스만 실행")
+    parser.add_argument("--junit", help="JUnit XML 결과 파일 경로")
+    parser.add_argument("--json", help="JSON 요약 파일 경로")
+    parser.add_argument("--jsonl", action="store_true", help="케이스 결과를 JSON Lines로 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)],
+    )
+
+    manifest = load_manifest(args.manifest)
+    if args.gdb:
+        manifest.gdb = args.gdb
+    if args.filter:
+        manifest.cases = [case for case in manifest.cases if re.search(args.filter, case.name)]
+
+    def report(result: CampaignCaseResult) -> None:
+        print(result.model_dump_json() if args.jsonl else _format_result(result), flush=True)
+
+    runner = CampaignRunner(manifest, os.path.dirname(os.path.abspath(args.manifest)), args.jobs)
+    summary = asyncio.run(runner.run(report))
+
+    if args.json:
+        write_json(args.json, summary)
+    if args.junit:
+        write_junit(args.junit, summary)
+    print(
+        f"총 {summary['total']}개: 성공 {summary['passed']}, 실패 {summary['failed']}, 에러 {summary['error']} "
+        f"(경과 {summary['wall_ms'] / 1000:.2f}s, 케이스 합계 {summary['case_ms_sum'] / 1000:.2f}s, 동시 실행 {summary['jobs']})",
+        file=sys.stderr,
+    )
+    return 0 if summary["passed"] == summary["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
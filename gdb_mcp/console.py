@@ -0,0 +1,138 @@
+"""QEMU 콘솔 출력 버퍼 모듈."""
+
+import asyncio
+import os
+import re
+from typing import List, Match, Optional, Pattern, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 스트림별로 메모리에 유지하는 콘솔 출력의 최대 크기 (바이트)
+DEFAULT_CONSOLE_BYTES = int(os.environ.get("GDB_MCP_CONSOLE_BYTES", 1024 * 1024))
+
+# 출력 대기 시 이전에 검사한 부분을 다시 포함하는 길이 (바이트).
+# 새 출력과 이전 출력에 걸친 매치를 찾을 수 있는 최대 길이이기도 합니다.
+DEFAULT_MATCH_OVERLAP = 4096
+
+
+class ConsoleBuffer:
+    """절대 오프셋으로 조회하는 바이트 링 버퍼.
+
+    스트림 시작부터 받은 바이트 수를 오프셋으로 사용하므로, 조회한 끝
+    오프셋을 커서로 넘기면 그 이후에 들어온 출력만 받을 수 있습니다.
+    한도를 넘은 오래된 출력은 버리며, 버린 구간을 가리키는 커서는
+    남아 있는 가장 오래된 위치로 옮기고 건너뛴 바이트 수를 알려 줍니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CONSOLE_BYTES):
+        self.max_bytes = max_bytes
+        self._data = bytearray()
+        # _data[0]의 절대 오프셋
+        self.start = 0
+        # 스트림이 닫혀 더 이상 출력이 없는지 여부
+        self.closed = False
+        self._waiters: List["asyncio.Future[None]"] = []
+
+    @property
+    def end(self) -> int:
+        """지금까지 받은 전체 바이트 수 (다음 출력의 오프셋)."""
+        return self.start + len(self._data)
+
+    def append(self, data: bytes) -> None:
+        """출력을 추가하고 한도를 넘은 앞부분을 버립니다."""
+        self._data += data
+        excess = len(self._data) - self.max_bytes
+        if excess > 0:
+            # bytearray 앞부분 삭제는 내부 시작 위치만 옮기므로 복사 비용이 적습니다
+            del self._data[:excess]
+            self.start += excess
+        self._wake()
+
+    def close(self) -> None:
+        """스트림이 끝났음을 표시하고 대기 중인 작업을 깨웁니다."""
+        self.closed = True
+        self._wake()
+
+    async def wait(self, cursor: int, timeout: Optional[float] = None) -> None:
+        """cursor 이후에 출력이 들어오거나 스트림이 닫힐 때까지 기다립니다.
+
+        타임아웃이 지나면 조용히 반환합니다.
+        """
+        if self.end > cursor or self.closed:
+            return
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if future in self._waiters:
+                self._waiters.remove(future)
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def read(self, cursor: int, max_bytes: int = -1) -> Tuple[bytes, int, int]:
+        """커서 이후의 출력을 반환합니다.
+
+        (데이터, 다음 커서, 버려져서 건너뛴 바이트 수)를 반환합니다.
+        cursor가 음수이면 끝에서부터의 위치로 해석합니다 (예: -4096이면 마지막 4KiB).
+        """
+        if cursor < 0:
+            cursor = max(self.end + cursor, 0)
+        dropped = max(self.start - cursor, 0)
+        cursor = min(max(cursor, self.start), self.end)
+        offset = cursor - self.start
+        stop = len(self._data) if max_bytes < 0 else min(offset + max_bytes, len(self._data))
+        return bytes(self._data[offset:stop]), self.start + stop, dropped
+
+    def tail(self, max_bytes: int) -> bytes:
+        """마지막 max_bytes 바이트를 반환합니다."""
+        return bytes(self._data[-max_bytes:]) if max_bytes > 0 else b""
+
+    def clear(self) -> None:
+        """내용을 비웁니다. 오프셋은 계속 증가합니다."""
+        self.start = self.end
+        self._data = bytearray()
+
+
+async def wait_for_pattern(buffer: ConsoleBuffer, pattern: Pattern[bytes], cursor: int,
+                           timeout: float, overlap: int = DEFAULT_MATCH_OVERLAP
+                           ) -> Tuple[Optional[Match[bytes]], int, int]:
+    """cursor 이후의 출력에서 정규식이 매치될 때까지 기다립니다.
+
+    새로 들어온 바이트와 직전 overlap 바이트만 검사하므로 기록 전체를 다시
+    훑지 않습니다. (매치 또는 None, 검사한 구간의 시작 오프셋, 다음 커서)를
+    반환하며, 매치되면 다음 커서는 매치의 끝입니다. 매치 위치는
+    검사 구간 시작 오프셋 + match.start()로 계산합니다.
+    검사 구간 바로 앞의 1바이트를 문맥으로 함께 읽으므로, 구간이 줄 중간에서
+    시작해도 `^`는 실제 줄 시작에서만 매치됩니다.
+    """
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    if cursor < 0:
+        cursor = max(buffer.end + cursor, 0)
+    scanned = cursor
+    while True:
+        window = max(scanned - overlap, cursor, buffer.start)
+        # 앞 문맥 1바이트를 포함해 읽고, 매치는 구간 안에서만 찾습니다
+        begin = window - 1 if window > buffer.start else window
+        data, end, _ = buffer.read(begin)
+        match = pattern.search(data, window - begin)
+        if match:
+            return match, begin, begin + match.end()
+        scanned = end
+        remaining = deadline - loop.time()
+        if buffer.closed or remaining <= 0:
+            return None, begin, scanned
+        await buffer.wait(scanned, remaining)
+
+
+def compile_output_pattern(pattern: str) -> Pattern[bytes]:
+    """콘솔 출력(바이트)에 적용할 정규식을 컴파일합니다. ^와 $는 줄 단위로 동작합니다."""
+    return re.compile(pattern.encode(), re.MULTILINE)
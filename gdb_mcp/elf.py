@@ -0,0 +1,327 @@
+"""ELF 파일 파싱 및 심볼 색인 모듈."""
+
+import bisect
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import BinaryIO, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 심볼 색인 등 디스크 캐시를 저장할 디렉토리
+DEFAULT_CACHE_DIR = os.environ.get(
+    "GDB_MCP_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "gdb-mcp")
+)
+
+# 디스크에 저장하는 심볼 색인 형식 식별자
+_INDEX_MAGIC = b"GMSYM1\n"
+
+# ELF 상수
+_ELFCLASS64 = 2
+_ELFDATA2MSB = 2
+_SHT_SYMTAB = 2
+_SHT_DYNSYM = 11
+_SHT_NOTE = 7
+_NT_GNU_BUILD_ID = 3
+_SHN_UNDEF = 0
+_SHN_LORESERVE = 0xFF00
+_SHN_ABS = 0xFFF1
+_STT_NOTYPE = 0
+_STT_OBJECT = 1
+_STT_FUNC = 2
+_STB_GLOBAL = 1
+_EM_ARM = 40
+
+# 프로세스 안에서 유지하는 최근 색인 수
+_MAX_LOADED_INDEXES = 8
+
+# 프로세스 안에서 이미 읽은 색인 ((경로, 수정 시각, 크기) 기준, 최근 사용한 것이 뒤에 옵니다)
+_loaded_indexes: "OrderedDict[Tuple[str, int, int], ElfSymbolIndex]" = OrderedDict()
+_loaded_indexes_lock = threading.Lock()
+
+
+class ElfError(Exception):
+    """ELF 파일을 해석할 수 없을 때 발생합니다."""
+
+
+class ElfFile:
+    """ELF 헤더와 섹션 헤더를 읽는 최소한의 파서."""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        ident = self._read(0, 16)
+        if ident[:4] != b"\x7fELF":
+            raise ElfError("ELF 파일이 아닙니다")
+        self.is_64 = ident[4] == _ELFCLASS64
+        self.endian = ">" if ident[5] == _ELFDATA2MSB else "<"
+        if self.is_64:
+            fields = struct.unpack(self.endian + "HHIQQQIHHHHHH", self._read(16, 48))
+        else:
+            fields = struct.unpack(self.endian + "HHIIIIIHHHHHH", self._read(16, 36))
+        (_, self.machine, _, _, _, shoff, _, _, _, _,
+         shentsize, shnum, shstrndx) = fields
+        self.sections = self._read_sections(shoff, shentsize, shnum, shstrndx)
+
+    def _read(self, offset: int, size: int) -> bytes:
+        self._f.seek(offset)
+        data = self._f.read(size)
+        if len(data) != size:
+            raise ElfError("ELF 파일이 잘렸습니다")
+        return data
+
+    def _read_sections(self, shoff: int, shentsize: int, shnum: int,
+                       shstrndx: int) -> List[Dict[str, int]]:
+        """섹션 헤더 목록을 읽습니다."""
+        if shoff == 0 or shnum == 0:
+            return []
+        fmt = self.endian + ("IIQQQQIIQQ" if self.is_64 else "IIIIIIIIII")
+        table = self._read(shoff, shentsize * shnum)
+        sections = []
+        for index in range(shnum):
+            (name, sh_type, flags, addr, offset, size,
+             link, info, align, entsize) = struct.unpack_from(fmt, table, index * shentsize)
+            sections.append({
+                "name_offset": name, "type": sh_type, "flags": flags, "addr": addr, "offset": offset,
+                "size": size, "link": link, "entsize": entsize,
+            })
+        if shstrndx < len(sections):
+            names = self.section_data(sections[shstrndx])
+            for section in sections:
+                end = names.find(b"\0", section["name_offset"])
+                section["name"] = names[section["name_offset"]:end].decode(errors="replace")
+        return sections
+
+    def section_data(self, section: Dict[str, int]) -> bytes:
+        """섹션 내용을 읽습니다."""
+        return self._read(section["offset"], section["size"])
+
+    def section(self, name: str) -> Optional[Dict[str, int]]:
+        """이름으로 섹션을 찾습니다."""
+        for section in self.sections:
+            if section.get("name") == name:
+                return section
+        return None
+
+    def iter_symbols(self):
+        """.symtab과 .dynsym의 (이름, 값, 크기, 타입, 바인딩, 섹션 인덱스)를 순회합니다."""
+        if self.is_64:
+            fmt, entsize = self.endian + "IBBHQQ", 24
+        else:
+            fmt, entsize = self.endian + "IIIBBH", 16
+        for section in self.sections:
+            if section["type"] not in (_SHT_SYMTAB, _SHT_DYNSYM):
+                continue
+            if section["link"] >= len(self.sections):
+                continue
+            strtab = self.section_data(self.sections[section["link"]])
+            data = self.section_data(section)
+            for fields in struct.iter_unpack(fmt, data[:len(data) - len(data) % entsize]):
+                if self.is_64:
+                    name, info, _, shndx, value, size = fields
+                else:
+                    name, value, size, info, _, shndx = fields
+                end = strtab.find(b"\0", name)
+                yield (strtab[name:end].decode(errors="replace"), value, size,
+                       info & 0xF, info >> 4, shndx)
+
+
+class ElfSymbolIndex:
+    """주소순으로 정렬된 배열 기반 심볼 테이블.
+
+    주소, 크기는 `array`에, 이름은 리스트에 보관하며 이진 탐색으로 조회합니다.
+    """
+
+    def __init__(self, addresses: "array[int]", sizes: "array[int]", names: List[str]):
+        self.addresses = addresses
+        self.sizes = sizes
+        self.names = names
+
+    @classmethod
+    def from_elf(cls, path: str) -> "ElfSymbolIndex":
+        """ELF 파일의 심볼 테이블로 색인을 만듭니다."""
+        best: Dict[int, Tuple[Tuple[bool, bool, bool], int, str, int]] = {}
+        with open(path, "rb") as f:
+            elf = ElfFile(f)
+            for name, value, size, sym_type, binding, shndx in elf.iter_symbols():
+                if not name or sym_type not in (_STT_NOTYPE, _STT_OBJECT, _STT_FUNC):
+                    continue
+                if shndx == _SHN_UNDEF or (shndx >= _SHN_LORESERVE and shndx != _SHN_ABS):
+                    continue
+                # ARM 매핑 심볼($a, $t, $d)은 건너뛰고 Thumb 비트는 제거합니다
+                if elf.machine == _EM_ARM:
+                    if name.startswith("$"):
+                        continue
+                    if sym_type == _STT_FUNC:
+                        value &= ~1
+                # 같은 주소에는 크기가 있는 전역 함수/객체 심볼을 우선합니다
+                rank = (size > 0, sym_type != _STT_NOTYPE, binding == _STB_GLOBAL)
+                current = best.get(value)
+                if current is None or rank > current[0]:
+                    best[value] = (rank, size, name, shndx)
+            sections = elf.sections
+
+        addresses = array("Q", sorted(best))
+        sizes = array("Q", bytes(8 * len(addresses)))
+        names = []
+        for index, address in enumerate(addresses):
+            _, size, name, shndx = best[address]
+            if size == 0 and shndx < len(sections):
+                # 크기가 없는 심볼(어셈블리 레이블 등)은 다음 심볼이나 섹션 끝까지로 봅니다
+                section = sections[shndx]
+                end = section["addr"] + section["size"]
+                if index + 1 < len(addresses):
+                    end = min(end, addresses[index + 1])
+                size = max(end - address, 0)
+            sizes[index] = size
+            names.append(name)
+        return cls(addresses, sizes, names)
+
+    def lookup(self, address: int) -> Optional[Tuple[str, int]]:
+        """주소를 포함하는 심볼의 (이름, 오프셋)을 반환합니다. 없으면 None.
+
+        크기가 0인 심볼(절대 심볼 등)은 정확히 같은 주소만 일치합니다.
+        """
+        index = bisect.bisect_right(self.addresses, address) - 1
+        if index < 0:
+            return None
+        start = self.addresses[index]
+        if address >= start + max(self.sizes[index], 1):
+            return None
+        return self.names[index], address - start
+
+    def symbolize(self, address: int) -> Optional[str]:
+        """주소를 GDB `info symbol` 형식(예: main + 4)의 문자열로 변환합니다."""
+        found = self.lookup(address)
+        if found is None:
+            return None
+        name, offset = found
+        return f"{name} + {offset}" if offset else name
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def save(self, path: str) -> None:
+        """색인을 파일에 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        names = "\0".join(self.names).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_INDEX_MAGIC)
+                f.write(struct.pack("<QQ", len(self.addresses), len(names)))
+                f.write(self._le_bytes(self.addresses))
+                f.write(self._le_bytes(self.sizes))
+                f.write(names)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "ElfSymbolIndex":
+        """저장된 색인을 읽습니다."""
+        with open(path, "rb") as f:
+            if f.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                raise ElfError(f"심볼 색인 형식이 아닙니다: {path}")
+            count, names_size = struct.unpack("<QQ", f.read(16))
+            addresses, sizes = array("Q"), array("Q")
+            addresses.frombytes(f.read(count * 8))
+            sizes.frombytes(f.read(count * 8))
+            names_data = f.read(names_size)
+        if len(addresses) != count or len(sizes) != count or len(names_data) != names_size:
+            raise ElfError(f"심볼 색인 파일이 잘렸습니다: {path}")
+        if struct.pack("=H", 1) != struct.pack("<H", 1):
+            addresses.byteswap()
+            sizes.byteswap()
+        names = names_data.decode().split("\0") if count else []
+        return cls(addresses, sizes, names)
+
+    @staticmethod
+    def _le_bytes(values: "array[int]") -> bytes:
+        """배열을 리틀 엔디언 바이트열로 변환합니다."""
+        if struct.pack("=H", 1) == struct.pack("<H", 1):
+            return values.tobytes()
+        swapped = array("Q", values)
+        swapped.byteswap()
+        return swapped.tobytes()
+
+
+def read_build_id(path: str) -> Optional[str]:
+    """ELF의 GNU build-id를 16진수 문자열로 반환합니다. 없으면 None."""
+    with open(path, "rb") as f:
+        elf = ElfFile(f)
+        for section in elf.sections:
+            if section["type"] != _SHT_NOTE:
+                continue
+            data = elf.section_data(section)
+            offset = 0
+            while offset + 12 <= len(data):
+                name_size, desc_size, note_type = struct.unpack_from(elf.endian + "III", data, offset)
+                name_start = offset + 12
+                desc_start = name_start + (name_size + 3) // 4 * 4
+                name = data[name_start:name_start + name_size].rstrip(b"\0")
+                if note_type == _NT_GNU_BUILD_ID and name == b"GNU":
+                    return data[desc_start:desc_start + desc_size].hex()
+                offset = desc_start + (desc_size + 3) // 4 * 4
+    return None
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_symbol_index(path: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> ElfSymbolIndex:
+    """ELF 파일의 심볼 색인을 반환합니다.
+
+    ELF 내용의 SHA-256을 키로 디스크 캐시를 사용하며, 같은 프로세스에서
+    파일이 바뀌지 않았으면 메모리에 있는 색인을 다시 사용합니다.
+    메모리에는 최근에 사용한 _MAX_LOADED_INDEXES개의 색인만 유지합니다.
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _loaded_indexes_lock:
+        index = _loaded_indexes.get(key)
+        if index is not None:
+            _loaded_indexes.move_to_end(key)
+            return index
+
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, "symbols", file_sha256(path) + ".idx")
+        try:
+            index = ElfSymbolIndex.load(cache_path)
+            logger.info(f"심볼 색인 캐시 사용: {cache_path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ElfError, ValueError) as e:
+            logger.warning(f"심볼 색인 캐시를 읽지 못했습니다 ({cache_path}): {e}")
+
+    if index is None:
+        index = ElfSymbolIndex.from_elf(path)
+        logger.info(f"심볼 색인 생성: {path} ({len(index)}개)")
+        if cache_path:
+            try:
+                index.save(cache_path)
+            except OSError as e:
+                logger.warning(f"심볼 색인 캐시를 저장하지 못했습니다 ({cache_path}): {e}")
+
+    with _loaded_indexes_lock:
+        # 같은 경로의 이전 빌드 색인은 버립니다
+        for stale in [other for other in _loaded_indexes if other[0] == path and other != key]:
+            del _loaded_indexes[stale]
+        _loaded_indexes[key] = index
+        _loaded_indexes.move_to_end(key)
+        while len(_loaded_indexes) > _MAX_LOADED_INDEXES:
+            _loaded_indexes.popitem(last=False)
+    return index
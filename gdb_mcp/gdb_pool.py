@@ -0,0 +1,292 @@
+"""미리 시작해 둔 GDB 프로세스 풀 모듈."""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import logging
+
+from .mi_transport import GDBMITransport, MIResponse
+from .tracing import detached_task
+
+logger = logging.getLogger(__name__)
+
+# 풀 기본 설정 (환경 변수)
+DEFAULT_POOL_SIZE = int(os.environ.get("GDB_MCP_POOL_SIZE", 0))
+DEFAULT_POOL_MAX_IDLE = int(os.environ.get("GDB_MCP_POOL_MAX_IDLE", 8))
+DEFAULT_POOL_MAX_AGE = float(os.environ.get("GDB_MCP_POOL_MAX_AGE", 600))
+DEFAULT_POOL_TARGETS = [
+    target for target in os.environ.get("GDB_MCP_POOL_TARGETS", "").split(os.pathsep) if target
+]
+
+# 오래된 프로세스를 정리하는 최대 간격 (초)
+_REAP_INTERVAL_MAX = 30.0
+
+# 타겟 ELF의 (수정 시각(ns), 크기)
+FileSignature = Optional[Tuple[int, int]]
+
+# (GDB 실행 명령, 타겟 ELF 서명)
+PoolKey = Tuple[Tuple[str, ...], FileSignature]
+
+
+def file_signature(path: Optional[str]) -> FileSignature:
+    """파일의 수정 시각과 크기를 반환합니다. 파일이 없으면 None."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _IdleGDB:
+    """풀에서 대기 중인 GDB."""
+
+    __slots__ = ("transport", "created_at", "generation")
+
+    def __init__(self, transport: GDBMITransport, generation: int):
+        self.transport = transport
+        self.created_at = time.monotonic()
+        # 이 프로세스에 적용한 초기화 명령의 세대
+        self.generation = generation
+
+
+class GDBPool:
+    """GDB 실행 명령별로 미리 시작해 둔 GDB 프로세스 풀.
+
+    GDB 실행 명령(옵션, 타겟 ELF 포함)이 같은 요청에 대기 중인 GDB를 즉시
+    내주고, 사용된 명령의 프로세스는 백그라운드에서 다시 채웁니다.
+    타겟 ELF의 수정 시각과 크기도 키에 포함하므로 ELF가 다시 빌드되면
+    이전 ELF를 읽은 프로세스는 사용하지 않습니다.
+    대기 프로세스 총수가 max_idle을 넘으면 가장 오래 사용되지 않은 명령부터,
+    max_age보다 오래 대기한 프로세스는 나이 순으로 종료합니다.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_idle: int = DEFAULT_POOL_MAX_IDLE,
+                 max_age: float = DEFAULT_POOL_MAX_AGE, init_commands: Optional[List[str]] = None,
+                 startup_timeout: float = 10.0):
+        self.size = size
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.init_commands: List[str] = init_commands or []
+        # 초기화 명령이 바뀔 때마다 증가하며, 이전 세대로 시작된 프로세스는 버립니다
+        self.generation = 0
+        self.startup_timeout = startup_timeout
+        # 최근에 사용된 명령이 뒤에 오도록 유지합니다 (LRU)
+        self._idle: "OrderedDict[PoolKey, List[_IdleGDB]]" = OrderedDict()
+        self._filling: Dict[PoolKey, int] = {}
+        self._tasks: "Set[asyncio.Task[Any]]" = set()
+        self._reaper: Optional["asyncio.Task[None]"] = None
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self) -> bool:
+        """풀이 켜져 있는지 여부."""
+        return self.size > 0
+
+    def configure(self, size: Optional[int] = None, max_idle: Optional[int] = None,
+                  max_age: Optional[float] = None,
+                  init_commands: Optional[List[str]] = None) -> None:
+        """풀 설정을 바꿉니다. 초기화 명령이 바뀌면 대기 중인 프로세스를 모두 버립니다."""
+        if size is not None:
+            self.size = max(size, 0)
+        if max_idle is not None:
+            self.max_idle = max(max_idle, 0)
+        if max_age is not None:
+            self.max_age = max_age
+        if init_commands is not None and init_commands != self.init_commands:
+            self.init_commands = list(init_commands)
+            self.generation += 1
+            self._evict_where(lambda key, entry: True)
+        self._enforce_limits()
+        for key in list(self._idle):
+            self._schedule_refill(key)
+
+    def acquire(self, command: List[str], target: Optional[str] = None) -> Optional[GDBMITransport]:
+        """명령에 맞는 대기 중인 GDB를 꺼냅니다. 없으면 None.
+
+        target에 타겟 ELF 경로를 넘기면 ELF가 바뀐 뒤 시작된 프로세스만 사용하고,
+        이전 ELF로 시작된 대기 프로세스는 종료합니다.
+        풀이 켜져 있으면 꺼낸 자리는 백그라운드에서 다시 채웁니다.
+        """
+        if not self.enabled:
+            return None
+        key = self._key(command, target)
+        self._drop_stale(key)
+        idle = self._idle.get(key, [])
+        transport = None
+        while idle:
+            candidate = idle.pop(0)
+            if candidate.transport.is_alive() and not self._expired(candidate) \
+                    and candidate.generation == self.generation:
+                transport = candidate.transport
+                break
+            self._close(candidate)
+        self._idle[key] = idle
+        self._idle.move_to_end(key)
+        if transport is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self._schedule_refill(key)
+        return transport
+
+    def prewarm(self, command: List[str], target: Optional[str] = None) -> None:
+        """명령에 대한 GDB를 백그라운드에서 미리 시작합니다."""
+        if not self.enabled:
+            return
+        key = self._key(command, target)
+        self._drop_stale(key)
+        self._idle.setdefault(key, [])
+        self._schedule_refill(key)
+
+    async def wait_idle(self) -> None:
+        """진행 중인 채우기 작업이 끝날 때까지 기다립니다."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태를 반환합니다."""
+        now = time.monotonic()
+        return {
+            "size": self.size,
+            "max_idle": self.max_idle,
+            "max_age": self.max_age,
+            "init_commands": list(self.init_commands),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "filling": sum(self._filling.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "entries": [
+                {
+                    "command": list(key[0]),
+                    "idle": len(idle),
+                    "oldest_age": round(max((now - entry.created_at for entry in idle), default=0.0), 3),
+                }
+                for key, idle in self._idle.items()
+            ],
+        }
+
+    async def close(self) -> None:
+        """채우기 작업을 취소하고 대기 중인 모든 GDB를 종료합니다."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        idle = [entry for entries in self._idle.values() for entry in entries]
+        self._idle.clear()
+        await asyncio.gather(*(entry.transport.close(timeout=1.0) for entry in idle),
+                             return_exceptions=True)
+
+    def _schedule_refill(self, key: PoolKey) -> None:
+        """명령의 대기 프로세스가 size개가 되도록 백그라운드에서 채웁니다."""
+        if not self.enabled:
+            return
+        missing = self.size - len(self._idle.get(key, [])) - self._filling.get(key, 0)
+        for _ in range(max(missing, 0)):
+            self._filling[key] = self._filling.get(key, 0) + 1
+            task = detached_task(self._spawn(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._ensure_reaper()
+
+    async def _spawn(self, key: PoolKey) -> None:
+        """GDB 하나를 시작하여 풀에 넣습니다."""
+        transport = GDBMITransport(list(key[0]))
+        generation = self.generation
+        init_commands = list(self.init_commands)
+        try:
+            await transport.start(timeout=self.startup_timeout)
+            if init_commands:
+                responses = await transport.execute_many(init_commands, self.startup_timeout)
+                for command, response in zip(init_commands, responses):
+                    if isinstance(response, Exception) or response.is_error:
+                        error = response.error_message if isinstance(response, MIResponse) else response
+                        logger.warning(f"GDB 풀 초기화 명령 실패 ({command}): {error}")
+        except asyncio.CancelledError:
+            await transport.close(timeout=0)
+            raise
+        except Exception as e:
+            logger.warning(f"GDB 풀 프로세스 시작 실패 ({' '.join(key[0])}): {e}")
+            await transport.close(timeout=0)
+            return
+        finally:
+            self._filling[key] -= 1
+            if not self._filling[key]:
+                del self._filling[key]
+
+        if not self.enabled or key not in self._idle:
+            await transport.close(timeout=1.0)
+            return
+        if generation != self.generation:
+            # 시작하는 동안 configure()로 초기화 명령이 바뀌었습니다
+            await transport.close(timeout=1.0)
+            self._schedule_refill(key)
+            return
+        self._idle[key].append(_IdleGDB(transport, generation))
+        self._enforce_limits()
+
+    @staticmethod
+    def _key(command: List[str], target: Optional[str]) -> PoolKey:
+        return tuple(command), file_signature(target)
+
+    def _drop_stale(self, key: PoolKey) -> None:
+        """같은 명령이지만 타겟 ELF 서명이 다른(이전 빌드의) 대기 프로세스를 종료합니다."""
+        for stale in [other for other in self._idle if other[0] == key[0] and other != key]:
+            for entry in self._idle.pop(stale):
+                self._close(entry)
+
+    def _ensure_reaper(self) -> None:
+        """max_age가 지난 프로세스를 정리하는 작업을 시작합니다."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = detached_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """주기적으로 오래된 프로세스를 정리하고 빈자리를 다시 채웁니다."""
+        while any(self._idle.values()) or self._filling:
+            await asyncio.sleep(min(max(self.max_age / 4, 0.1), _REAP_INTERVAL_MAX))
+            expired = [key for key, idle in self._idle.items() if any(map(self._expired, idle))]
+            self._evict_where(lambda key, entry: self._expired(entry))
+            for key in expired:
+                self._schedule_refill(key)
+
+    def _enforce_limits(self) -> None:
+        """대기 프로세스 총수가 max_idle 이하가 되도록 가장 오래 사용되지 않은 명령부터 제거합니다."""
+        total = sum(len(idle) for idle in self._idle.values())
+        for key in list(self._idle):
+            if total <= self.max_idle:
+                break
+            idle = self._idle[key]
+            while idle and total > self.max_idle:
+                self._close(idle.pop(0))
+                total -= 1
+            if not idle and not self._filling.get(key):
+                del self._idle[key]
+
+    def _evict_where(self, predicate: Callable[[PoolKey, _IdleGDB], bool]) -> None:
+        """조건에 맞는 대기 프로세스를 종료합니다."""
+        for key, idle in self._idle.items():
+            keep = []
+            for entry in idle:
+                if predicate(key, entry):
+                    self._close(entry)
+                else:
+                    keep.append(entry)
+            self._idle[key] = keep
+
+    def _expired(self, entry: _IdleGDB) -> bool:
+        return self.max_age > 0 and time.monotonic() - entry.created_at > self.max_age
+
+    def _close(self, entry: _IdleGDB) -> None:
+        """대기 프로세스를 백그라운드에서 종료합니다."""
+        self.evicted += 1
+        task = detached_task(entry.transport.close(timeout=1.0))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
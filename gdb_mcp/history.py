@@ -0,0 +1,187 @@
+"""GDB 명령 출력 기록 모듈."""
+
+import bisect
+import itertools
+import json
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 메모리에 유지하는 출력 기록의 최대 크기 (바이트)
+DEFAULT_HISTORY_BYTES = int(os.environ.get("GDB_MCP_HISTORY_BYTES", 4 * 1024 * 1024))
+
+# 메모리에서 밀려난 기록을 저장할 디렉토리 (설정하지 않으면 버림)
+DEFAULT_SPILL_DIR = os.environ.get("GDB_MCP_HISTORY_DIR")
+
+# 스필 파일에서 오프셋을 기록하는 간격 (항목 수)
+_SPILL_INDEX_STRIDE = 256
+
+
+class HistoryEntry:
+    """명령 하나의 실행 기록."""
+
+    __slots__ = ("seq", "timestamp", "command", "output", "size")
+
+    def __init__(self, seq: int, timestamp: float, command: str, output: str):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.command = command
+        self.output = output
+        self.size = len(command.encode()) + len(output.encode())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환합니다."""
+        return {
+            "seq": self.seq,
+            "timestamp": self.timestamp,
+            "command": self.command,
+            "output": self.output,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HistoryEntry":
+        """딕셔너리에서 기록을 복원합니다."""
+        return cls(data["seq"], data["timestamp"], data["command"], data["output"])
+
+
+class OutputHistory:
+    """바이트 크기로 제한되는 출력 기록 링 버퍼.
+
+    크기 한도를 넘으면 오래된 기록부터 제거하며, 스필 경로가 설정되어 있으면
+    제거되는 기록을 추가 전용 JSON Lines 파일에 기록해 두고 조회 시 함께 읽습니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_HISTORY_BYTES, spill_path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self._entries: Deque[HistoryEntry] = deque()
+        self._bytes = 0
+        self._next_seq = 1
+        self._spill_file: Optional[TextIO] = None
+        self._spill_index: List[Tuple[int, int]] = []
+        self._spilled = 0
+        self._dropped = 0
+
+    def append(self, command: str, output: str) -> int:
+        """기록을 추가하고 순번을 반환합니다."""
+        entry = HistoryEntry(self._next_seq, time.time(), command, output)
+        self._next_seq += 1
+        self._entries.append(entry)
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict(self._entries.popleft())
+        return entry.seq
+
+    def page(self, after_seq: int = 0, limit: int = 20) -> List[HistoryEntry]:
+        """after_seq 다음부터 최대 limit개의 기록을 순서대로 반환합니다."""
+        entries: List[HistoryEntry] = []
+        for entry in self._iter_from(after_seq + 1):
+            if len(entries) >= limit:
+                break
+            entries.append(entry)
+        return entries
+
+    def tail(self, limit: int = 20) -> List[HistoryEntry]:
+        """가장 최근 기록 최대 limit개를 반환합니다."""
+        return list(self._entries)[-limit:] if limit > 0 else []
+
+    def search(self, pattern: str, after_seq: int = 0, limit: int = 20) -> List[HistoryEntry]:
+        """명령이나 출력이 정규식과 일치하는 기록을 반환합니다."""
+        regex = re.compile(pattern)
+        entries: List[HistoryEntry] = []
+        for entry in self._iter_from(after_seq + 1):
+            if len(entries) >= limit:
+                break
+            if regex.search(entry.command) or regex.search(entry.output):
+                entries.append(entry)
+        return entries
+
+    @property
+    def last_seq(self) -> int:
+        """마지막으로 추가된 기록의 순번."""
+        return self._next_seq - 1
+
+    @property
+    def first_seq(self) -> int:
+        """조회 가능한 가장 오래된 기록의 순번."""
+        if self._spill_index:
+            return self._spill_index[0][0]
+        if self._entries:
+            return self._entries[0].seq
+        return self._next_seq
+
+    def stats(self) -> Dict[str, Any]:
+        """기록 버퍼 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "spilled": self._spilled,
+            "dropped": self._dropped,
+            "spill_path": self.spill_path,
+        }
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """메모리의 기록과 스필 색인을 비우고 스필 파일을 닫습니다.
+
+        스필 파일은 추가 전용이므로 이후의 기록은 기존 내용 뒤에 이어서 쓰고,
+        비우기 전의 기록은 더 이상 조회하지 않습니다.
+        """
+        self._entries.clear()
+        self._bytes = 0
+        self._spill_index.clear()
+        self._spilled = 0
+        self._dropped = 0
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _evict(self, entry: HistoryEntry) -> None:
+        """오래된 기록을 메모리에서 제거하고, 설정된 경우 스필 파일에 씁니다."""
+        self._bytes -= entry.size
+        if self.spill_path is None:
+            self._dropped += 1
+            return
+        if self._spill_file is None:
+            os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+            self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+        if self._spilled % _SPILL_INDEX_STRIDE == 0:
+            self._spill_index.append((entry.seq, self._spill_file.tell()))
+        self._spill_file.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+        self._spilled += 1
+
+    def _iter_from(self, seq: int) -> Iterator[HistoryEntry]:
+        """seq 이상인 기록을 스필 파일과 메모리에서 순서대로 꺼냅니다."""
+        memory_first = self._entries[0].seq if self._entries else self._next_seq
+        if seq < memory_first and self._spill_index:
+            yield from self._iter_spill(seq, memory_first)
+        start = max(seq - memory_first, 0)
+        yield from itertools.islice(self._entries, start, None)
+
+    def _iter_spill(self, seq: int, stop_seq: int) -> Iterator[HistoryEntry]:
+        """스필 파일에서 seq 이상 stop_seq 미만인 기록을 읽습니다."""
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        position = bisect.bisect_right(self._spill_index, (seq, float("inf"))) - 1
+        offset = self._spill_index[max(position, 0)][1]
+        with open(self.spill_path, "r", encoding="utf-8") as spill:
+            spill.seek(offset)
+            for line in spill:
+                entry = HistoryEntry.from_dict(json.loads(line))
+                if entry.seq >= stop_seq:
+                    break
+                if entry.seq >= seq:
+                    yield entry
@@ -0,0 +1,107 @@
+"""GDB 디버그 정보 색인 캐시 관리 모듈."""
+
+import glob
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+import logging
+
+from .elf import DEFAULT_CACHE_DIR, ElfError, read_build_id
+
+logger = logging.getLogger(__name__)
+
+# GDB index-cache 디렉토리 (빈 문자열이면 사용하지 않음)
+DEFAULT_INDEX_CACHE_DIR = os.environ.get(
+    "GDB_MCP_INDEX_CACHE_DIR", os.path.join(DEFAULT_CACHE_DIR, "gdb-index")
+)
+
+# 빌드 ID별 시작 시간 기록 파일 이름
+_STARTUP_STATS_FILE = "startup-times.json"
+
+# `show index-cache` 출력에서 사용 여부를 찾는 패턴
+# (GDB 12 이하: "The index cache is currently enabled.", GDB 13 이상: "The index cache is on.")
+_ENABLED_RE = re.compile(r"index cache is (?:currently )?(on|off|enabled|disabled)\b")
+
+
+class IndexCache:
+    """빌드 ID 기준으로 재사용되는 GDB index-cache 디렉토리.
+
+    GDB는 처음 심볼을 읽을 때 색인을 `<빌드 ID>.gdb-index` 등의 파일로
+    저장하고 이후 같은 빌드 ID의 파일을 열 때 DWARF를 다시 색인하지 않습니다.
+    시작 시간을 cold(캐시 없음)와 warm(캐시 있음)으로 나누어 기록합니다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_INDEX_CACHE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def build_id(target: Optional[str]) -> Optional[str]:
+        """타겟 ELF의 빌드 ID를 반환합니다. 읽을 수 없으면 None."""
+        if not target or not os.path.isfile(target):
+            return None
+        try:
+            return read_build_id(target)
+        except (OSError, ElfError) as e:
+            logger.debug(f"빌드 ID를 읽지 못했습니다 ({target}): {e}")
+            return None
+
+    def gdb_args(self) -> List[str]:
+        """GDB가 심볼을 읽기 전에 index-cache를 켜는 인자를 반환합니다.
+
+        GDB 12 이하는 `set index-cache on`만, GDB 13 이상은 `set index-cache enabled on`을
+        인식하므로(이전 형식은 경고와 함께 동작) 두 형식을 모두 보냅니다.
+        인식하지 못한 -iex 명령은 오류만 출력하고 시작을 막지 않습니다.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        return [
+            "-iex", f"set index-cache directory {self.directory}",
+            "-iex", "set index-cache on",
+            "-iex", "set index-cache enabled on",
+        ]
+
+    @staticmethod
+    def parse_enabled(output: str) -> Optional[bool]:
+        """`show index-cache` 출력에서 index-cache 사용 여부를 읽습니다. 알 수 없으면 None."""
+        match = _ENABLED_RE.search(output)
+        if match is None:
+            return None
+        return match.group(1) in ("on", "enabled")
+
+    def is_warm(self, build_id: str) -> bool:
+        """빌드 ID의 색인 파일이 이미 캐시에 있는지 확인합니다."""
+        return bool(glob.glob(os.path.join(self.directory, glob.escape(build_id) + ".*")))
+
+    def record_startup(self, build_id: str, warm: bool, seconds: float) -> Dict[str, Any]:
+        """시작 시간을 기록하고 해당 빌드 ID의 cold/warm 시간을 반환합니다."""
+        stats = self._load_stats()
+        entry = stats.setdefault(build_id, {})
+        entry["warm_ms" if warm else "cold_ms"] = round(seconds * 1000, 3)
+        entry["updated_at"] = time.time()
+        try:
+            self._save_stats(stats)
+        except OSError as e:
+            logger.warning(f"시작 시간 기록을 저장하지 못했습니다: {e}")
+        return entry
+
+    def _stats_path(self) -> str:
+        return os.path.join(self.directory, _STARTUP_STATS_FILE)
+
+    def _load_stats(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._stats_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_stats(self, stats: Dict[str, Dict[str, Any]]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, self._stats_path())
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
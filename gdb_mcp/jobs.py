@@ -0,0 +1,132 @@
+"""백그라운드 실행 작업 관리 모듈."""
+
+import asyncio
+import itertools
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 작업마다 메모리에 유지하는 실행 중 출력의 최대 크기 (바이트)
+DEFAULT_JOB_OUTPUT_BYTES = int(os.environ.get("GDB_MCP_JOB_OUTPUT_BYTES", 1024 * 1024))
+
+# 세션당 보관하는 완료된 작업 수
+_MAX_FINISHED_JOBS = 64
+
+
+class JobNotFoundError(Exception):
+    """존재하지 않는 작업을 참조했을 때 발생합니다."""
+
+
+class JobBusyError(Exception):
+    """같은 GDB에서 다른 실행 작업이 아직 실행 중일 때 발생합니다."""
+
+
+class ExecutionJob:
+    """백그라운드에서 실행 중인 GDB 실행 명령.
+
+    실행 중 출력은 max_output_bytes를 넘으면 오래된 조각부터 버립니다.
+    cursor는 버린 조각을 포함한 조각 순번이므로 버려진 뒤에도 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(self, job_id: str, command: str, max_output_bytes: int = DEFAULT_JOB_OUTPUT_BYTES):
+        self.job_id = job_id
+        self.command = command
+        self.max_output_bytes = max_output_bytes
+        self.output: Deque[str] = deque()
+        # 버린 출력 조각 수 (output[0]의 cursor)
+        self.first_cursor = 0
+        self.output_bytes = 0
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.success: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.stop_record: Optional[Dict[str, Any]] = None
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def state(self) -> str:
+        """작업 상태 (running, done, failed)."""
+        if self.finished_at is None:
+            return "running"
+        return "done" if self.success else "failed"
+
+    def append_output(self, text: str) -> None:
+        """실행 중 도착한 출력을 기록합니다."""
+        self.output.append(text)
+        self.output_bytes += len(text.encode())
+        while self.output_bytes > self.max_output_bytes and len(self.output) > 1:
+            self.output_bytes -= len(self.output.popleft().encode())
+            self.first_cursor += 1
+
+    def output_since(self, cursor: int) -> Tuple[str, int]:
+        """cursor 이후의 출력과 다음 cursor를 반환합니다. 이미 버린 출력은 건너뜁니다."""
+        start = max(cursor - self.first_cursor, 0)
+        text = "".join(itertools.islice(self.output, start, None))
+        return text, self.first_cursor + len(self.output)
+
+    async def run(self, execution: Awaitable[Tuple[bool, str, Optional[str], Optional[Dict[str, Any]]]]) -> None:
+        """실행 코루틴을 기다리고 결과를 기록합니다."""
+        try:
+            self.success, _, self.error, self.stop_record = await execution
+        except Exception as e:
+            self.success, self.error = False, str(e)
+        finally:
+            self.finished_at = time.time()
+
+    async def wait(self, timeout: float) -> bool:
+        """작업이 끝날 때까지 최대 timeout초 기다립니다. 끝났으면 True를 반환합니다."""
+        if self.task is not None and not self.task.done() and timeout > 0:
+            await asyncio.wait([self.task], timeout=timeout)
+        return self.finished_at is not None
+
+
+class JobRegistry:
+    """세션의 백그라운드 실행 작업 목록."""
+
+    def __init__(self):
+        self._jobs: "OrderedDict[str, ExecutionJob]" = OrderedDict()
+
+    def create(self, command: str) -> ExecutionJob:
+        """새 작업을 생성합니다. 실행 중인 작업이 있으면 JobBusyError."""
+        running = self.running()
+        if running is not None:
+            raise JobBusyError(f"작업 {running.job_id} ({running.command})이(가) 아직 실행 중입니다")
+        job = ExecutionJob(uuid.uuid4().hex[:8], command)
+        self._jobs[job.job_id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> ExecutionJob:
+        """작업을 조회합니다."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"알 수 없는 작업: {job_id}")
+        return job
+
+    def running(self) -> Optional[ExecutionJob]:
+        """실행 중인 작업을 반환합니다. 없으면 None."""
+        for job in self._jobs.values():
+            if job.finished_at is None:
+                return job
+        return None
+
+    def list(self) -> List[ExecutionJob]:
+        """작업 목록을 반환합니다."""
+        return list(self._jobs.values())
+
+    def cancel_all(self) -> None:
+        """실행 중인 모든 작업을 취소합니다."""
+        for job in self._jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+
+    def _prune(self) -> None:
+        """오래된 완료 작업을 제거합니다."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(len(finished) - _MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
@@ -0,0 +1,262 @@
+"""타겟 메모리 읽기 모듈."""
+
+import binascii
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .mi_transport import GDBMITransport, MIResponse, quote_mi_string
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 -data-read-memory-bytes 명령으로 읽는 기본 크기 (바이트)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# 한 번에 메모리를 읽을 수 있는 최대 크기 (바이트)
+MAX_READ_SIZE = 64 * 1024 * 1024
+
+# 세션당 보관하는 메모리 스냅샷의 최대 총 크기 (바이트)
+DEFAULT_SNAPSHOT_BYTES = int(os.environ.get("GDB_MCP_SNAPSHOT_BYTES", 256 * 1024 * 1024))
+
+# 비교 시 한 번에 비교하는 블록 크기와, 바이트 단위로 비교를 시작하는 크기 (바이트)
+_DIFF_BLOCK_SIZE = 4096
+_DIFF_SCAN_SIZE = 64
+
+# -data-evaluate-expression 결과에서 주소를 추출하는 패턴 (예: "0x20000000 <buffer>")
+_ADDRESS_VALUE_RE = re.compile(r"(0x[0-9a-fA-F]+)")
+
+
+class MemoryReadError(Exception):
+    """메모리를 읽을 수 없을 때 발생합니다."""
+
+
+class SnapshotNotFoundError(Exception):
+    """존재하지 않는 메모리 스냅샷을 참조했을 때 발생합니다."""
+
+
+class MemorySnapshot:
+    """이름이 붙은 메모리 영역의 복사본."""
+
+    __slots__ = ("name", "address", "data", "unreadable", "created_at")
+
+    def __init__(self, name: str, address: int, data: bytes,
+                 unreadable: Optional[List[Tuple[int, int]]] = None):
+        self.name = name
+        self.address = address
+        self.data = data
+        self.unreadable = unreadable or []
+        self.created_at = time.time()
+
+    @property
+    def end(self) -> int:
+        """영역의 끝 주소 (포함하지 않음)."""
+        return self.address + len(self.data)
+
+    def describe(self) -> Dict[str, object]:
+        """스냅샷 요약 정보를 반환합니다."""
+        return {
+            "name": self.name,
+            "address": self.address,
+            "length": len(self.data),
+            "unreadable": [list(gap) for gap in self.unreadable],
+            "created_at": self.created_at,
+        }
+
+
+class SnapshotStore:
+    """세션의 메모리 스냅샷 목록.
+
+    총 크기가 한도를 넘으면 가장 오래된 스냅샷부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SNAPSHOT_BYTES):
+        self.max_bytes = max_bytes
+        self._snapshots: "OrderedDict[str, MemorySnapshot]" = OrderedDict()
+        self._bytes = 0
+
+    def add(self, snapshot: MemorySnapshot) -> None:
+        """스냅샷을 저장합니다. 같은 이름이 있으면 교체합니다."""
+        if len(snapshot.data) > self.max_bytes:
+            raise MemoryReadError(f"스냅샷이 저장 한도({self.max_bytes} 바이트)보다 큽니다")
+        self.remove(snapshot.name)
+        self._snapshots[snapshot.name] = snapshot
+        self._bytes += len(snapshot.data)
+        while self._bytes > self.max_bytes:
+            _, oldest = self._snapshots.popitem(last=False)
+            self._bytes -= len(oldest.data)
+            logger.info(f"메모리 스냅샷 제거 (한도 초과): {oldest.name}")
+
+    def get(self, name: str) -> MemorySnapshot:
+        """스냅샷을 조회합니다."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            raise SnapshotNotFoundError(f"알 수 없는 스냅샷: {name}")
+        return snapshot
+
+    def remove(self, name: str) -> bool:
+        """스냅샷을 삭제합니다. 삭제했으면 True를 반환합니다."""
+        snapshot = self._snapshots.pop(name, None)
+        if snapshot is None:
+            return False
+        self._bytes -= len(snapshot.data)
+        return True
+
+    def list(self) -> List[MemorySnapshot]:
+        """스냅샷 목록을 반환합니다."""
+        return list(self._snapshots.values())
+
+    def clear(self) -> None:
+        """모든 스냅샷을 삭제합니다."""
+        self._snapshots.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+async def resolve_address(transport: GDBMITransport, address: str, timeout: float) -> int:
+    """숫자나 GDB 표현식(예: &buffer)으로 주어진 주소를 정수로 변환합니다."""
+    try:
+        return int(address, 0)
+    except ValueError:
+        pass
+    response = await transport.execute(f"-data-evaluate-expression {quote_mi_string(address)}", timeout)
+    if response.is_error:
+        raise MemoryReadError(f"주소를 계산할 수 없습니다: {response.error_message}")
+    value = (response.payload or {}).get("value", "")
+    match = _ADDRESS_VALUE_RE.search(value)
+    if match:
+        return int(match.group(1), 16)
+    try:
+        return int(value, 0)
+    except ValueError:
+        raise MemoryReadError(f"주소 값이 아닙니다: {address} = {value}")
+
+
+async def read_memory(transport: GDBMITransport, address: int, length: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      timeout: float = 30.0) -> Tuple[bytearray, List[Tuple[int, int]]]:
+    """타겟 메모리를 청크 단위로 파이프라이닝하여 읽습니다.
+
+    미리 할당한 버퍼에 각 청크의 내용을 바로 채워 넣으며,
+    읽지 못한 구간은 0으로 남기고 (시작 주소, 길이) 목록으로 반환합니다.
+    """
+    if length <= 0:
+        return bytearray(), []
+    if length > MAX_READ_SIZE:
+        raise MemoryReadError(f"한 번에 읽을 수 있는 최대 크기({MAX_READ_SIZE} 바이트)를 넘었습니다")
+
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    chunks = [(offset, min(chunk_size, length - offset)) for offset in range(0, length, chunk_size)]
+    commands = [f"-data-read-memory-bytes {address + offset:#x} {size}" for offset, size in chunks]
+    responses = await transport.execute_many(commands, timeout)
+
+    unreadable: List[Tuple[int, int]] = []
+    for (offset, size), response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            raise MemoryReadError(f"메모리 읽기 실패 ({address + offset:#x}): {response or '타임아웃'}")
+        filled = _fill_chunk(view, address, offset, size, response)
+        unreadable.extend(_gaps(address + offset, size, filled))
+    return buffer, _coalesce(unreadable)
+
+
+def _fill_chunk(view: memoryview, address: int, offset: int, size: int,
+                response: MIResponse) -> List[Tuple[int, int]]:
+    """MI 응답의 메모리 블록을 버퍼에 채우고 채운 구간 목록을 반환합니다."""
+    if response.is_error:
+        logger.debug(f"메모리 읽기 오류 ({address + offset:#x}): {response.error_message}")
+        return []
+    filled = []
+    for block in (response.payload or {}).get("memory", []):
+        # begin은 이미 블록의 절대 시작 주소이고, offset은 요청 주소로부터의 거리입니다
+        begin = int(block["begin"], 16)
+        data = binascii.unhexlify(block["contents"])
+        start = begin - address
+        view[start:start + len(data)] = data
+        filled.append((begin, len(data)))
+    return filled
+
+
+def _gaps(start: int, size: int, filled: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """[start, start + size) 구간 중 채워지지 않은 구간을 반환합니다."""
+    gaps = []
+    cursor = start
+    for begin, length in sorted(filled):
+        if begin > cursor:
+            gaps.append((cursor, begin - cursor))
+        cursor = max(cursor, begin + length)
+    if cursor < start + size:
+        gaps.append((cursor, start + size - cursor))
+    return gaps
+
+
+def _coalesce(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """인접한 구간을 하나로 합칩니다."""
+    return _merge_runs(ranges, 0)
+
+
+def diff_memory(old: bytes, new: bytes, address: int = 0,
+                merge_gap: int = 0) -> List[Tuple[int, int]]:
+    """두 메모리 내용을 비교하여 바뀐 구간을 (주소, 길이) 목록으로 반환합니다.
+
+    블록 단위 슬라이스 비교(memcmp)로 같은 블록을 건너뛰고, 다른 블록만
+    이분하여 좁힌 뒤 바이트 단위로 비교합니다. 간격이 merge_gap 이하인
+    구간은 하나로 합칩니다.
+    """
+    length = min(len(old), len(new))
+    changed: List[Tuple[int, int]] = []
+    for start in range(0, length, _DIFF_BLOCK_SIZE):
+        end = min(start + _DIFF_BLOCK_SIZE, length)
+        if old[start:end] != new[start:end]:
+            _diff_range(old, new, start, end, changed)
+    return [(address + begin, size) for begin, size in _merge_runs(changed, merge_gap)]
+
+
+def _diff_range(old: bytes, new: bytes, start: int, end: int,
+                changed: List[Tuple[int, int]]) -> None:
+    """다른 것으로 확인된 [start, end) 구간에서 바뀐 바이트 구간을 찾습니다."""
+    if end - start > _DIFF_SCAN_SIZE:
+        middle = (start + end) // 2
+        if old[start:middle] != new[start:middle]:
+            _diff_range(old, new, start, middle, changed)
+        if old[middle:end] != new[middle:end]:
+            _diff_range(old, new, middle, end, changed)
+        return
+    for offset in range(start, end):
+        if old[offset] != new[offset]:
+            if changed and changed[-1][0] + changed[-1][1] == offset:
+                changed[-1] = (changed[-1][0], changed[-1][1] + 1)
+            else:
+                changed.append((offset, 1))
+
+
+def _merge_runs(runs: Iterable[Tuple[int, int]], merge_gap: int) -> List[Tuple[int, int]]:
+    """간격이 merge_gap 이하인 구간을 하나로 합칩니다."""
+    merged: List[Tuple[int, int]] = []
+    for begin, length in runs:
+        if merged and begin - (merged[-1][0] + merged[-1][1]) <= merge_gap:
+            merged[-1] = (merged[-1][0], begin + length - merged[-1][0])
+        else:
+            merged.append((begin, length))
+    return merged
+
+
+async def lookup_symbols(transport: GDBMITransport, addresses: Iterable[int],
+                         timeout: float = 30.0) -> Dict[int, Optional[str]]:
+    """GDB `info symbol`로 주소를 포함하는 심볼을 조회합니다 (파이프라이닝)."""
+    addresses = list(dict.fromkeys(addresses))
+    commands = [f"-interpreter-exec console \"info symbol {address:#x}\"" for address in addresses]
+    responses = await transport.execute_many(commands, timeout)
+    symbols: Dict[int, Optional[str]] = {}
+    for address, response in zip(addresses, responses):
+        symbols[address] = None
+        if isinstance(response, Exception) or response.is_error:
+            continue
+        text = "".join(record["payload"] for record in response.stream_output("console")).strip()
+        if text and not text.startswith("No symbol"):
+            symbols[address] = text.split(" in section ")[0]
+    return symbols
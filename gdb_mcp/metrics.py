@@ -0,0 +1,306 @@
+"""서버 지표(지연 시간 히스토그램, 동시 실행 수, GDB 왕복 시간) 수집 모듈."""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+from .tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Prometheus 텍스트 형식으로 지표를 내보낼 파일 (node exporter textfile collector용)
+METRICS_FILE = os.environ.get("GDB_MCP_METRICS_FILE")
+
+# 지표 파일을 다시 쓰는 최소 간격 (초)
+METRICS_INTERVAL = float(os.environ.get("GDB_MCP_METRICS_INTERVAL", 10))
+
+# 세션별 히스토그램을 유지하는 최대 세션 수 (오래 쓰이지 않은 세션부터 버림)
+_MAX_SESSIONS = 256
+
+_PREFIX = "gdb_mcp"
+
+
+class Histogram:
+    """고정 버킷 지연 시간 히스토그램.
+
+    관측 하나에 이진 탐색 한 번과 덧셈 몇 번만 하므로 요청 경로에서
+    부담 없이 사용할 수 있습니다. 분위수는 버킷 안에서 선형 보간한 근삿값입니다.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        # 마지막 칸은 가장 큰 상한을 넘는 관측 (+Inf)
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """관측값(초)을 기록합니다."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수(초)의 근삿값을 반환합니다. 관측이 없으면 None을 반환합니다."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * max(rank - seen, 0) / count
+            seen += count
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """관측 수와 평균, 분위수, 최댓값(밀리초)을 반환합니다."""
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 4)
+
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.sum / self.count) if self.count else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p90_ms": ms(self.quantile(0.9)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "max_ms": ms(self.max) if self.count else None,
+        }
+
+
+class ServerMetrics:
+    """서버 전체의 지표를 모읍니다.
+
+    - MCP 요청 처리 시간(스키마 검증 포함)과 도구별/세션별 핸들러 시간
+    - 도구별 동시 실행 수와 에러 수
+    - 스레드 풀 실행기의 대기/실행 작업 수와 대기 시간
+    - GDB/MI 명령 왕복 시간과 주고받은 바이트 수
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.requests = Histogram()
+        self.tools: Dict[str, Histogram] = {}
+        self.tool_errors: Dict[str, int] = {}
+        self.in_flight: Dict[str, int] = {}
+        self.sessions: "OrderedDict[str, Histogram]" = OrderedDict()
+        self.gdb_roundtrip = Histogram()
+        self.gdb_commands = 0
+        self.gdb_bytes_in = 0
+        self.gdb_bytes_out = 0
+        self.executor_wait = Histogram()
+        self.executor_queued = 0
+        self.executor_running = 0
+        # 실행기 카운터는 작업 스레드에서도 갱신합니다
+        self._executor_lock = threading.Lock()
+        self._last_export = 0.0
+
+    def reset(self) -> None:
+        """누적 지표를 초기화합니다. 현재 실행 중인 작업 수는 유지합니다."""
+        self.started_at = time.time()
+        self.requests = Histogram()
+        self.tools.clear()
+        self.tool_errors.clear()
+        self.sessions.clear()
+        self.gdb_roundtrip = Histogram()
+        self.gdb_commands = 0
+        self.gdb_bytes_in = 0
+        self.gdb_bytes_out = 0
+        with self._executor_lock:
+            self.executor_wait = Histogram()
+
+    def tool_started(self, tool: str) -> None:
+        """도구 호출 시작을 기록합니다."""
+        self.in_flight[tool] = self.in_flight.get(tool, 0) + 1
+
+    def tool_finished(self, tool: str, session_id: str, elapsed: float, error: bool = False) -> None:
+        """도구 호출 종료와 걸린 시간(초)을 기록합니다."""
+        self.in_flight[tool] = self.in_flight.get(tool, 1) - 1
+        histogram = self.tools.get(tool)
+        if histogram is None:
+            histogram = self.tools[tool] = Histogram()
+        histogram.observe(elapsed)
+        if error:
+            self.tool_errors[tool] = self.tool_errors.get(tool, 0) + 1
+
+        histogram = self.sessions.get(session_id)
+        if histogram is None:
+            histogram = self.sessions[session_id] = Histogram()
+            if len(self.sessions) > _MAX_SESSIONS:
+                self.sessions.popitem(last=False)
+        else:
+            self.sessions.move_to_end(session_id)
+        histogram.observe(elapsed)
+
+    def observe_gdb_command(self, elapsed: float) -> None:
+        """GDB/MI 명령 하나의 왕복 시간(초)을 기록합니다."""
+        self.gdb_commands += 1
+        self.gdb_roundtrip.observe(elapsed)
+
+    def run_in_executor(self, func: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        """기본 스레드 풀 실행기에서 함수를 실행하고 대기/실행 수를 기록합니다.
+
+        호출한 쪽의 컨텍스트에서 실행하므로 요청 추적이 작업 스레드까지 이어집니다.
+        """
+        submitted = time.perf_counter()
+        with self._executor_lock:
+            self.executor_queued += 1
+
+        def run() -> Any:
+            started = time.perf_counter()
+            with self._executor_lock:
+                self.executor_queued -= 1
+                self.executor_running += 1
+                self.executor_wait.observe(started - submitted)
+            TRACER.record("executor.queue", "executor", submitted, started)
+            try:
+                with TRACER.span("executor.run", "executor", func=getattr(func, "__qualname__", None)):
+                    return func(*args)
+            finally:
+                with self._executor_lock:
+                    self.executor_running -= 1
+
+        return asyncio.get_event_loop().run_in_executor(None, contextvars.copy_context().run, run)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표를 사전으로 반환합니다."""
+        return {
+            "uptime_s": round(time.time() - self.started_at, 3),
+            "requests": self.requests.summary(),
+            "in_flight": sum(self.in_flight.values()),
+            "tools": {
+                tool: {
+                    **histogram.summary(),
+                    "errors": self.tool_errors.get(tool, 0),
+                    "in_flight": self.in_flight.get(tool, 0),
+                }
+                for tool, histogram in sorted(self.tools.items())
+            },
+            "sessions": {session_id: histogram.summary() for session_id, histogram in self.sessions.items()},
+            "executor": {
+                "queued": self.executor_queued,
+                "running": self.executor_running,
+                "wait": self.executor_wait.summary(),
+            },
+            "gdb": {
+                "commands": self.gdb_commands,
+                "bytes_in": self.gdb_bytes_in,
+                "bytes_out": self.gdb_bytes_out,
+                "roundtrip": self.gdb_roundtrip.summary(),
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 지표를 반환합니다."""
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> str:
+            full = f"{_PREFIX}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def histogram(name: str, help_text: str, series: List[Tuple[str, Histogram]]) -> None:
+            full = metric(name, "histogram", help_text)
+            for labels, values in series:
+                separator = "," if labels else ""
+                cumulative = 0
+                for bound, count in zip(values.bounds, values.counts):
+                    cumulative += count
+                    lines.append(f'{full}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}')
+                lines.append(f'{full}_bucket{{{labels}{separator}le="+Inf"}} {values.count}')
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{full}_sum{suffix} {values.sum:.9f}")
+                lines.append(f"{full}_count{suffix} {values.count}")
+
+        name = metric("start_time_seconds", "gauge", "서버 시작 시각 (유닉스 시간)")
+        lines.append(f"{name} {self.started_at:.3f}")
+        histogram("request_duration_seconds", "MCP 도구 요청 처리 시간 (스키마 검증 포함)",
+                  [("", self.requests)])
+        histogram("tool_duration_seconds", "도구 핸들러 처리 시간",
+                  [(f'tool="{_escape(tool)}"', values) for tool, values in sorted(self.tools.items())])
+        histogram("session_duration_seconds", "세션별 도구 처리 시간",
+                  [(f'session="{_escape(session_id)}"', values) for session_id, values in self.sessions.items()])
+        name = metric("tool_errors_total", "counter", "isError로 끝난 도구 호출 수 (핸들러 예외, 명령 실패 포함)")
+        for tool, count in sorted(self.tool_errors.items()):
+            lines.append(f'{name}{{tool="{_escape(tool)}"}} {count}')
+        name = metric("tool_in_flight", "gauge", "실행 중인 도구 호출 수")
+        for tool, count in sorted(self.in_flight.items()):
+            lines.append(f'{name}{{tool="{_escape(tool)}"}} {count}')
+        name = metric("executor_queued", "gauge", "스레드 풀 실행기에서 대기 중인 작업 수")
+        lines.append(f"{name} {self.executor_queued}")
+        name = metric("executor_running", "gauge", "스레드 풀 실행기에서 실행 중인 작업 수")
+        lines.append(f"{name} {self.executor_running}")
+        histogram("executor_wait_seconds", "스레드 풀 실행기 대기 시간", [("", self.executor_wait)])
+        histogram("gdb_roundtrip_seconds", "GDB/MI 명령 왕복 시간", [("", self.gdb_roundtrip)])
+        name = metric("gdb_commands_total", "counter", "GDB/MI 명령 수")
+        lines.append(f"{name} {self.gdb_commands}")
+        name = metric("gdb_bytes_total", "counter", "GDB와 주고받은 바이트 수")
+        lines.append(f'{name}{{direction="in"}} {self.gdb_bytes_in}')
+        lines.append(f'{name}{{direction="out"}} {self.gdb_bytes_out}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Optional[str] = None) -> None:
+        """지표를 Prometheus 텍스트 파일로 씁니다.
+
+        수집기가 쓰다 만 파일을 읽지 않도록 같은 디렉토리의 임시 파일에 쓴 뒤 교체합니다.
+        """
+        path = path or METRICS_FILE
+        if not path:
+            return
+        self._last_export = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=".gdb-mcp-metrics-", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"지표 파일 쓰기 실패 ({path}): {e}")
+
+    def maybe_export(self) -> None:
+        """지표 파일이 설정되어 있고 마지막으로 쓴 지 METRICS_INTERVAL이 지났으면 다시 씁니다."""
+        if METRICS_FILE and time.monotonic() - self._last_export >= METRICS_INTERVAL:
+            self.export()
+
+
+def _escape(value: str) -> str:
+    """Prometheus 레이블 값을 이스케이프합니다."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# 프로세스 전체에서 공유하는 지표
+METRICS = ServerMetrics()
+
+
+def instrument_request_handler(handler: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """MCP 요청 핸들러를 감싸 요청 처리 시간을 기록합니다."""
+    @functools.wraps(handler)
+    async def wrapper(request: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            METRICS.requests.observe(time.perf_counter() - started)
+    return wrapper
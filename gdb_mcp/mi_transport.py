@@ -0,0 +1,285 @@
+"""asyncio 기반 GDB/MI 전송 모듈."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from pygdbmi.gdbmiparser import parse_response, response_is_finished
+
+from .metrics import METRICS
+from .tracing import detached_task, span
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 읽어 들이는 최대 바이트 수
+_READ_CHUNK_SIZE = 64 * 1024
+
+RecordListener = Callable[[Dict[str, Any]], None]
+
+
+def quote_mi_string(text: str) -> str:
+    """문자열을 MI 명령 인자로 쓸 수 있도록 큰따옴표로 감쌉니다 (\\, ", 줄바꿈 이스케이프)."""
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+class GDBTransportClosed(Exception):
+    """GDB 프로세스가 종료되어 명령을 처리할 수 없을 때 발생합니다."""
+
+
+class MIResponse:
+    """하나의 MI 명령에 대한 응답 (결과 레코드와 그 사이의 레코드들)."""
+
+    def __init__(self, command: str, records: List[Dict[str, Any]], result: Dict[str, Any]):
+        self.command = command
+        self.records = records
+        self.result = result
+
+    @property
+    def message(self) -> str:
+        """결과 클래스 (done, running, connected, error, exit)."""
+        return self.result["message"]
+
+    @property
+    def payload(self) -> Optional[Dict[str, Any]]:
+        """결과 레코드의 페이로드."""
+        return self.result.get("payload")
+
+    @property
+    def is_error(self) -> bool:
+        """결과가 ^error인지 여부."""
+        return self.message == "error"
+
+    @property
+    def error_message(self) -> Optional[str]:
+        """^error 결과의 메시지."""
+        if not self.is_error:
+            return None
+        payload = self.payload or {}
+        return payload.get("msg", "알 수 없는 GDB 오류")
+
+    def stream_output(self, *types: str) -> List[Dict[str, Any]]:
+        """지정한 타입의 스트림 레코드를 반환합니다."""
+        return [record for record in self.records if record["type"] in types]
+
+
+class _PendingCommand:
+    """결과 레코드를 기다리는 명령."""
+
+    def __init__(self, token: int, command: str, future: "asyncio.Future[MIResponse]"):
+        self.token = token
+        self.command = command
+        self.future = future
+        self.records: List[Dict[str, Any]] = []
+        self.sent_at = time.perf_counter()
+
+
+class GDBMITransport:
+    """asyncio 서브프로세스 위에서 동작하는 GDB/MI 전송 계층.
+
+    GDB 출력은 청크 단위로 읽어 줄 단위로 파싱하고, 결과 레코드가 도착하면
+    해당 명령의 future를 완료합니다. 모든 명령에는 숫자 토큰을 붙이고
+    결과 레코드는 토큰으로 대응시키므로 여러 명령을 동시에 보낼 수 있습니다.
+    토큰이 없는 스트림 레코드는 GDB가 명령을 순서대로 처리하므로
+    가장 오래된 대기 명령에 귀속됩니다.
+    """
+
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._pending: "OrderedDict[int, _PendingCommand]" = OrderedDict()
+        self._next_token = 1
+        self._listeners: List[RecordListener] = []
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        """GDB 프로세스 ID."""
+        return self.process.pid if self.process else None
+
+    async def start(self, timeout: float = 10.0) -> None:
+        """GDB를 실행하고 첫 MI 프롬프트가 나타날 때까지 기다립니다."""
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        self._reader_task = detached_task(self._read_loop())
+        ready = asyncio.ensure_future(self._ready.wait())
+        done, _ = await asyncio.wait(
+            [ready, self._reader_task], timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if ready not in done:
+            ready.cancel()
+            await self.close(timeout=0)
+            if self._reader_task in done:
+                raise GDBTransportClosed("GDB 프로세스가 즉시 종료되었습니다")
+            raise asyncio.TimeoutError("GDB 준비 타임아웃")
+
+    def add_listener(self, listener: RecordListener) -> None:
+        """GDB가 출력하는 모든 MI 레코드를 받을 콜백을 등록합니다."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: RecordListener) -> None:
+        """등록된 콜백을 제거합니다."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def is_alive(self) -> bool:
+        """GDB 프로세스가 살아 있는지 확인합니다."""
+        return (
+            not self._closed
+            and self.process is not None
+            and self.process.returncode is None
+        )
+
+    async def execute(self, command: str, timeout: Optional[float] = None) -> MIResponse:
+        """명령을 보내고 결과 레코드를 기다립니다."""
+        future = await self.send(command)
+        # 타임아웃 시 future만 취소하고 대기 항목은 유지하여,
+        # 늦게 도착한 결과와 출력이 다른 명령에 섞이지 않도록 합니다
+        with span("mi.wait", "io", command=command):
+            return await asyncio.wait_for(future, timeout=timeout)
+
+    async def execute_many(self, commands: List[str],
+                           timeout: Optional[float] = None) -> List[Any]:
+        """여러 명령을 한 번에 보내고(파이프라이닝) 모든 결과를 기다립니다.
+
+        반환 목록의 각 항목은 MIResponse 또는 해당 명령에서 발생한 예외입니다.
+        """
+        futures = await self.send_many(commands)
+        if not futures:
+            return []
+        with span("mi.wait", "io", commands=len(commands)):
+            _, not_done = await asyncio.wait(futures, timeout=timeout)
+        results: List[Any] = []
+        for future in futures:
+            if future in not_done:
+                future.cancel()
+                results.append(asyncio.TimeoutError())
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+        return results
+
+    async def send(self, command: str) -> "asyncio.Future[MIResponse]":
+        """명령을 보내고 결과를 받을 future를 반환합니다."""
+        return (await self.send_many([command]))[0]
+
+    async def send_many(self, commands: List[str]) -> List["asyncio.Future[MIResponse]"]:
+        """토큰을 붙인 명령들을 한 번의 쓰기로 보내고 future 목록을 반환합니다."""
+        if not self.is_alive():
+            raise GDBTransportClosed("GDB가 실행 중이 아닙니다")
+        loop = asyncio.get_event_loop()
+        futures: List["asyncio.Future[MIResponse]"] = []
+        with span("mi.write", "io", commands=len(commands)):
+            async with self._write_lock:
+                lines = []
+                for command in commands:
+                    token = self._next_token
+                    self._next_token += 1
+                    future: "asyncio.Future[MIResponse]" = loop.create_future()
+                    self._pending[token] = _PendingCommand(token, command, future)
+                    futures.append(future)
+                    lines.append(f"{token}{command}\n")
+                data = "".join(lines).encode()
+                METRICS.gdb_bytes_out += len(data)
+                self.process.stdin.write(data)
+                await self.process.stdin.drain()
+        return futures
+
+    @property
+    def in_flight(self) -> int:
+        """결과를 기다리는 명령 수."""
+        return len(self._pending)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """GDB를 종료합니다."""
+        if self.process is None:
+            return
+        if self.process.returncode is None:
+            try:
+                if not self._closed:
+                    self.process.stdin.write(b"-gdb-exit\n")
+                    await self.process.stdin.drain()
+                await asyncio.wait_for(self.process.wait(), timeout=timeout)
+            except (asyncio.TimeoutError, ConnectionError, BrokenPipeError):
+                self.process.kill()
+                await self.process.wait()
+        self._closed = True
+        if self._reader_task:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        self._fail_pending(GDBTransportClosed("GDB 프로세스가 종료되었습니다"))
+
+    async def _read_loop(self) -> None:
+        """GDB 출력을 읽어 레코드 단위로 처리합니다."""
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = await self.process.stdout.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                METRICS.gdb_bytes_in += len(chunk)
+                # 줄바꿈은 새 청크에서만 찾으므로 긴 한 줄 레코드도 누적 크기에 비례해 처리됩니다
+                newline = chunk.rfind(b"\n")
+                if newline < 0:
+                    buffer += chunk
+                    continue
+                buffer += chunk[:newline]
+                lines = buffer.split(b"\n")
+                buffer = bytearray(chunk[newline + 1:])
+                for line in lines:
+                    self._handle_line(line.decode(errors="replace").rstrip("\r"))
+        except Exception as e:
+            logger.error(f"GDB 출력 읽기 실패: {e}")
+        finally:
+            self._closed = True
+            self._fail_pending(GDBTransportClosed("GDB 프로세스가 종료되었습니다"))
+
+    def _handle_line(self, line: str) -> None:
+        """한 줄의 MI 출력을 처리합니다."""
+        if not line:
+            return
+        if response_is_finished(line):
+            self._ready.set()
+            return
+        record = parse_response(line)
+        self._notify(record)
+        if record["type"] == "result":
+            self._resolve(record)
+        elif self._pending:
+            next(iter(self._pending.values())).records.append(record)
+
+    def _resolve(self, result: Dict[str, Any]) -> None:
+        """결과 레코드를 토큰으로 대기 명령에 대응시킵니다."""
+        pending = self._pending.pop(result.get("token"), None)
+        if pending is None:
+            if result["message"] != "exit":
+                logger.warning(f"대응하는 명령이 없는 결과 레코드: {result}")
+            return
+        METRICS.observe_gdb_command(time.perf_counter() - pending.sent_at)
+        if not pending.future.done():
+            pending.future.set_result(MIResponse(pending.command, pending.records, result))
+
+    def _notify(self, record: Dict[str, Any]) -> None:
+        """리스너에게 레코드를 전달합니다."""
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                logger.error(f"MI 레코드 리스너 오류: {e}")
+
+    def _fail_pending(self, error: Exception) -> None:
+        """대기 중인 모든 명령을 실패 처리합니다."""
+        while self._pending:
+            _, pending = self._pending.popitem(last=False)
+            if not pending.future.done():
+                pending.future.set_exception(error)
@@ -1,6 +1,6 @@
 """Pydantic models for GDB MCP server."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from pydantic import BaseModel, Field
 
 
@@ -8,6 +8,9 @@ class GDBExecuteRequest(BaseModel):
     """GDB 명령 실행 요청."""
     command: str = Field(..., description="실행할 GDB 명령")
     timeout: Optional[float] = Field(30.0, description="명령 실행 타임아웃 (초)")
+    format: str = Field("text", description="응답 형식 (text: 콘솔 출력, json: MI 결과 페이로드)")
+    background: bool = Field(False, description="실행 명령(continue 등)을 백그라운드 작업으로 실행하고 즉시 반환할지 여부")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
 
 
 class GDBExecuteResponse(BaseModel):
@@ -17,12 +20,195 @@ class GDBExecuteResponse(BaseModel):
     error: Optional[str] = Field(None, description="에러 메시지")
 
 
+class GDBMIExecuteResponse(BaseModel):
+    """GDB/MI 명령 실행 응답 (구조화된 결과)."""
+    command: str = Field(..., description="실행한 GDB 명령")
+    success: bool = Field(..., description="명령 실행 성공 여부")
+    result: Optional[str] = Field(None, description="MI 결과 클래스 (done, running, connected, error, exit)")
+    payload: Optional[Dict[str, Any]] = Field(None, description="MI 결과 페이로드")
+    console: Optional[str] = Field(None, description="CLI 명령의 콘솔 출력")
+    cache: Optional[Dict[str, Any]] = Field(None, description="정지 세대 캐시 적중 여부와 통계 (캐시 대상 명령인 경우)")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class GDBJobRequest(BaseModel):
+    """백그라운드 실행 작업 조회 요청."""
+    job_id: str = Field(..., description="작업 ID")
+    wait: float = Field(0.0, description="작업이 끝날 때까지 기다릴 최대 시간 (초)")
+    cursor: int = Field(0, description="이 위치 이후의 출력만 반환")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBJobResponse(BaseModel):
+    """백그라운드 실행 작업 상태 응답."""
+    job_id: str = Field(..., description="작업 ID")
+    command: str = Field(..., description="실행한 GDB 명령")
+    state: str = Field(..., description="작업 상태 (running, done, failed)")
+    output: str = Field("", description="cursor 이후의 출력")
+    cursor: int = Field(0, description="다음 조회에 사용할 cursor")
+    stop_reason: Optional[str] = Field(None, description="타겟 정지 사유")
+    frame: Optional[Dict[str, Any]] = Field(None, description="정지 위치 프레임")
+    elapsed: float = Field(..., description="경과 시간 (초)")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class GDBBatchRequest(BaseModel):
+    """GDB 명령 일괄 실행 요청."""
+    commands: List[str] = Field(..., description="순서대로 실행할 GDB 명령 목록")
+    timeout: Optional[float] = Field(30.0, description="명령별 실행 타임아웃 (초)")
+    stop_on_error: bool = Field(False, description="명령이 실패하면 이후 명령을 실행하지 않을지 여부")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBBatchCommandResult(BaseModel):
+    """일괄 실행된 개별 명령의 결과."""
+    command: str = Field(..., description="실행한 GDB 명령")
+    success: bool = Field(..., description="명령 실행 성공 여부")
+    output: str = Field("", description="GDB 출력")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class GDBBatchResponse(BaseModel):
+    """GDB 명령 일괄 실행 응답."""
+    results: List[GDBBatchCommandResult] = Field(default_factory=list, description="명령별 결과")
+    skipped: int = Field(0, description="stop_on_error로 실행하지 않은 명령 수")
+
+
+class GDBHistoryRequest(BaseModel):
+    """GDB 출력 기록 조회 요청."""
+    after_seq: Optional[int] = Field(None, description="이 순번 다음부터 조회 (생략 시 최근 기록)")
+    limit: int = Field(20, description="최대 조회 개수")
+    search: Optional[str] = Field(None, description="명령이나 출력에서 찾을 정규식")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBHistoryEntry(BaseModel):
+    """GDB 출력 기록 항목."""
+    seq: int = Field(..., description="기록 순번")
+    timestamp: float = Field(..., description="기록 시각 (epoch 초)")
+    command: str = Field(..., description="실행한 GDB 명령")
+    output: str = Field(..., description="GDB 출력")
+
+
+class GDBHistoryResponse(BaseModel):
+    """GDB 출력 기록 조회 응답."""
+    entries: List[GDBHistoryEntry] = Field(default_factory=list, description="기록 목록")
+    next_seq: Optional[int] = Field(None, description="다음 페이지 조회에 사용할 after_seq")
+    first_seq: int = Field(..., description="조회 가능한 가장 오래된 순번")
+    last_seq: int = Field(..., description="가장 최근 순번")
+
+
+class GDBReadMemoryRequest(BaseModel):
+    """타겟 메모리 읽기 요청."""
+    address: Union[int, str] = Field(..., description="시작 주소 (정수, 16진수 문자열 또는 GDB 표현식)")
+    length: int = Field(..., description="읽을 바이트 수")
+    chunk_size: int = Field(65536, description="명령 하나로 읽을 바이트 수")
+    output_path: Optional[str] = Field(None, description="내용을 저장할 파일 경로 (생략 시 base64로 반환)")
+    timeout: Optional[float] = Field(30.0, description="실행 타임아웃 (초)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBReadMemoryResponse(BaseModel):
+    """타겟 메모리 읽기 응답."""
+    success: bool = Field(..., description="메모리 읽기 성공 여부")
+    address: Optional[int] = Field(None, description="실제 시작 주소")
+    length: int = Field(0, description="읽은 바이트 수")
+    data: Optional[str] = Field(None, description="base64로 인코딩된 메모리 내용")
+    output_path: Optional[str] = Field(None, description="내용을 저장한 파일 경로")
+    unreadable: List[List[int]] = Field(default_factory=list, description="읽지 못한 구간 ([주소, 길이] 목록, 0으로 채워짐)")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class GDBSnapshotMemoryRequest(BaseModel):
+    """메모리 스냅샷 생성 요청."""
+    name: str = Field(..., description="스냅샷 이름 (같은 이름이 있으면 교체)")
+    address: Union[int, str] = Field(..., description="시작 주소 (정수, 16진수 문자열 또는 GDB 표현식)")
+    length: int = Field(..., description="저장할 바이트 수")
+    chunk_size: int = Field(65536, description="명령 하나로 읽을 바이트 수")
+    timeout: Optional[float] = Field(30.0, description="실행 타임아웃 (초)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBSnapshotMemoryResponse(BaseModel):
+    """메모리 스냅샷 생성 응답."""
+    success: bool = Field(..., description="스냅샷 생성 성공 여부")
+    name: str = Field(..., description="스냅샷 이름")
+    address: Optional[int] = Field(None, description="시작 주소")
+    length: int = Field(0, description="저장한 바이트 수")
+    unreadable: List[List[int]] = Field(default_factory=list, description="읽지 못한 구간 ([주소, 길이] 목록)")
+    snapshots: List[str] = Field(default_factory=list, description="세션에 저장된 스냅샷 이름 목록")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class GDBDiffMemoryRequest(BaseModel):
+    """메모리 스냅샷 비교 요청."""
+    base: str = Field(..., description="기준 스냅샷 이름")
+    target: Optional[str] = Field(None, description="비교할 스냅샷 이름 (생략 시 현재 메모리)")
+    save_as: Optional[str] = Field(None, description="현재 메모리와 비교할 때 읽은 내용을 저장할 스냅샷 이름")
+    merge_gap: int = Field(0, description="이 바이트 수 이하로 떨어진 변경 구간을 하나로 합침")
+    symbols: bool = Field(True, description="각 구간을 포함하는 심볼을 함께 표시할지 여부")
+    max_runs: int = Field(256, description="반환할 최대 구간 수")
+    bytes_limit: int = Field(16, description="이 길이 이하인 구간은 이전/이후 바이트를 함께 반환")
+    timeout: Optional[float] = Field(30.0, description="실행 타임아웃 (초)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class GDBMemoryRun(BaseModel):
+    """연속으로 바뀐 메모리 구간."""
+    address: int = Field(..., description="시작 주소")
+    length: int = Field(..., description="바뀐 구간 길이 (바이트)")
+    symbol: Optional[str] = Field(None, description="구간을 포함하는 심볼")
+    old: Optional[str] = Field(None, description="이전 바이트 (16진수)")
+    new: Optional[str] = Field(None, description="이후 바이트 (16진수)")
+
+
+class GDBDiffMemoryResponse(BaseModel):
+    """메모리 스냅샷 비교 응답."""
+    success: bool = Field(..., description="비교 성공 여부")
+    address: Optional[int] = Field(None, description="비교한 영역의 시작 주소")
+    length: int = Field(0, description="비교한 영역의 길이 (바이트)")
+    changed_bytes: int = Field(0, description="바뀐 바이트 수 (merge_gap으로 합쳐진 간격 포함)")
+    total_runs: int = Field(0, description="바뀐 구간 수")
+    runs: List[GDBMemoryRun] = Field(default_factory=list, description="바뀐 구간 목록 (최대 max_runs개)")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class SymbolizeRequest(BaseModel):
+    """주소 일괄 심볼 변환 요청."""
+    addresses: List[Union[int, str]] = Field(..., description="변환할 주소 목록 (정수 또는 16진수 문자열)")
+    elf: Optional[str] = Field(None, description="심볼을 읽을 ELF 파일 (생략 시 세션의 GDB 타겟)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class SymbolizedAddress(BaseModel):
+    """심볼로 변환된 주소."""
+    address: int = Field(..., description="주소")
+    symbol: Optional[str] = Field(None, description="주소를 포함하는 심볼 이름")
+    offset: Optional[int] = Field(None, description="심볼 시작으로부터의 오프셋")
+
+
+class SymbolizeResponse(BaseModel):
+    """주소 일괄 심볼 변환 응답."""
+    success: bool = Field(..., description="변환 성공 여부")
+    elf: Optional[str] = Field(None, description="사용한 ELF 파일")
+    symbol_count: int = Field(0, description="색인에 있는 심볼 수")
+    resolved: int = Field(0, description="심볼을 찾은 주소 수")
+    results: List[SymbolizedAddress] = Field(default_factory=list, description="주소별 결과 (입력 순서)")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
 class QEMUStartRequest(BaseModel):
     """QEMU 시작 요청."""
     arch: str = Field(..., description="아키텍처 (예: x86_64, arm, aarch64)")
     kernel: Optional[str] = Field(None, description="커널 이미지 경로")
     options: List[str] = Field(default_factory=list, description="QEMU 옵션들")
     gdb_stub: bool = Field(True, description="GDB 스텁 활성화 여부")
+    gdb_port: Optional[int] = Field(None, description="GDB 스텁 포트 (생략 시 자동 할당)")
+    gdb_transport: str = Field("tcp", description="GDB 스텁 전송 방식 (tcp 또는 unix)")
+    snapshot_store: bool = Field(False, description="qemu_snapshot/qemu_restore용 qcow2 스냅샷 드라이브를 붙일지 여부")
+    qmp: bool = Field(True, description="QMP 소켓을 열고 접속할지 여부 (Windows 제외)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+    new_session: bool = Field(False, description="새 세션을 생성하여 시작할지 여부")
 
 
 class QEMUStartResponse(BaseModel):
@@ -30,23 +216,136 @@ class QEMUStartResponse(BaseModel):
     success: bool = Field(..., description="QEMU 시작 성공 여부")
     pid: Optional[int] = Field(None, description="QEMU 프로세스 ID")
     port: Optional[int] = Field(None, description="GDB 스텁 포트")
+    endpoint: Optional[str] = Field(None, description="GDB 접속 주소 (target remote 인자)")
+    startup_ms: Optional[float] = Field(None, description="GDB 스텁 준비까지 걸린 시간 (밀리초)")
+    qmp: bool = Field(False, description="QMP 연결 여부")
+    session_id: Optional[str] = Field(None, description="세션 ID")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class QEMUConsoleRequest(BaseModel):
+    """QEMU 콘솔 출력 조회 요청."""
+    stream: str = Field("stdout", description="출력 스트림 (stdout 또는 stderr)")
+    cursor: int = Field(0, description="이 오프셋 이후의 출력을 반환 (이전 응답의 cursor, 음수이면 끝에서부터)")
+    max_bytes: int = Field(65536, description="반환할 최대 바이트 수")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class QEMUConsoleResponse(BaseModel):
+    """QEMU 콘솔 출력 조회 응답."""
+    stream: str = Field(..., description="출력 스트림")
+    output: str = Field("", description="출력 내용")
+    cursor: int = Field(0, description="다음 조회에 넘길 커서 (반환한 출력의 끝 오프셋)")
+    end: int = Field(0, description="지금까지 받은 전체 바이트 수")
+    dropped: int = Field(0, description="버퍼 한도를 넘어 버려져서 건너뛴 바이트 수")
+    running: bool = Field(False, description="QEMU 실행 중 여부")
+
+
+class QEMUWaitOutputRequest(BaseModel):
+    """QEMU 콘솔 출력 대기 요청."""
+    pattern: str = Field(..., description="기다릴 정규식 (예: TEST (PASS|FAIL))")
+    stream: str = Field("stdout", description="출력 스트림 (stdout 또는 stderr)")
+    cursor: Optional[int] = Field(None, description="이 오프셋 이후의 출력부터 검사 (생략 시 지금 이후)")
+    timeout: float = Field(30.0, description="최대 대기 시간 (초)")
+    tail_bytes: int = Field(2048, description="매치되지 않았을 때 반환할 마지막 출력 크기 (바이트)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class QEMUWaitOutputResponse(BaseModel):
+    """QEMU 콘솔 출력 대기 응답."""
+    matched: bool = Field(..., description="정규식 매치 여부")
+    match: Optional[str] = Field(None, description="매치된 문자열")
+    groups: List[Optional[str]] = Field(default_factory=list, description="매치 그룹")
+    offset: Optional[int] = Field(None, description="매치 시작 오프셋")
+    cursor: int = Field(0, description="다음 대기/조회에 넘길 커서 (매치 끝 또는 검사한 위치)")
+    elapsed_ms: float = Field(0.0, description="대기한 시간 (밀리초)")
+    exited: bool = Field(False, description="매치 전에 QEMU 출력이 끝났는지 여부")
+    tail: Optional[str] = Field(None, description="매치되지 않았을 때 마지막 출력")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class QEMUControlRequest(BaseModel):
+    """QMP를 통한 QEMU 머신 제어 요청."""
+    action: str = Field(..., description="동작 (stop, cont, status, system_reset, hmp, qmp)")
+    command: Optional[str] = Field(None, description="hmp: HMP 명령줄, qmp: QMP 명령 이름")
+    arguments: Optional[Dict[str, Any]] = Field(None, description="qmp: QMP 명령 인자")
+    timeout: Optional[float] = Field(30.0, description="실행 타임아웃 (초)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class QEMUControlResponse(BaseModel):
+    """QMP를 통한 QEMU 머신 제어 응답."""
+    success: bool = Field(..., description="성공 여부")
+    action: str = Field(..., description="실행한 동작")
+    result: Optional[Any] = Field(None, description="QMP return 값 또는 HMP 출력")
+    status: Optional[str] = Field(None, description="QEMU 실행 상태 (running, paused 등)")
+    events: List[Dict[str, Any]] = Field(default_factory=list, description="최근 QMP 이벤트")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class QEMUSnapshotRequest(BaseModel):
+    """QEMU 머신 스냅샷 저장/복원 요청."""
+    name: str = Field(..., description="스냅샷 이름")
+    timeout: Optional[float] = Field(30.0, description="실행 타임아웃 (초)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
+class QEMUSnapshotResponse(BaseModel):
+    """QEMU 머신 스냅샷 저장/복원 응답."""
+    success: bool = Field(..., description="성공 여부")
+    name: str = Field(..., description="스냅샷 이름")
+    elapsed_ms: Optional[float] = Field(None, description="걸린 시간 (밀리초)")
+    frame: Optional[Dict[str, Any]] = Field(None, description="복원 후 현재 프레임")
+    snapshots: List[str] = Field(default_factory=list, description="이 QEMU 인스턴스에서 저장한 스냅샷 이름 목록")
     error: Optional[str] = Field(None, description="에러 메시지")
 
 
 class GDBStartRequest(BaseModel):
     """GDB 시작 요청."""
     target: Optional[str] = Field(None, description="디버그할 파일 경로")
-    remote: Optional[str] = Field(None, description="원격 연결 주소 (예: localhost:1234)")
+    remote: Optional[str] = Field(None, description="원격 연결 주소 (예: localhost:1234, 생략 시 세션의 QEMU 스텁)")
     options: List[str] = Field(default_factory=list, description="GDB 옵션들")
+    index_cache: bool = Field(True, description="빌드 ID 기준 GDB 디버그 정보 색인 캐시 사용 여부")
+    gdb_path: Optional[str] = Field(None, description="실행할 GDB (예: arm-none-eabi-gdb, gdb-multiarch, 생략 시 GDB_MCP_GDB)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+    new_session: bool = Field(False, description="새 세션을 생성하여 시작할지 여부")
 
 
 class GDBStartResponse(BaseModel):
     """GDB 시작 응답."""
     success: bool = Field(..., description="GDB 시작 성공 여부")
     pid: Optional[int] = Field(None, description="GDB 프로세스 ID")
+    session_id: Optional[str] = Field(None, description="세션 ID")
+    startup_ms: Optional[float] = Field(None, description="GDB 준비(원격 연결 포함)까지 걸린 시간 (밀리초)")
+    index_cache: Optional[str] = Field(None, description="색인 캐시 상태 (cold: 새로 색인, warm: 캐시 사용, off: GDB에서 켜지지 않음)")
+    cold_startup_ms: Optional[float] = Field(None, description="같은 빌드 ID의 마지막 cold 시작 시간 (밀리초)")
+    warm_startup_ms: Optional[float] = Field(None, description="같은 빌드 ID의 마지막 warm 시작 시간 (밀리초)")
+    pooled: bool = Field(False, description="미리 시작된 GDB 풀에서 할당되었는지 여부")
     error: Optional[str] = Field(None, description="에러 메시지")
 
 
+class GDBPoolPrewarmSpec(BaseModel):
+    """미리 시작할 GDB 구성."""
+    target: Optional[str] = Field(None, description="미리 로드할 ELF 파일 경로")
+    options: List[str] = Field(default_factory=list, description="GDB 옵션들")
+    index_cache: bool = Field(True, description="빌드 ID 기준 GDB 디버그 정보 색인 캐시 사용 여부")
+    gdb_path: Optional[str] = Field(None, description="실행할 GDB (생략 시 GDB_MCP_GDB)")
+
+
+class GDBPoolConfigureRequest(BaseModel):
+    """GDB 프로세스 풀 설정 요청."""
+    size: Optional[int] = Field(None, description="구성별로 대기시킬 GDB 수 (0이면 풀 사용 안 함)")
+    max_idle: Optional[int] = Field(None, description="전체 대기 GDB 최대 수 (초과 시 가장 오래 사용되지 않은 구성부터 종료)")
+    max_age: Optional[float] = Field(None, description="대기 GDB 최대 수명 (초, 0이면 제한 없음)")
+    init_commands: Optional[List[str]] = Field(None, description="GDB 시작 직후 적용할 공통 명령")
+    prewarm: List[GDBPoolPrewarmSpec] = Field(default_factory=list, description="미리 시작할 GDB 구성 목록")
+
+
+class GDBStatusRequest(BaseModel):
+    """GDB 상태 조회 요청."""
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
+
+
 class GDBStatusResponse(BaseModel):
     """GDB 상태 응답."""
     running: bool = Field(..., description="GDB 실행 중 여부")
@@ -54,11 +353,15 @@ class GDBStatusResponse(BaseModel):
     target: Optional[str] = Field(None, description="현재 타겟")
     breakpoints: List[Dict[str, Any]] = Field(default_factory=list, description="브레이크포인트 목록")
     current_frame: Optional[Dict[str, Any]] = Field(None, description="현재 프레임 정보")
+    execution_state: Optional[str] = Field(None, description="타겟 실행 상태 (running, stopped, exited)")
+    stop_reason: Optional[str] = Field(None, description="마지막 정지 사유")
+    thread_groups: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="스레드 그룹(inferior) 상태")
 
 
 class ProcessStopRequest(BaseModel):
     """프로세스 중지 요청."""
-    process_type: str = Field(..., description="프로세스 타입 (gdb 또는 qemu)")
+    process_type: str = Field(..., description="프로세스 타입 (gdb, qemu 또는 session)")
+    session_id: Optional[str] = Field(None, description="세션 ID (생략 시 기본 세션)")
 
 
 class ProcessStopResponse(BaseModel):
@@ -66,3 +369,63 @@ class ProcessStopResponse(BaseModel):
     success: bool = Field(..., description="중지 성공 여부")
     error: Optional[str] = Field(None, description="에러 메시지")
 
+
+class SessionInfo(BaseModel):
+    """디버그 세션 정보."""
+    session_id: str = Field(..., description="세션 ID")
+    gdb_running: bool = Field(..., description="GDB 실행 중 여부")
+    gdb_pid: Optional[int] = Field(None, description="GDB 프로세스 ID")
+    qemu_running: bool = Field(..., description="QEMU 실행 중 여부")
+    qemu_pid: Optional[int] = Field(None, description="QEMU 프로세스 ID")
+    qemu_endpoint: Optional[str] = Field(None, description="QEMU GDB 스텁 접속 주소")
+    qemu_status: Optional[str] = Field(None, description="QMP로 확인한 QEMU 실행 상태")
+    created_at: float = Field(..., description="세션 생성 시각 (epoch 초)")
+
+
+class SessionListResponse(BaseModel):
+    """세션 목록 응답."""
+    sessions: List[SessionInfo] = Field(default_factory=list, description="세션 목록")
+
+
+class ServerMetricsRequest(BaseModel):
+    """서버 지표 조회 요청."""
+    format: str = Field("summary", description="출력 형식 (summary, json, prometheus)")
+    reset: bool = Field(False, description="조회 후 누적 지표 초기화 여부")
+
+
+class CampaignCase(BaseModel):
+    """캠페인 테스트 케이스."""
+    name: str = Field(..., description="케이스 이름")
+    elf: str = Field(..., description="타겟 ELF 경로 (매니페스트 기준 상대 경로 가능)")
+    gdb_script: Optional[str] = Field(None, description="한 줄에 명령 하나인 GDB 스크립트 경로 (define/if/while 등 end 블록은 source로 실행)")
+    commands: List[str] = Field(default_factory=list, description="GDB 스크립트 뒤에 실행할 명령")
+    expect: Optional[str] = Field(None, description="성공으로 판정할 QEMU 콘솔 출력 정규식")
+    fail: Optional[str] = Field(None, description="실패로 판정할 QEMU 콘솔 출력 정규식")
+    expect_gdb: Optional[str] = Field(None, description="성공으로 판정할 GDB 출력 정규식")
+    arch: Optional[str] = Field(None, description="QEMU 아키텍처 (생략 시 매니페스트 기본값)")
+    qemu_options: Optional[List[str]] = Field(None, description="QEMU 옵션 (생략 시 매니페스트 기본값)")
+    gdb_options: Optional[List[str]] = Field(None, description="GDB 옵션 (생략 시 매니페스트 기본값)")
+    gdb: Optional[str] = Field(None, description="실행할 GDB (생략 시 매니페스트 기본값)")
+    timeout: Optional[float] = Field(None, description="케이스 타임아웃 (초, 생략 시 매니페스트 기본값)")
+
+
+class CampaignManifest(BaseModel):
+    """캠페인 매니페스트."""
+    arch: str = Field("arm", description="기본 QEMU 아키텍처")
+    qemu_options: List[str] = Field(default_factory=list, description="기본 QEMU 옵션")
+    gdb_options: List[str] = Field(default_factory=list, description="기본 GDB 옵션")
+    gdb: Optional[str] = Field(None, description="실행할 GDB (예: arm-none-eabi-gdb, gdb-multiarch, 생략 시 GDB_MCP_GDB)")
+    timeout: float = Field(60.0, description="기본 케이스 타임아웃 (초)")
+    cases: List[CampaignCase] = Field(default_factory=list, description="테스트 케이스 목록")
+
+
+class CampaignCaseResult(BaseModel):
+    """캠페인 케이스 실행 결과."""
+    name: str = Field(..., description="케이스 이름")
+    status: str = Field(..., description="결과 (passed, failed, error)")
+    message: Optional[str] = Field(None, description="실패/에러 사유")
+    duration_ms: float = Field(0.0, description="케이스 전체 시간 (밀리초)")
+    timings: Dict[str, float] = Field(default_factory=dict, description="단계별 시간 (밀리초)")
+    match: Optional[str] = Field(None, description="판정에 사용된 매치 문자열")
+    console_tail: Optional[str] = Field(None, description="실패 시 QEMU 콘솔 마지막 출력")
+    gdb_output: Optional[str] = Field(None, description="GDB 명령 출력")
@@ -1,34 +1,185 @@
 """GDB와 QEMU 프로세스 관리 모듈."""
 
 import asyncio
+import json
 import os
+import shutil
 import signal
+import socket
 import subprocess
+import tempfile
 import time
-from typing import Optional, List, Dict, Any, Tuple
+import uuid
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
 import pexpect
-from pygdbmi.gdbcontroller import GdbController
-from pygdbmi.constants import GdbTimeoutError
 import logging
 
+from .console import (
+    DEFAULT_CONSOLE_BYTES,
+    DEFAULT_MATCH_OVERLAP,
+    ConsoleBuffer,
+    compile_output_pattern,
+    wait_for_pattern,
+)
+from .mi_transport import GDBMITransport, MIResponse
+from .elf import ElfSymbolIndex, load_symbol_index
+from .history import DEFAULT_SPILL_DIR, OutputHistory
+from .index_cache import DEFAULT_INDEX_CACHE_DIR, IndexCache
+from .metrics import METRICS
+from .tracing import detached_task, traced
+from .qmp import EventListener, QMPClient, QMPError
+from .state import (
+    SessionState,
+    StopEpochCache,
+    is_cacheable_command,
+    is_state_changing_command,
+    normalize_command,
+)
+from .memory import (
+    DEFAULT_CHUNK_SIZE,
+    MemoryReadError,
+    lookup_symbols,
+    read_memory,
+    resolve_address,
+)
+
 logger = logging.getLogger(__name__)
 
+# 실행할 GDB (예: arm-none-eabi-gdb, gdb-multiarch). 시작 요청마다 바꿀 수 있습니다
+DEFAULT_GDB_PATH = os.environ.get("GDB_MCP_GDB", "gdb")
+
+# QEMU 스냅샷 저장용 qcow2 이미지를 만드는 디렉토리 (가능하면 메모리 기반 tmpfs)
+_SNAPSHOT_STORE_DIR = os.environ.get(
+    "GDB_MCP_QEMU_SNAPSHOT_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+)
+
+# 스냅샷 저장용 qcow2 이미지의 가상 크기 (머신 상태는 이미지의 vmstate 영역에 저장됩니다)
+_SNAPSHOT_STORE_SIZE = "1M"
+
+# QMP 이벤트별 QEMU 실행 상태
+_QMP_STATUS_EVENTS = {
+    "STOP": "paused",
+    "RESUME": "running",
+    "SHUTDOWN": "shutdown",
+}
+
+# QEMU 출력 파이프에서 한 번에 읽는 최대 바이트 수
+_CONSOLE_READ_SIZE = 64 * 1024
+
+# 실행 중인 QEMU 인스턴스가 사용 중인 포트
+_reserved_ports: Set[int] = set()
+
+# 준비 상태 확인 간격 (초): 짧게 시작해서 최대값까지 늘립니다
+_PROBE_INTERVAL_MIN = 0.005
+_PROBE_INTERVAL_MAX = 0.05
+
+# GDB 스텁이 없는 QEMU가 즉시 종료되는지 확인하는 유예 시간 (초)
+_QEMU_EXIT_GRACE = 0.2
+
+# 타겟을 재개시키는 GDB 명령 (CLI 명령과 약어, MI 명령)
+_EXECUTION_COMMANDS = {
+    "c", "cont", "continue", "fg",
+    "n", "next", "s", "step", "ni", "nexti", "si", "stepi",
+    "fin", "finish", "u", "until", "adv", "advance",
+    "r", "run", "start", "starti", "j", "jump", "signal",
+    "reverse-continue", "reverse-next", "reverse-step", "reverse-finish",
+    "-exec-continue", "-exec-next", "-exec-step", "-exec-next-instruction",
+    "-exec-step-instruction", "-exec-finish", "-exec-until", "-exec-run", "-exec-jump",
+}
+
+
+def is_execution_command(command: str) -> bool:
+    """타겟 실행을 재개시키는 명령인지 확인합니다."""
+    words = command.split(None, 1)
+    return bool(words) and words[0] in _EXECUTION_COMMANDS
+
+
+def allocate_gdb_port(host: str = "") -> int:
+    """사용 가능한 GDB 스텁 포트를 할당합니다.
+
+    운영체제에 임시 포트를 요청하고, 아직 QEMU가 바인드하지 않은 포트가
+    다른 인스턴스에 중복 할당되지 않도록 예약 목록에 기록합니다.
+    """
+    for _ in range(64):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+        if port not in _reserved_ports:
+            _reserved_ports.add(port)
+            return port
+    raise RuntimeError("사용 가능한 GDB 스텁 포트를 찾지 못했습니다")
+
+
+def release_gdb_port(port: Optional[int]) -> None:
+    """예약된 GDB 스텁 포트를 해제합니다."""
+    if port is not None:
+        _reserved_ports.discard(port)
+
+
+async def probe_gdb_endpoint(endpoint: str, timeout: float = 0.5) -> bool:
+    """GDB 엔드포인트(host:port 또는 유닉스 소켓 경로)가 접속을 받는지 확인합니다."""
+    try:
+        if ":" in endpoint and not endpoint.startswith("/"):
+            host, port = endpoint.rsplit(":", 1)
+            connect = asyncio.open_connection(host or "localhost", int(port))
+        else:
+            connect = asyncio.open_unix_connection(endpoint)
+        _, writer = await asyncio.wait_for(connect, timeout=timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
 
 class QEMUManager:
     """QEMU 프로세스 관리자."""
     
-    def __init__(self):
-        self.process: Optional[subprocess.Popen] = None
+    # 실행 중인 모든 QEMU 인스턴스 (PID 기준)
+    _instances: Dict[int, "QEMUManager"] = {}
+    
+    def __init__(self, console_bytes: int = DEFAULT_CONSOLE_BYTES):
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.pid: Optional[int] = None
         self.port: Optional[int] = None
         self.arch: Optional[str] = None
+        # 스트림 이름 -> 출력 버퍼 (종료 후에도 다음 시작 전까지 조회할 수 있습니다)
+        self.console_bytes = console_bytes
+        self.consoles: Dict[str, ConsoleBuffer] = {}
+        self._drain_tasks: List["asyncio.Task[None]"] = []
+        self.endpoint: Optional[str] = None
+        self._socket_dir: Optional[str] = None
+        self._snapshot_dir: Optional[str] = None
+        self._owns_port = False
+        self.startup_time: Optional[float] = None
+        # 머신 스냅샷 이름 -> 생성 시각
+        self.vm_snapshots: Dict[str, float] = {}
+        self.qmp: Optional[QMPClient] = None
+        # QMP로 확인한 실행 상태 (running, paused, shutdown 등)
+        self.status: Optional[str] = None
+        self._event_listeners: List[EventListener] = []
         
+    @traced("QEMUManager.start", capture=("arch",))
     async def start(self, arch: str, kernel: Optional[str] = None, 
-                   options: List[str] = None, gdb_stub: bool = True) -> Tuple[bool, Optional[str]]:
-        """QEMU 프로세스를 시작합니다."""
+                   options: List[str] = None, gdb_stub: bool = True,
+                   gdb_port: Optional[int] = None,
+                   gdb_transport: str = "tcp",
+                   startup_timeout: float = 10.0,
+                   snapshot_store: bool = False,
+                   qmp: bool = True) -> Tuple[bool, Optional[str]]:
+        """QEMU 프로세스를 시작합니다.
+
+        GDB 스텁 포트를 지정하지 않으면 빈 포트를 자동으로 할당하며,
+        gdb_transport가 "unix"이면 인스턴스별 유닉스 소켓을 사용합니다.
+        snapshot_store가 켜져 있으면 savevm/loadvm용 qcow2 드라이브를 붙입니다.
+        qmp가 켜져 있으면 인스턴스별 QMP 소켓을 열고 접속합니다 (Windows 제외).
+        GDB 스텁이 접속을 받을 수 있을 때까지 기다린 뒤 반환합니다.
+        """
         if options is None:
             options = []
             
+        if self.is_running():
+            return False, f"QEMU가 이미 실행 중입니다 (PID: {self.pid})"
+            
         try:
             # QEMU 명령어 구성
             cmd = [f"qemu-system-{arch}"]
@@ -37,38 +188,314 @@ class QEMUManager:
                 cmd.extend(["-kernel", kernel])
                 
             if gdb_stub:
-                cmd.extend(["-s", "-S"])  # GDB 스텁 활성화
-                self.port = 1234
+                cmd.extend(self._gdb_stub_args(options, gdb_port, gdb_transport))
+                
+            if snapshot_store:
+                cmd.extend(await self._snapshot_store_args())
+                
+            qmp_path = None
+            if qmp and os.name != "nt" and "-qmp" not in options:
+                qmp_path = os.path.join(self._run_dir(), "qmp.sock")
+                cmd.extend(["-qmp", f"unix:{qmp_path},server=on,wait=off"])
                 
             cmd.extend(options)
             
             logger.info(f"QEMU 시작: {' '.join(cmd)}")
+            started = time.perf_counter()
             
             # 비동기로 프로세스 시작
-            loop = asyncio.get_event_loop()
-            self.process = await loop.run_in_executor(
-                None, lambda: subprocess.Popen(cmd, 
-                    stdin=subprocess.PIPE, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE
-                )
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             
+            # 게스트 출력이 파이프를 채워 QEMU가 멈추지 않도록 계속 읽어 둡니다
+            self.consoles = {
+                "stdout": ConsoleBuffer(self.console_bytes),
+                "stderr": ConsoleBuffer(self.console_bytes),
+            }
+            self._drain_tasks = [
+                detached_task(self._drain(self.process.stdout, self.consoles["stdout"])),
+                detached_task(self._drain(self.process.stderr, self.consoles["stderr"])),
+            ]
+            
             self.pid = self.process.pid
             self.arch = arch
+            QEMUManager._instances[self.pid] = self
             
             # 프로세스가 정상적으로 시작되었는지 확인
-            await asyncio.sleep(1)
-            if self.process.poll() is not None:
-                return False, "QEMU 프로세스가 즉시 종료되었습니다"
+            error = await self._wait_until_ready(started + startup_timeout)
+            if error:
+                await self.stop()
+                return False, error
+            self.startup_time = time.perf_counter() - started
+            
+            if qmp_path:
+                await self._connect_qmp(qmp_path, max(started + startup_timeout - time.perf_counter(), 1.0))
                 
-            logger.info(f"QEMU 시작 성공 (PID: {self.pid})")
+            logger.info(
+                f"QEMU 시작 성공 (PID: {self.pid}, GDB 엔드포인트: {self.endpoint}, "
+                f"준비 시간: {self.startup_time * 1000:.1f}ms)"
+            )
             return True, None
             
         except Exception as e:
             logger.error(f"QEMU 시작 실패: {e}")
+            self._cleanup()
             return False, str(e)
     
+    async def _wait_until_ready(self, deadline: float) -> Optional[str]:
+        """GDB 스텁이 접속을 받을 때까지 기다립니다. 실패 시 에러 메시지를 반환합니다."""
+        if self.endpoint is None:
+            # 스텁이 없으면 준비 신호가 없으므로 즉시 종료 여부만 확인합니다
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=_QEMU_EXIT_GRACE)
+                return self._exit_message()
+            except asyncio.TimeoutError:
+                return None
+                
+        interval = _PROBE_INTERVAL_MIN
+        while True:
+            if self.process.returncode is not None:
+                return self._exit_message()
+            if await probe_gdb_endpoint(self.endpoint):
+                return None
+            if time.perf_counter() >= deadline:
+                return f"GDB 스텁 준비 타임아웃: {self.endpoint}"
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _PROBE_INTERVAL_MAX)
+    
+    def _exit_message(self) -> str:
+        """즉시 종료된 QEMU의 에러 메시지를 만듭니다 (stderr 마지막 부분 포함)."""
+        stderr = self.consoles.get("stderr")
+        tail = stderr.tail(1024).decode(errors="replace").strip() if stderr else ""
+        return "QEMU 프로세스가 즉시 종료되었습니다" + (f": {tail}" if tail else "")
+    
+    async def _drain(self, stream: asyncio.StreamReader, buffer: ConsoleBuffer) -> None:
+        """스트림이 닫힐 때까지 출력을 읽어 버퍼에 쌓습니다."""
+        try:
+            while True:
+                data = await stream.read(_CONSOLE_READ_SIZE)
+                if not data:
+                    break
+                buffer.append(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"QEMU 출력 읽기 실패: {e}")
+        finally:
+            buffer.close()
+    
+    def read_console(self, stream: str = "stdout", cursor: int = 0,
+                     max_bytes: int = -1) -> Tuple[bytes, int, int]:
+        """콘솔 출력을 커서 이후부터 읽습니다.
+
+        (데이터, 다음 커서, 버려져서 건너뛴 바이트 수)를 반환합니다.
+        """
+        buffer = self.consoles.get(stream)
+        if buffer is None:
+            if stream not in ("stdout", "stderr"):
+                raise ValueError(f"알 수 없는 스트림: {stream}")
+            return b"", 0, 0
+        return buffer.read(cursor, max_bytes)
+    
+    @traced("QEMUManager.wait_output", capture=("pattern",))
+    async def wait_output(self, pattern: str, stream: str = "stdout", cursor: Optional[int] = None,
+                          timeout: float = 30.0, tail_bytes: int = 2048,
+                          overlap: int = DEFAULT_MATCH_OVERLAP) -> Dict[str, Any]:
+        """콘솔 출력에 정규식이 나타날 때까지 기다립니다.
+
+        cursor를 생략하면 지금 이후의 출력만 검사합니다. 매치되지 않고 타임아웃이
+        지나거나 QEMU가 종료되면 마지막 tail_bytes 바이트를 함께 반환합니다.
+        """
+        buffer = self.consoles.get(stream)
+        if buffer is None:
+            if stream not in ("stdout", "stderr"):
+                raise ValueError(f"알 수 없는 스트림: {stream}")
+            raise RuntimeError("QEMU가 시작되지 않았습니다")
+        regex = compile_output_pattern(pattern)
+        if cursor is None:
+            cursor = buffer.end
+        started = time.perf_counter()
+        match, base, next_cursor = await wait_for_pattern(buffer, regex, cursor, timeout, overlap)
+        result: Dict[str, Any] = {
+            "matched": match is not None,
+            "cursor": next_cursor,
+            "elapsed": time.perf_counter() - started,
+            "exited": match is None and buffer.closed,
+        }
+        if match is not None:
+            result["match"] = match.group(0).decode(errors="replace")
+            result["groups"] = [
+                group.decode(errors="replace") if group is not None else None for group in match.groups()
+            ]
+            result["offset"] = base + match.start()
+        else:
+            result["tail"] = buffer.tail(tail_bytes).decode(errors="replace")
+        return result
+    
+    def _gdb_stub_args(self, options: List[str], gdb_port: Optional[int],
+                       gdb_transport: str) -> List[str]:
+        """GDB 스텁 인자를 구성하고 엔드포인트를 기록합니다."""
+        # 사용자가 직접 스텁을 지정한 경우 그대로 사용합니다
+        if "-gdb" in options:
+            return []
+        if "-s" in options:
+            self.port = 1234
+            self.endpoint = "localhost:1234"
+            return [] if "-S" in options else ["-S"]
+            
+        if gdb_transport == "unix":
+            if os.name == "nt":
+                raise ValueError("Windows에서는 유닉스 소켓 GDB 스텁을 지원하지 않습니다")
+            path = os.path.join(self._run_dir(), "gdb.sock")
+            self.endpoint = path
+            return ["-gdb", f"unix:{path},server=on,wait=off", "-S"]
+        if gdb_transport != "tcp":
+            raise ValueError(f"알 수 없는 GDB 스텁 전송 방식: {gdb_transport}")
+            
+        if gdb_port is None:
+            gdb_port = allocate_gdb_port()
+            self._owns_port = True
+        self.port = gdb_port
+        self.endpoint = f"localhost:{gdb_port}"
+        return ["-gdb", f"tcp::{gdb_port}", "-S"]
+    
+    def _run_dir(self) -> str:
+        """인스턴스별 소켓 디렉토리를 반환합니다. 처음 호출할 때 만듭니다."""
+        if self._socket_dir is None:
+            self._socket_dir = tempfile.mkdtemp(prefix="gdb-mcp-qemu-")
+        return self._socket_dir
+    
+    async def _connect_qmp(self, path: str, timeout: float) -> bool:
+        """QMP 소켓에 접속합니다. 실패하면 QMP 없이 계속합니다."""
+        client = QMPClient(path)
+        client.add_listener(self._on_qmp_event)
+        try:
+            await client.connect(timeout)
+            status = await client.execute("query-status", timeout=timeout)
+            self.status = status.get("status")
+        except Exception as e:
+            logger.warning(f"QMP 접속 실패, GDB 모니터 명령으로 대체합니다: {e}")
+            await client.close()
+            return False
+        self.qmp = client
+        return True
+    
+    async def _ensure_qmp(self, timeout: float) -> Optional[str]:
+        """QMP 연결을 확인하고, 끊어졌으면 한 번 다시 접속합니다.
+
+        사용할 수 없으면 이유를 반환합니다.
+        """
+        if self.has_qmp():
+            return None
+        if self.qmp is None or not self.is_running():
+            return "QMP가 연결되어 있지 않습니다"
+        reason = self.qmp.error or "연결이 끊어졌습니다"
+        logger.warning(f"QMP 연결이 끊어져 다시 접속합니다: {reason}")
+        await self.qmp.close()
+        if await self._connect_qmp(self.qmp.path, timeout):
+            return None
+        return f"QMP 연결이 끊어졌습니다: {reason}"
+    
+    def add_event_listener(self, listener: EventListener) -> None:
+        """QMP 이벤트를 받을 콜백을 등록합니다. 재시작 후에도 유지됩니다."""
+        self._event_listeners.append(listener)
+    
+    def _on_qmp_event(self, event: Dict[str, Any]) -> None:
+        """QMP 이벤트로 실행 상태를 갱신하고 리스너에 전달합니다."""
+        status = _QMP_STATUS_EVENTS.get(event.get("event"))
+        if status is not None:
+            self.status = status
+        for listener in list(self._event_listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"QMP 이벤트 리스너 오류: {e}")
+    
+    def has_qmp(self) -> bool:
+        """QMP로 머신을 제어할 수 있는지 확인합니다."""
+        return self.qmp is not None and self.qmp.is_connected()
+    
+    @traced("QEMUManager.qmp_execute", capture=("command",))
+    async def qmp_execute(self, command: str, arguments: Optional[Dict[str, Any]] = None,
+                          timeout: float = 30.0) -> Tuple[bool, Any, Optional[str]]:
+        """QMP 명령을 실행합니다. (성공 여부, return 값, 에러)를 반환합니다."""
+        error = await self._ensure_qmp(timeout)
+        if error:
+            return False, None, error
+        try:
+            logger.info(f"QMP 명령 실행: {command}")
+            return True, await self.qmp.execute(command, arguments, timeout), None
+        except QMPError as e:
+            return False, None, str(e)
+        except asyncio.TimeoutError:
+            return False, None, f"QMP 명령 타임아웃: {command}"
+        except Exception as e:
+            error_msg = f"QMP 명령 실행 실패: {e}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
+    @traced("QEMUManager.human_monitor", capture=("command_line",))
+    async def human_monitor(self, command_line: str,
+                            timeout: float = 30.0) -> Tuple[bool, str, Optional[str]]:
+        """QMP로 HMP 명령을 실행합니다. (성공 여부, 출력, 에러)를 반환합니다."""
+        error = await self._ensure_qmp(timeout)
+        if error:
+            return False, "", error
+        try:
+            logger.info(f"QEMU 모니터 명령 실행: {command_line}")
+            return True, await self.qmp.human_monitor_command(command_line, timeout), None
+        except QMPError as e:
+            return False, "", e.desc
+        except asyncio.TimeoutError:
+            return False, "", f"QEMU 모니터 명령 타임아웃: {command_line}"
+        except Exception as e:
+            error_msg = f"QEMU 모니터 명령 실행 실패: {e}"
+            logger.error(error_msg)
+            return False, "", error_msg
+    
+    async def _snapshot_store_args(self) -> List[str]:
+        """스냅샷 저장용 qcow2 이미지를 만들고 드라이브 인자를 반환합니다.
+
+        디스크가 없는 보드 머신도 savevm을 사용할 수 있도록, 게스트에 연결되지 않은
+        (if=none) 드라이브를 붙여 머신 상태를 이 이미지에 저장합니다.
+        """
+        self._snapshot_dir = tempfile.mkdtemp(prefix="gdb-mcp-snap-", dir=_SNAPSHOT_STORE_DIR)
+        path = os.path.join(self._snapshot_dir, "snapshots.qcow2")
+        result = await METRICS.run_in_executor(lambda: subprocess.run(
+            ["qemu-img", "create", "-q", "-f", "qcow2", path, _SNAPSHOT_STORE_SIZE],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ))
+        if result.returncode != 0:
+            raise RuntimeError(f"스냅샷 이미지 생성 실패: {result.stderr.strip()}")
+        return ["-drive", f"if=none,format=qcow2,file={path},id=gdb-mcp-snapshots"]
+    
+    def _cleanup(self) -> None:
+        """인스턴스 상태와 할당된 자원을 정리합니다."""
+        if self.pid is not None:
+            QEMUManager._instances.pop(self.pid, None)
+        if self._owns_port:
+            release_gdb_port(self.port)
+        for directory in (self._socket_dir, self._snapshot_dir):
+            if directory:
+                shutil.rmtree(directory, ignore_errors=True)
+        self.process = None
+        self.pid = None
+        self.port = None
+        self.arch = None
+        self.endpoint = None
+        self._socket_dir = None
+        self._snapshot_dir = None
+        self._owns_port = False
+        self.startup_time = None
+        self.vm_snapshots = {}
+        self.qmp = None
+        self.status = None
+    
+    @traced("QEMUManager.stop")
     async def stop(self) -> Tuple[bool, Optional[str]]:
         """QEMU 프로세스를 중지합니다."""
         if not self.process:
@@ -77,23 +504,31 @@ class QEMUManager:
         try:
             logger.info(f"QEMU 중지 (PID: {self.pid})")
             
+            if self.qmp is not None:
+                await self.qmp.close()
+            
             # 프로세스 종료
-            self.process.terminate()
+            if self.process.returncode is None:
+                try:
+                    self.process.terminate()
+                except ProcessLookupError:
+                    pass
             
             # 5초 대기 후 강제 종료
             try:
-                await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(None, self.process.wait),
-                    timeout=5.0
-                )
+                await asyncio.wait_for(self.process.wait(), timeout=5.0)
             except asyncio.TimeoutError:
                 self.process.kill()
-                await asyncio.get_event_loop().run_in_executor(None, self.process.wait)
+                await self.process.wait()
                 
-            self.process = None
-            self.pid = None
-            self.port = None
-            self.arch = None
+            # 남은 출력을 모두 읽어 둡니다 (파이프를 물려받은 자식 프로세스가 있으면 포기)
+            drains = asyncio.gather(*self._drain_tasks, return_exceptions=True)
+            try:
+                await asyncio.wait_for(drains, timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+            self._drain_tasks = []
+            self._cleanup()
             
             return True, None
             
@@ -105,97 +540,197 @@ class QEMUManager:
         """QEMU가 실행 중인지 확인합니다."""
         if not self.process:
             return False
-        return self.process.poll() is None
+        return self.process.returncode is None
+    
+    @classmethod
+    def live_instances(cls) -> List["QEMUManager"]:
+        """실행 중인 모든 QEMU 인스턴스를 반환합니다."""
+        return [instance for instance in cls._instances.values() if instance.is_running()]
 
 
 class GDBManager:
     """GDB 프로세스 관리자."""
     
     def __init__(self):
-        self.controller: Optional[GdbController] = None
+        self.transport: Optional[GDBMITransport] = None
         self.pid: Optional[int] = None
         self.target: Optional[str] = None
         self.remote: Optional[str] = None
-        self._output_buffer: List[str] = []
+        self.startup_time: Optional[float] = None
+        self.state = SessionState()
+        self.history = OutputHistory()
+        self.cache = StopEpochCache()
+        self._symbol_index: Optional["asyncio.Future[ElfSymbolIndex]"] = None
+        self.build_id: Optional[str] = None
+        self.index_cache_state: Optional[str] = None
+        self.index_cache_times: Dict[str, Any] = {}
+        self.from_pool = False
         
+    @staticmethod
+    def build_command(target: Optional[str] = None, options: Optional[List[str]] = None,
+                      index_cache: bool = True, build_id: Optional[str] = None,
+                      gdb_path: Optional[str] = None) -> List[str]:
+        """GDB 실행 명령을 구성합니다.
+
+        build_id를 넘기면 타겟 ELF에서 빌드 ID를 다시 읽지 않습니다.
+        gdb_path를 생략하면 DEFAULT_GDB_PATH(GDB_MCP_GDB)를 실행합니다.
+        """
+        options = options or []
+        gdb_cmd = [gdb_path or DEFAULT_GDB_PATH]
+        if not any(option.startswith("--interpreter") for option in options):
+            gdb_cmd.append("--interpreter=mi2")
+        if index_cache and DEFAULT_INDEX_CACHE_DIR and (build_id or IndexCache.build_id(target)):
+            gdb_cmd.extend(IndexCache(DEFAULT_INDEX_CACHE_DIR).gdb_args())
+        gdb_cmd.extend(options)
+        if target:
+            gdb_cmd.append(target)
+        return gdb_cmd
+        
+    @traced("GDBManager.start", capture=("target", "remote"))
     async def start(self, target: Optional[str] = None, remote: Optional[str] = None,
-                   options: List[str] = None) -> Tuple[bool, Optional[str]]:
-        """GDB 프로세스를 시작합니다."""
+                   options: List[str] = None,
+                   startup_timeout: float = 10.0,
+                   index_cache: bool = True,
+                   transport: Optional[GDBMITransport] = None,
+                   build_id: Optional[str] = None,
+                   gdb_path: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """GDB 프로세스를 시작합니다.
+
+        index_cache가 켜져 있고 타겟 ELF에 빌드 ID가 있으면 GDB index-cache를
+        사용하여, 같은 빌드의 두 번째 시작부터 DWARF 색인을 다시 만들지 않습니다.
+        호출자가 이미 읽은 빌드 ID는 build_id로 넘기면 다시 읽지 않습니다.
+        transport를 지정하면 새 GDB를 실행하지 않고 미리 시작된 GDB를 사용합니다.
+        gdb_path로 실행할 GDB(예: arm-none-eabi-gdb, gdb-multiarch)를 지정합니다.
+        """
         if options is None:
             options = []
             
+        if self.is_running():
+            return False, f"GDB가 이미 실행 중입니다 (PID: {self.pid})"
+            
         try:
-            # GDB 명령어 구성
-            gdb_cmd = ["gdb"]
-            gdb_cmd.extend(options)
+            started = time.perf_counter()
+            # 이전 시작의 index-cache 상태가 남지 않도록 먼저 비웁니다
+            self._reset_index_cache()
+            cache = self._index_cache(target, build_id) if index_cache else None
             
-            if target:
-                gdb_cmd.append(target)
+            self.state = SessionState()
+            self.cache = StopEpochCache()
+            self._symbol_index = None
+            self.history = OutputHistory(spill_path=self._spill_path())
+            self.from_pool = transport is not None
+            if transport is not None:
+                # 풀에서 받은 GDB는 이미 첫 MI 프롬프트까지 준비되어 있습니다
+                if not transport.is_alive():
+                    raise RuntimeError("미리 시작된 GDB가 종료되었습니다")
+                logger.info(f"미리 시작된 GDB 사용: {' '.join(transport.command)}")
+                self.transport = transport
+                self.transport.add_listener(self.state.handle_record)
+            else:
+                # GDB 명령어 구성
+                gdb_cmd = self.build_command(target, options, cache is not None, self.build_id, gdb_path)
+                logger.info(f"GDB 시작: {' '.join(gdb_cmd)}")
                 
-            logger.info(f"GDB 시작: {' '.join(gdb_cmd)}")
-            
-            # GDB 컨트롤러 생성
-            loop = asyncio.get_event_loop()
-            self.controller = await loop.run_in_executor(
-                None, lambda: GdbController(gdb_cmd)
-            )
+                # GDB 실행 후 첫 MI 프롬프트까지 대기
+                self.transport = GDBMITransport(gdb_cmd)
+                self.transport.add_listener(self.state.handle_record)
+                await self.transport.start(timeout=startup_timeout)
+            self.pid = self.transport.pid
             
-            # GDB 초기화 대기
-            await asyncio.sleep(1)
+            # 초기 옵션(-ex 등)으로 생성된 브레이크포인트를 상태 캐시에 반영
+            await self.transport.execute("-break-list", startup_timeout)
             
             # 원격 연결 설정
             if remote:
                 await self._connect_remote(remote)
+            self.startup_time = time.perf_counter() - started
                 
             self.target = target
             self.remote = remote
+            if cache is not None:
+                await self._check_index_cache(startup_timeout)
+            if cache is not None and self.index_cache_state in ("cold", "warm") and not self.from_pool:
+                self.index_cache_times = cache.record_startup(
+                    self.build_id, self.index_cache_state == "warm", self.startup_time
+                )
             
-            logger.info("GDB 시작 성공")
+            logger.info(f"GDB 시작 성공 (준비 시간: {self.startup_time * 1000:.1f}ms)")
             return True, None
             
         except Exception as e:
             logger.error(f"GDB 시작 실패: {e}")
-            return False, str(e)
+            if self.transport:
+                await self.transport.close(timeout=0)
+                self.transport = None
+                self.pid = None
+            return False, str(e) or type(e).__name__
     
-    async def _connect_remote(self, remote: str) -> None:
-        """원격 연결을 설정합니다."""
+    def _index_cache(self, target: Optional[str], build_id: Optional[str] = None) -> Optional[IndexCache]:
+        """타겟의 빌드 ID로 index-cache를 준비합니다. 사용할 수 없으면 None.
+
+        GDB index-cache는 빌드 ID로만 파일을 찾으므로 빌드 ID가 없는 ELF는 제외합니다.
+        """
+        self.build_id = build_id or IndexCache.build_id(target)
+        if not DEFAULT_INDEX_CACHE_DIR or self.build_id is None:
+            return None
+        cache = IndexCache(DEFAULT_INDEX_CACHE_DIR)
+        self.index_cache_state = "warm" if cache.is_warm(self.build_id) else "cold"
+        return cache
+
+    def _reset_index_cache(self) -> None:
+        """빌드 ID와 index-cache 상태, 시작 시간 기록을 비웁니다."""
+        self.build_id = None
+        self.index_cache_state = None
+        self.index_cache_times = {}
+
+    async def _check_index_cache(self, timeout: float) -> None:
+        """GDB에서 index-cache가 실제로 켜졌는지 `show index-cache`로 확인합니다.
+
+        켜지지 않았으면(지원하지 않는 GDB 등) cold로 기록하지 않고 상태를 off로 둡니다.
+        """
         try:
-            await self.execute_command(f"target remote {remote}")
-            logger.info(f"원격 연결 성공: {remote}")
+            response = await self.transport.execute("show index-cache", timeout)
         except Exception as e:
-            logger.error(f"원격 연결 실패: {e}")
-            raise
+            logger.warning(f"index-cache 상태를 확인하지 못했습니다: {e}")
+            return
+        output = "".join(record["payload"] for record in response.stream_output("console"))
+        if IndexCache.parse_enabled(output) is False:
+            logger.warning(f"GDB에서 index-cache가 켜지지 않았습니다: {output.strip()}")
+            self.index_cache_state = "off"
     
+    async def _connect_remote(self, remote: str) -> None:
+        """원격 연결을 설정합니다."""
+        success, _, error = await self.execute_command(f"target remote {remote}")
+        if not success:
+            logger.error(f"원격 연결 실패: {error}")
+            raise RuntimeError(f"원격 연결 실패: {error}")
+        logger.info(f"원격 연결 성공: {remote}")
+    
+    @traced("GDBManager.execute_command", capture=("command",))
     async def execute_command(self, command: str, timeout: float = 30.0) -> Tuple[bool, str, Optional[str]]:
         """GDB 명령을 실행합니다."""
-        if not self.controller:
+        if not self.is_running():
             return False, "", "GDB가 시작되지 않았습니다"
             
+        # 타겟이 멈춰 있는 동안 같은 정지 세대의 조회 결과는 캐시에서 응답
+        cacheable = self._is_cacheable(command)
+        epoch = self.state.epoch
+        if cacheable:
+            cached = self._cached_result(command, epoch)
+            if cached is not None:
+                return cached
+                
         try:
             logger.info(f"GDB 명령 실행: {command}")
             
             # 명령 실행
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.controller.write, command, timeout
-            )
+            response = await self.transport.execute(command, timeout)
+            result = self._format_response(command, response)
+            if cacheable:
+                self._cache_result(command, epoch, result)
+            return result
             
-            # 응답 처리
-            output_lines = []
-            for msg in response:
-                if msg["type"] == "console":
-                    output_lines.append(msg["payload"])
-                elif msg["type"] == "log":
-                    output_lines.append(f"[LOG] {msg['payload']}")
-                elif msg["type"] == "error":
-                    return False, "\n".join(output_lines), msg["payload"]
-                    
-            output = "\n".join(output_lines)
-            self._output_buffer.append(f"$ {command}\n{output}")
-            
-            return True, output, None
-            
-        except GdbTimeoutError:
+        except asyncio.TimeoutError:
             error_msg = f"GDB 명령 타임아웃: {command}"
             logger.error(error_msg)
             return False, "", error_msg
@@ -204,44 +739,313 @@ class GDBManager:
             logger.error(error_msg)
             return False, "", error_msg
     
-    async def get_status(self) -> Dict[str, Any]:
-        """GDB 상태를 가져옵니다."""
-        if not self.controller:
-            return {
-                "running": False,
-                "pid": None,
-                "target": None,
-                "breakpoints": [],
-                "current_frame": None
-            }
+    @traced("GDBManager.execute_until_stopped", capture=("command",))
+    async def execute_until_stopped(
+        self, command: str, timeout: float = 30.0,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> Tuple[bool, str, Optional[str], Optional[Dict[str, Any]]]:
+        """실행 명령을 보내고 타겟이 다시 멈출 때(*stopped)까지 기다립니다.
+
+        실행 중 도착하는 콘솔/타겟 출력은 on_output으로 즉시 전달됩니다.
+        반환값은 (성공 여부, 출력, 에러, *stopped 레코드 페이로드)입니다.
+        """
+        if not self.is_running():
+            return False, "", "GDB가 시작되지 않았습니다", None
             
+        loop = asyncio.get_event_loop()
+        stopped: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        output_lines: List[str] = []
+        resumed = False
+        
+        def emit(text: str) -> None:
+            output_lines.append(text)
+            if on_output is not None:
+                on_output(text)
+        
+        def listener(record: Dict[str, Any]) -> None:
+            nonlocal resumed
+            if record["type"] == "notify":
+                if record["message"] == "running":
+                    resumed = True
+                elif record["message"] == "stopped" and not stopped.done():
+                    stopped.set_result(record.get("payload") or {})
+            elif resumed and record["type"] in ("console", "target", "log"):
+                # 재개 이후 다른 명령에 속하지 않는 출력만 이 실행의 출력으로 봅니다
+                if record["type"] == "target" or self.transport.in_flight == 0:
+                    emit(record["payload"])
+        
+        logger.info(f"GDB 실행 명령: {command}")
+        deadline = loop.time() + timeout
+        self.transport.add_listener(listener)
         try:
-            # 브레이크포인트 정보 가져오기
-            success, output, error = await self.execute_command("info breakpoints")
-            breakpoints = []
-            if success:
-                # 브레이크포인트 파싱 (간단한 구현)
-                lines = output.split('\n')
-                for line in lines:
-                    if 'breakpoint' in line.lower() and 'at' in line:
-                        breakpoints.append({"info": line.strip()})
-            
-            # 현재 프레임 정보 가져오기
-            success, output, error = await self.execute_command("info frame")
-            current_frame = None
-            if success:
-                current_frame = {"info": output.strip()}
+            response = await self.transport.execute(command, timeout)
+            for record in response.stream_output("console", "log"):
+                emit(record["payload"])
+            if response.is_error:
+                return False, "".join(output_lines).rstrip("\n"), response.error_message, None
+            stop_record = None
+            if response.message == "running":
+                stop_record = await asyncio.wait_for(stopped, max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            output = "".join(output_lines).rstrip("\n")
+            return False, output, f"타겟이 {timeout}초 안에 멈추지 않았습니다: {command}", None
+        except Exception as e:
+            error_msg = f"GDB 명령 실행 실패: {e}"
+            logger.error(error_msg)
+            return False, "".join(output_lines).rstrip("\n"), error_msg, None
+        finally:
+            self.transport.remove_listener(listener)
+            
+        output = "".join(output_lines).rstrip("\n")
+        self.history.append(command, output)
+        return True, output, None, stop_record
+    
+    @traced("GDBManager.execute_mi", capture=("command",))
+    async def execute_mi(self, command: str,
+                         timeout: float = 30.0) -> Tuple[bool, Optional[MIResponse], Optional[str]]:
+        """GDB 명령을 실행하고 파싱된 MI 응답을 그대로 반환합니다."""
+        if not self.is_running():
+            return False, None, "GDB가 시작되지 않았습니다"
+            
+        cacheable = self._is_cacheable(command)
+        epoch = self.state.epoch
+        if cacheable:
+            cached = self.cache.get(epoch, ("mi", normalize_command(command)))
+            if cached is not None:
+                self.history.append(command, json.dumps(cached.payload, ensure_ascii=False))
+                return True, cached, None
                 
-            return {
-                "running": True,
-                "pid": self.pid,
-                "target": self.target,
-                "breakpoints": breakpoints,
-                "current_frame": current_frame
-            }
+        try:
+            logger.info(f"GDB MI 명령 실행: {command}")
+            response = await self.transport.execute(command, timeout)
+        except asyncio.TimeoutError:
+            error_msg = f"GDB 명령 타임아웃: {command}"
+            logger.error(error_msg)
+            return False, None, error_msg
+        except Exception as e:
+            error_msg = f"GDB 명령 실행 실패: {e}"
+            logger.error(error_msg)
+            return False, None, error_msg
+            
+        if is_state_changing_command(command):
+            self.state.bump_epoch()
+        if response.is_error:
+            return False, response, response.error_message
+        self.state.apply_command(command, response.payload)
+        if cacheable and self.state.epoch == epoch:
+            self.cache.put(epoch, ("mi", normalize_command(command)), response)
+        self.history.append(command, json.dumps(response.payload, ensure_ascii=False))
+        return True, response, None
+    
+    @traced("GDBManager.execute_commands")
+    async def execute_commands(self, commands: List[str],
+                               timeout: float = 30.0) -> List[Tuple[bool, str, Optional[str]]]:
+        """여러 GDB 명령을 파이프라이닝하여 실행합니다.
+
+        명령은 토큰을 붙여 한 번에 전송되며, 각 명령의 결과는 입력 순서대로 반환됩니다.
+        execute_command와 같이 정지 세대 캐시를 사용합니다. 다만 앞선 명령이 타겟
+        상태를 바꿀 수 있으므로, 앞의 명령이 모두 캐시 가능한 조회 명령일 때만 캐시로
+        응답하거나 결과를 캐시에 넣습니다.
+        """
+        if not self.is_running():
+            return [(False, "", "GDB가 시작되지 않았습니다") for _ in commands]
+            
+        epoch = self.state.epoch
+        results: List[Optional[Tuple[bool, str, Optional[str]]]] = [None] * len(commands)
+        # 캐시 적용 대상 여부 (앞선 명령이 모두 조회 명령인 캐시 가능 명령)
+        cacheable = []
+        read_only = True
+        for index, command in enumerate(commands):
+            read_only = read_only and self._is_cacheable(command)
+            cacheable.append(read_only)
+            if read_only:
+                results[index] = self._cached_result(command, epoch)
+        pending = [index for index, result in enumerate(results) if result is None]
+        
+        if pending:
+            try:
+                logger.info(f"GDB 명령 {len(pending)}개 파이프라인 실행 (캐시 응답 {len(commands) - len(pending)}개)")
+                responses = await self.transport.execute_many([commands[index] for index in pending], timeout)
+            except Exception as e:
+                error_msg = f"GDB 명령 실행 실패: {e}"
+                logger.error(error_msg)
+                responses = [e] * len(pending)
+            
+            for index, response in zip(pending, responses):
+                command = commands[index]
+                if isinstance(response, asyncio.TimeoutError):
+                    results[index] = (False, "", f"GDB 명령 타임아웃: {command}")
+                elif isinstance(response, Exception):
+                    results[index] = (False, "", f"GDB 명령 실행 실패: {response}")
+                else:
+                    results[index] = self._format_response(command, response)
+                    if cacheable[index]:
+                        self._cache_result(command, epoch, results[index])
+        return results
+    
+    @traced("GDBManager.execute_batch")
+    async def execute_batch(self, commands: List[str], timeout: float = 30.0,
+                            stop_on_error: bool = False) -> List[Tuple[bool, str, Optional[str]]]:
+        """명령 목록을 순서대로 실행합니다.
+
+        stop_on_error가 꺼져 있으면 모든 명령을 파이프라이닝하여 한 번에 보내고,
+        켜져 있으면 실패한 명령 이후를 실행하지 않도록 하나씩 실행합니다.
+        두 경우 모두 같은 정지 세대 캐시를 사용하고 상태 변경 명령은 세대를 올립니다.
+        """
+        if not stop_on_error:
+            return await self.execute_commands(commands, timeout * max(len(commands), 1))
             
+        results = []
+        for command in commands:
+            result = await self.execute_command(command, timeout)
+            results.append(result)
+            if not result[0]:
+                break
+        return results
+    
+    @traced("GDBManager.read_memory", capture=("address", "length"))
+    async def read_memory(self, address: str, length: int,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE, timeout: float = 30.0
+                          ) -> Tuple[bool, Optional[int], Optional[bytearray], List[Tuple[int, int]], Optional[str]]:
+        """타겟 메모리를 읽습니다.
+
+        (성공 여부, 시작 주소, 데이터, 읽지 못한 구간 목록, 에러)를 반환합니다.
+        """
+        if not self.is_running():
+            return False, None, None, [], "GDB가 시작되지 않았습니다"
+        if chunk_size <= 0:
+            return False, None, None, [], "chunk_size는 0보다 커야 합니다"
+
+        try:
+            start = await resolve_address(self.transport, address, timeout)
+            logger.info(f"메모리 읽기: {start:#x} ({length} 바이트, 청크 {chunk_size})")
+            data, unreadable = await read_memory(self.transport, start, length, chunk_size, timeout)
+        except MemoryReadError as e:
+            return False, None, None, [], str(e)
+        except asyncio.TimeoutError:
+            return False, None, None, [], f"메모리 읽기 타임아웃: {address}"
+        except Exception as e:
+            error_msg = f"메모리 읽기 실패: {e}"
+            logger.error(error_msg)
+            return False, None, None, [], error_msg
+
+        self.history.append(f"-data-read-memory-bytes {start:#x} {length}",
+                            f"{len(data)} 바이트 읽음, 읽지 못한 구간 {len(unreadable)}개")
+        return True, start, data, unreadable, None
+
+    async def get_symbol_index(self) -> ElfSymbolIndex:
+        """타겟 ELF의 심볼 색인을 반환합니다. 처음 호출할 때 한 번만 만듭니다."""
+        if not self.target:
+            raise ValueError("심볼 색인을 만들 타겟 ELF가 없습니다")
+        if self._symbol_index is None:
+            self._symbol_index = METRICS.run_in_executor(load_symbol_index, self.target)
+        try:
+            return await asyncio.shield(self._symbol_index)
+        except Exception:
+            self._symbol_index = None
+            raise
+
+    async def lookup_symbols(self, addresses: List[int],
+                             timeout: float = 30.0) -> Dict[int, Optional[str]]:
+        """주소를 포함하는 심볼 이름을 조회합니다. 조회하지 못한 주소는 None입니다.
+
+        타겟 ELF의 심볼 색인을 우선 사용하고, 없으면 GDB `info symbol`로 조회합니다.
+        """
+        if self.target:
+            try:
+                index = await self.get_symbol_index()
+                return {address: index.symbolize(address) for address in addresses}
+            except Exception as e:
+                logger.warning(f"심볼 색인을 사용할 수 없어 GDB로 조회합니다: {e}")
+        if not self.is_running() or not addresses:
+            return {address: None for address in addresses}
+        try:
+            return await lookup_symbols(self.transport, addresses, timeout)
         except Exception as e:
-            logger.error(f"GDB 상태 조회 실패: {e}")
+            logger.warning(f"심볼 조회 실패: {e}")
+            return {address: None for address in addresses}
+
+    @traced("GDBManager.monitor", capture=("command",))
+    async def monitor(self, command: str, timeout: float = 30.0) -> Tuple[bool, str, Optional[str]]:
+        """원격 스텁의 모니터 명령(`monitor ...`)을 실행하고 출력을 반환합니다.
+
+        QEMU 모니터는 명령이 실패해도 ^done으로 응답하고 "Error: ..."를
+        출력하므로, 이런 출력도 실패로 처리합니다.
+        """
+        success, response, error = await self.execute_mi(f"monitor {command}", timeout)
+        output = ""
+        if response is not None:
+            output = "".join(record["payload"] for record in response.stream_output("console", "target"))
+        if success:
+            for line in output.splitlines():
+                if line.startswith("Error"):
+                    return False, output, line
+        return success, output, error
+
+    @traced("GDBManager.resync_target")
+    async def resync_target(self, timeout: float = 30.0) -> Optional[str]:
+        """GDB 밖에서 타겟 상태가 바뀐 뒤(예: 머신 스냅샷 복원) GDB의 상태를 다시 맞춥니다.
+
+        GDB 레지스터 캐시를 비우고 정지 세대를 올린 뒤 현재 프레임을 다시 읽습니다.
+        브레이크포인트는 원격 스텁에 남아 있으므로 다시 설정하지 않습니다.
+        """
+        success, _, error = await self.execute_mi("maintenance flush register-cache", timeout)
+        if not success:
+            # GDB 8 이전 버전
+            success, _, error = await self.execute_mi("flushregs", timeout)
+        self.state.bump_epoch()
+        if not success:
+            return error
+        self.state.execution_state = "stopped"
+        success, response, _ = await self.execute_mi("-stack-info-frame", timeout)
+        if success and response is not None and "frame" in (response.payload or {}):
+            self.state.current_frame = response.payload["frame"]
+        return None
+
+    def _is_cacheable(self, command: str) -> bool:
+        """정지 세대 캐시로 응답할 수 있는 명령인지 확인합니다."""
+        return self.state.execution_state != "running" and is_cacheable_command(command)
+
+    def _cached_result(self, command: str, epoch: int) -> Optional[Tuple[bool, str, Optional[str]]]:
+        """정지 세대 캐시에 있는 텍스트 결과를 반환합니다. 캐시로 응답한 명령도 이력에 남깁니다."""
+        cached = self.cache.get(epoch, ("text", normalize_command(command)))
+        if cached is not None:
+            self.history.append(command, cached[1])
+        return cached
+
+    def _cache_result(self, command: str, epoch: int, result: Tuple[bool, str, Optional[str]]) -> None:
+        """성공한 결과를 명령 전송 시점의 정지 세대가 그대로일 때만 캐시에 넣습니다."""
+        if result[0] and self.state.epoch == epoch:
+            self.cache.put(epoch, ("text", normalize_command(command)), result)
+
+    def _format_response(self, command: str, response: MIResponse) -> Tuple[bool, str, Optional[str]]:
+        """MI 응답을 (성공 여부, 출력, 에러) 형태로 변환합니다."""
+        # 쓰기 명령은 =memory-changed 등의 알림이 없을 수 있으므로 직접 세대를 올립니다
+        if is_state_changing_command(command):
+            self.state.bump_epoch()
+        output_lines = []
+        for msg in response.stream_output("console", "log"):
+            if msg["type"] == "console":
+                output_lines.append(msg["payload"])
+            else:
+                output_lines.append(f"[LOG] {msg['payload']}")
+                
+        output = "".join(output_lines).rstrip("\n")
+        if response.is_error:
+            return False, output, response.error_message
+            
+        self.state.apply_command(command, response.payload)
+        self.history.append(command, output)
+        
+        return True, output, None
+    
+    @traced("GDBManager.get_status")
+    async def get_status(self) -> Dict[str, Any]:
+        """GDB 상태를 가져옵니다.
+
+        MI 비동기 레코드로 갱신되는 상태 캐시에서 응답하므로 GDB 명령을 보내지 않습니다.
+        """
+        if not self.is_running():
             return {
                 "running": False,
                 "pid": None,
@@ -249,25 +1053,37 @@ class GDBManager:
                 "breakpoints": [],
                 "current_frame": None
             }
+            
+        status = self.state.snapshot()
+        status.update({
+            "running": True,
+            "pid": self.pid,
+            "target": self.target,
+            "cache": self.cache.stats(),
+        })
+        return status
     
+    @traced("GDBManager.stop")
     async def stop(self) -> Tuple[bool, Optional[str]]:
         """GDB 프로세스를 중지합니다."""
-        if not self.controller:
+        if not self.transport:
             return True, None
             
         try:
             logger.info("GDB 중지")
             
             # GDB 종료
-            await self.execute_command("quit")
+            await self.transport.close()
             
-            # 컨트롤러 정리
-            self.controller.exit()
-            self.controller = None
+            # 전송 계층 정리
+            self.transport = None
             self.pid = None
             self.target = None
             self.remote = None
-            self._output_buffer.clear()
+            self.startup_time = None
+            self._symbol_index = None
+            self._reset_index_cache()
+            self.history.clear()
             
             return True, None
             
@@ -277,9 +1093,17 @@ class GDBManager:
     
     def is_running(self) -> bool:
         """GDB가 실행 중인지 확인합니다."""
-        return self.controller is not None
+        return self.transport is not None and self.transport.is_alive()
     
     def get_output_buffer(self) -> List[str]:
-        """출력 버퍼를 반환합니다."""
-        return self._output_buffer.copy()
+        """메모리에 남아 있는 출력 기록을 반환합니다."""
+        return [f"$ {entry.command}\n{entry.output}" for entry in self.history]
+    
+    @staticmethod
+    def _spill_path() -> Optional[str]:
+        """출력 기록 스필 파일 경로를 반환합니다. 설정되지 않았으면 None."""
+        if not DEFAULT_SPILL_DIR:
+            return None
+        filename = f"gdb-history-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.jsonl"
+        return os.path.join(DEFAULT_SPILL_DIR, filename)
 
@@ -0,0 +1,199 @@
+"""asyncio 기반 QEMU QMP 클라이언트 모듈."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .tracing import detached_task, span
+
+logger = logging.getLogger(__name__)
+
+# 최근 QMP 이벤트를 보관하는 최대 개수
+_EVENT_HISTORY_SIZE = 256
+
+# 접속 재시도 간격 (초)
+_CONNECT_RETRY_INTERVAL = 0.01
+
+# QMP 메시지 한 줄의 최대 크기 (HMP 출력, query-* 결과 등이 한 줄로 옵니다)
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+EventListener = Callable[[Dict[str, Any]], None]
+
+
+class QMPError(Exception):
+    """QMP 명령이 error로 응답했을 때 발생합니다."""
+
+    def __init__(self, error_class: str, desc: str):
+        super().__init__(f"{error_class}: {desc}")
+        self.error_class = error_class
+        self.desc = desc
+
+
+class QMPClosed(Exception):
+    """QMP 연결이 끊어져 명령을 처리할 수 없을 때 발생합니다."""
+
+
+class QMPClient:
+    """유닉스 소켓으로 QEMU QMP 서버에 접속하는 클라이언트.
+
+    명령마다 id를 붙여 응답과 대응시키므로 여러 명령을 동시에 보낼 수 있고,
+    응답 사이에 도착하는 비동기 이벤트(STOP, RESUME, RESET 등)는 등록된
+    리스너에 전달하고 최근 이벤트 목록에 보관합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.greeting: Optional[Dict[str, Any]] = None
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=_EVENT_HISTORY_SIZE)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._pending: Dict[int, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._next_id = 1
+        self._listeners: List[EventListener] = []
+        self._closed = False
+        # 읽기 루프가 끝난 이유 (연결이 끊어졌을 때 명령 실패 메시지로 사용)
+        self.error: Optional[str] = None
+
+    async def connect(self, timeout: float = 5.0) -> None:
+        """QMP 소켓에 접속하고 capabilities 협상을 마칩니다.
+
+        QEMU가 아직 소켓을 만들지 않았으면 타임아웃까지 재시도합니다.
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                self._reader, self._writer = await asyncio.open_unix_connection(self.path, limit=_STREAM_LIMIT)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.perf_counter() >= deadline:
+                    raise asyncio.TimeoutError(f"QMP 접속 타임아웃: {self.path}")
+                await asyncio.sleep(_CONNECT_RETRY_INTERVAL)
+
+        line = await asyncio.wait_for(self._reader.readline(), max(deadline - time.perf_counter(), 0.1))
+        if not line:
+            raise QMPClosed("QMP 서버가 연결을 닫았습니다")
+        self.greeting = json.loads(line).get("QMP")
+        self._reader_task = detached_task(self._read_loop())
+        await self.execute("qmp_capabilities", timeout=max(deadline - time.perf_counter(), 0.1))
+
+    def add_listener(self, listener: EventListener) -> None:
+        """QMP 이벤트를 받을 콜백을 등록합니다."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: EventListener) -> None:
+        """등록된 콜백을 제거합니다."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def is_connected(self) -> bool:
+        """QMP 연결이 살아 있는지 확인합니다."""
+        return (
+            not self._closed
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    async def execute(self, command: str, arguments: Optional[Dict[str, Any]] = None,
+                      timeout: Optional[float] = None) -> Any:
+        """QMP 명령을 보내고 return 값을 반환합니다. error 응답이면 QMPError를 발생시킵니다."""
+        if self._closed or self._writer is None:
+            raise QMPClosed("QMP 연결이 닫혀 있습니다")
+        request_id = self._next_id
+        self._next_id += 1
+        request: Dict[str, Any] = {"execute": command, "id": request_id}
+        if arguments:
+            request["arguments"] = arguments
+        future = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            with span("qmp.write", "io", command=command):
+                self._writer.write(json.dumps(request).encode() + b"\n")
+                await self._writer.drain()
+            with span("qmp.wait", "io", command=command):
+                response = await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        if "error" in response:
+            error = response["error"]
+            raise QMPError(error.get("class", "GenericError"), error.get("desc", ""))
+        return response.get("return")
+
+    async def human_monitor_command(self, command_line: str,
+                                    timeout: Optional[float] = None) -> str:
+        """HMP 명령을 실행하고 출력을 반환합니다.
+
+        HMP는 명령이 실패해도 "Error: ..."를 출력으로 돌려주므로 이를 QMPError로 바꿉니다.
+        """
+        output = await self.execute("human-monitor-command", {"command-line": command_line}, timeout)
+        output = output or ""
+        for line in output.splitlines():
+            if line.startswith("Error"):
+                raise QMPError("GenericError", line)
+        return output
+
+    async def close(self) -> None:
+        """연결을 닫고 대기 중인 명령을 실패시킵니다."""
+        self._closed = True
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._fail_pending(QMPClosed("QMP 연결이 닫혔습니다"))
+
+    async def _read_loop(self) -> None:
+        """QMP 메시지를 읽어 응답과 이벤트로 분배합니다.
+
+        연결이 끊어지거나 읽기에 실패하면 이유를 error에 남기고 대기 중인 명령을 실패시킵니다.
+        """
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    if not self._closed:
+                        self.error = "QMP 서버가 연결을 닫았습니다"
+                        logger.warning(self.error)
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    logger.warning(f"QMP 메시지를 파싱하지 못했습니다: {line!r}")
+                    continue
+                if "event" in message:
+                    self._notify(message)
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 한 줄이 _STREAM_LIMIT를 넘으면 ValueError가 발생하며, 이후 응답과 id를 맞출 수 없습니다
+            self.error = f"QMP 읽기 실패: {e}"
+            logger.error(self.error)
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._fail_pending(QMPClosed(self.error or "QMP 연결이 끊어졌습니다"))
+
+    def _notify(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"QMP 이벤트 리스너 오류: {e}")
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
@@ -0,0 +1,621 @@
+"""GDB 원격 시리얼 프로토콜(RSP) 스텁 시뮬레이터 모듈.
+
+QEMU나 실제 보드 없이 `target remote`로 접속할 수 있는 가벼운 Cortex-M
+타겟을 같은 이벤트 루프 안에서 제공합니다. 명령어를 해석하지는 않으며,
+레지스터 파일과 메모리 맵, 브레이크포인트, 스텝 실행만 흉내 냅니다.
+응답이 결정적이므로 부하 테스트와 MI/세션 경로의 벤치마크를 QEMU 시간과
+분리해서 측정할 수 있습니다.
+
+사용법:
+    python -m gdb_mcp.rsp_stub --port 3333 --elf build/firmware.elf
+    gdb -ex "target remote localhost:3333"
+"""
+
+import argparse
+import asyncio
+import copy
+import logging
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+from .elf import ElfFile
+
+logger = logging.getLogger(__name__)
+
+# 기본 메모리 맵 (이름, 시작 주소, 크기): Cortex-M 플래시와 SRAM
+DEFAULT_MEMORY_MAP = (
+    ("flash", 0x00000000, 256 * 1024),
+    ("sram", 0x20000000, 64 * 1024),
+)
+
+# 레지스터 이름 (원격 프로토콜 레지스터 번호 순서)
+REGISTER_NAMES = tuple(f"r{index}" for index in range(13)) + ("sp", "lr", "pc", "xpsr")
+
+# 패킷 최대 크기 (qSupported로 알림)
+_PACKET_SIZE = 0x4000
+
+# xPSR의 Thumb 상태 비트
+_XPSR_THUMB = 0x01000000
+
+# 한 번의 스텝이 진행하는 명령어 길이 (Thumb)
+_STEP_SIZE = 2
+
+# 메모리 범위 밖 접근 시 응답 (EFAULT)
+_ERROR_FAULT = "E0e"
+
+# 잘못된 패킷 형식에 대한 응답
+_ERROR_INVALID = "E01"
+
+# 인터럽트 요청 바이트 (Ctrl-C)
+_INTERRUPT = 0x03
+
+# ELF 섹션 상수 (SHT_PROGBITS, SHF_ALLOC)
+_SHT_PROGBITS = 1
+_SHF_ALLOC = 0x2
+
+_TARGET_XML = """<?xml version="1.0"?>
+<!DOCTYPE target SYSTEM "gdb-target.dtd">
+<target version="1.0">
+  <architecture>arm</architecture>
+  <feature name="org.gnu.gdb.arm.m-profile">
+{registers}
+  </feature>
+</target>
+"""
+
+
+def _build_target_xml() -> str:
+    lines = []
+    for name in REGISTER_NAMES:
+        kind = {"sp": ' type="data_ptr"', "lr": "", "pc": ' type="code_ptr"'}.get(name, "")
+        lines.append(f'    <reg name="{name}" bitsize="32"{kind}/>')
+    return _TARGET_XML.format(registers="\n".join(lines))
+
+
+TARGET_XML = _build_target_xml()
+
+
+class MemoryRegion:
+    """시작 주소와 바이트 배열로 이루어진 메모리 영역."""
+
+    def __init__(self, name: str, base: int, size: int):
+        self.name = name
+        self.base = base
+        self.data = bytearray(size)
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.data)
+
+    def contains(self, address: int) -> bool:
+        return self.base <= address < self.end
+
+
+class StubTarget:
+    """스텁이 흉내 내는 타겟 상태 (레지스터, 메모리, 브레이크포인트, 스냅샷).
+
+    스텝은 PC를 명령어 하나 길이만큼 옮기고, 계속 실행은 앞쪽에 있는 가장
+    가까운 브레이크포인트로 바로 이동합니다. 브레이크포인트가 없으면
+    인터럽트가 올 때까지 실행 중인 것으로 봅니다.
+    """
+
+    def __init__(self, memory_map=DEFAULT_MEMORY_MAP):
+        self.regions = [MemoryRegion(name, base, size) for name, base, size in memory_map]
+        self.registers = [0] * len(REGISTER_NAMES)
+        self.breakpoints: Set[int] = set()
+        self.snapshots: Dict[str, Tuple[List[int], List[bytes]]] = {}
+        # 지금까지 실행한 명령어 수
+        self.instructions = 0
+        self.reset()
+
+    def copy(self) -> "StubTarget":
+        """같은 내용을 가진 독립된 타겟을 만듭니다."""
+        return copy.deepcopy(self)
+
+    def reset(self) -> None:
+        """벡터 테이블에서 초기 SP와 PC를 읽어 레지스터를 초기화합니다."""
+        self.registers = [0] * len(REGISTER_NAMES)
+        vector = self.read_memory(self.regions[0].base, 8) if self.regions else None
+        sp, pc = struct.unpack("<II", vector) if vector else (0, 0)
+        if sp == 0 and len(self.regions) > 1:
+            sp = self.regions[1].end
+        self.registers[13] = sp
+        self.registers[15] = pc & ~1
+        self.registers[16] = _XPSR_THUMB
+
+    def load_elf(self, path: str) -> int:
+        """ELF의 로드 섹션을 메모리에 쓰고 레지스터를 초기화합니다. 쓴 바이트 수를 반환합니다."""
+        loaded = 0
+        with open(path, "rb") as f:
+            elf = ElfFile(f)
+            for section in elf.sections:
+                if (section["type"] != _SHT_PROGBITS or not section["flags"] & _SHF_ALLOC
+                        or section["size"] == 0):
+                    continue
+                if not self.write_memory(section["addr"], elf.section_data(section)):
+                    logger.warning(f"메모리 맵 밖의 섹션을 건너뜁니다: {section.get('name')} (0x{section['addr']:08x})")
+                    continue
+                loaded += section["size"]
+        self.reset()
+        return loaded
+
+    def _region(self, address: int, length: int) -> Optional[MemoryRegion]:
+        for region in self.regions:
+            if region.contains(address) and address + length <= region.end:
+                return region
+        return None
+
+    def read_memory(self, address: int, length: int) -> Optional[bytes]:
+        """메모리를 읽습니다. 영역 끝을 넘으면 영역 안의 부분만, 영역 밖이면 None을 반환합니다."""
+        for region in self.regions:
+            if region.contains(address):
+                offset = address - region.base
+                return bytes(region.data[offset:offset + length])
+        return None
+
+    def write_memory(self, address: int, data: bytes) -> bool:
+        """메모리에 씁니다. 한 영역 안에 들어가지 않으면 False를 반환합니다."""
+        region = self._region(address, len(data))
+        if region is None:
+            return False
+        offset = address - region.base
+        region.data[offset:offset + len(data)] = data
+        return True
+
+    @property
+    def pc(self) -> int:
+        return self.registers[15]
+
+    @pc.setter
+    def pc(self, value: int) -> None:
+        self.registers[15] = value & 0xFFFFFFFF
+
+    def step(self) -> None:
+        """명령어 하나를 실행한 것으로 처리합니다."""
+        self.pc += _STEP_SIZE
+        self.instructions += 1
+
+    def run_to_breakpoint(self) -> bool:
+        """앞쪽의 가장 가까운 브레이크포인트로 이동합니다. 없으면 False를 반환합니다."""
+        pc = self.pc
+        ahead = [address for address in self.breakpoints
+                 if address > pc and (address - pc) % _STEP_SIZE == 0]
+        if not ahead:
+            return False
+        target = min(ahead)
+        self.instructions += (target - pc) // _STEP_SIZE
+        self.pc = target
+        return True
+
+    def save(self, name: str) -> None:
+        """레지스터와 메모리를 이름이 붙은 스냅샷으로 저장합니다."""
+        self.snapshots[name] = (list(self.registers), [bytes(region.data) for region in self.regions])
+
+    def load(self, name: str) -> bool:
+        """스냅샷으로 되돌립니다. 스냅샷이 없으면 False를 반환합니다."""
+        snapshot = self.snapshots.get(name)
+        if snapshot is None:
+            return False
+        registers, memory = snapshot
+        self.registers = list(registers)
+        for region, data in zip(self.regions, memory):
+            region.data[:] = data
+        return True
+
+
+def checksum(payload: bytes) -> int:
+    """RSP 패킷 체크섬을 계산합니다."""
+    return sum(payload) & 0xFF
+
+
+def escape_binary(data: bytes) -> bytes:
+    """바이너리 응답에서 특수 문자를 이스케이프합니다."""
+    out = bytearray()
+    for byte in data:
+        if byte in b"#$}*":
+            out += bytes((0x7D, byte ^ 0x20))
+        else:
+            out.append(byte)
+    return bytes(out)
+
+
+def unescape_binary(data: bytes) -> bytes:
+    """X 패킷 등의 바이너리 데이터에서 이스케이프를 해제합니다."""
+    out = bytearray()
+    escaped = False
+    for byte in data:
+        if escaped:
+            out.append(byte ^ 0x20)
+            escaped = False
+        elif byte == 0x7D:
+            escaped = True
+        else:
+            out.append(byte)
+    return bytes(out)
+
+
+def _hex_word(value: int) -> str:
+    return struct.pack("<I", value & 0xFFFFFFFF).hex()
+
+
+class RSPConnection:
+    """GDB 연결 하나를 처리합니다. 연결마다 별도의 타겟 상태를 사용합니다."""
+
+    def __init__(self, stub: "RSPStub", target: StubTarget,
+                 reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stub = stub
+        self.target = target
+        self.reader = reader
+        self.writer = writer
+        self.ack = True
+        self.running = False
+        self._buffer = bytearray()
+
+    async def serve(self) -> None:
+        """연결이 끊기거나 GDB가 분리될 때까지 패킷을 처리합니다."""
+        try:
+            while True:
+                chunk = await self.reader.read(_PACKET_SIZE)
+                if not chunk:
+                    return
+                self.stub.bytes_in += len(chunk)
+                self._buffer += chunk
+                if not self._process_buffer():
+                    return
+                await self.writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.writer.close()
+
+    def _process_buffer(self) -> bool:
+        """버퍼에 쌓인 완전한 패킷을 모두 처리합니다. 연결을 끝내야 하면 False를 반환합니다."""
+        buffer = self._buffer
+        while buffer:
+            first = buffer[0]
+            if first == _INTERRUPT:
+                del buffer[0]
+                if self.running:
+                    self.running = False
+                    self._send("S02")
+                continue
+            if first != ord("$"):
+                # 확인 응답(+/-)과 패킷 사이의 잡음은 무시합니다
+                del buffer[0]
+                continue
+            end = buffer.find(b"#")
+            if end < 0 or len(buffer) < end + 3:
+                return True
+            payload = bytes(buffer[1:end])
+            received = bytes(buffer[end + 1:end + 3])
+            del buffer[:end + 3]
+            if self.ack:
+                if received.lower() != f"{checksum(payload):02x}".encode():
+                    self._write(b"-")
+                    continue
+                self._write(b"+")
+            self.stub.packets += 1
+            reply = self.handle(payload)
+            if reply is None:
+                return False
+            if reply is not _NO_REPLY:
+                self._send(reply)
+        return True
+
+    def _write(self, data: bytes) -> None:
+        self.stub.bytes_out += len(data)
+        self.writer.write(data)
+
+    def _send(self, reply) -> None:
+        payload = reply.encode() if isinstance(reply, str) else reply
+        self._write(b"$" + payload + b"#" + f"{checksum(payload):02x}".encode())
+
+    def handle(self, payload: bytes):
+        """패킷 하나를 처리하고 응답을 반환합니다.
+
+        응답하지 않아야 하면 _NO_REPLY를, 연결을 끝내야 하면 None을 반환합니다.
+        """
+        if self.running:
+            # all-stop 모드에서는 실행 중에 인터럽트 외의 패킷을 받지 않습니다
+            return _NO_REPLY
+        kind = payload[:1]
+        body = payload[1:]
+        try:
+            handler = _PACKET_HANDLERS.get(kind)
+            if handler is not None:
+                return handler(self, body)
+            return self._handle_query(payload)
+        except (ValueError, IndexError, struct.error):
+            return _ERROR_INVALID
+
+    def _stop_reply(self) -> str:
+        return "S05"
+
+    def _handle_status(self, body: bytes):
+        return self._stop_reply()
+
+    def _handle_read_registers(self, body: bytes):
+        return "".join(_hex_word(value) for value in self.target.registers)
+
+    def _handle_write_registers(self, body: bytes):
+        data = bytes.fromhex(body.decode())
+        count = min(len(data) // 4, len(self.target.registers))
+        for index in range(count):
+            self.target.registers[index] = struct.unpack_from("<I", data, index * 4)[0]
+        return "OK"
+
+    def _handle_read_register(self, body: bytes):
+        index = int(body, 16)
+        if index >= len(self.target.registers):
+            return _ERROR_INVALID
+        return _hex_word(self.target.registers[index])
+
+    def _handle_write_register(self, body: bytes):
+        number, value = body.split(b"=", 1)
+        index = int(number, 16)
+        if index >= len(self.target.registers):
+            return _ERROR_INVALID
+        self.target.registers[index] = struct.unpack("<I", bytes.fromhex(value.decode()).ljust(4, b"\0")[:4])[0]
+        return "OK"
+
+    def _handle_read_memory(self, body: bytes):
+        address, length = (int(field, 16) for field in body.split(b","))
+        data = self.target.read_memory(address, min(length, _PACKET_SIZE // 2))
+        if not data:
+            return _ERROR_FAULT
+        return data.hex()
+
+    def _handle_write_memory(self, body: bytes):
+        header, data = body.split(b":", 1)
+        address, length = (int(field, 16) for field in header.split(b","))
+        data = bytes.fromhex(data.decode())[:length]
+        return "OK" if self.target.write_memory(address, data) else _ERROR_FAULT
+
+    def _handle_write_binary(self, body: bytes):
+        header, data = body.split(b":", 1)
+        address, length = (int(field, 16) for field in header.split(b","))
+        if length == 0:
+            # GDB가 X 패킷 지원 여부를 확인하는 요청
+            return "OK"
+        data = unescape_binary(data)[:length]
+        return "OK" if self.target.write_memory(address, data) else _ERROR_FAULT
+
+    def _handle_insert_breakpoint(self, body: bytes):
+        kind, address, _ = body.split(b",", 2)
+        if kind not in (b"0", b"1"):
+            return ""
+        self.target.breakpoints.add(int(address, 16))
+        return "OK"
+
+    def _handle_remove_breakpoint(self, body: bytes):
+        kind, address, _ = body.split(b",", 2)
+        if kind not in (b"0", b"1"):
+            return ""
+        self.target.breakpoints.discard(int(address, 16))
+        return "OK"
+
+    def _handle_step(self, body: bytes):
+        if body:
+            self.target.pc = int(body, 16)
+        self.target.step()
+        return self._stop_reply()
+
+    def _handle_continue(self, body: bytes):
+        if body:
+            self.target.pc = int(body, 16)
+        if self.target.run_to_breakpoint():
+            return self._stop_reply()
+        self.running = True
+        return _NO_REPLY
+
+    def _handle_thread(self, body: bytes):
+        return "OK"
+
+    def _handle_detach(self, body: bytes):
+        self._send("OK")
+        return None
+
+    def _handle_kill(self, body: bytes):
+        return None
+
+    def _handle_query(self, payload: bytes):
+        """q/Q/v 패킷을 처리합니다. 모르는 패킷에는 빈 응답을 보냅니다."""
+        text = payload.decode(errors="replace")
+        if text.startswith("qSupported"):
+            return f"PacketSize={_PACKET_SIZE:x};qXfer:features:read+;QStartNoAckMode+"
+        if text == "QStartNoAckMode":
+            self._send("OK")
+            self.ack = False
+            return _NO_REPLY
+        if text.startswith("qXfer:features:read:"):
+            return self._read_features(text[len("qXfer:features:read:"):])
+        if text.startswith("qAttached"):
+            return "1"
+        if text == "qC":
+            return "QC1"
+        if text == "qfThreadInfo":
+            return "m1"
+        if text == "qsThreadInfo":
+            return "l"
+        if text.startswith("qSymbol"):
+            return "OK"
+        if text.startswith("qRcmd,"):
+            return self._monitor(bytes.fromhex(text[len("qRcmd,"):]).decode(errors="replace"))
+        if text.startswith("vKill"):
+            return None
+        return ""
+
+    def _read_features(self, request: str) -> str:
+        annex, window = request.split(":", 1)
+        if annex != "target.xml":
+            return "E00"
+        offset, length = (int(field, 16) for field in window.split(","))
+        data = TARGET_XML.encode()[offset:offset + length]
+        prefix = b"l" if offset + length >= len(TARGET_XML.encode()) else b"m"
+        return (prefix + escape_binary(data)).decode("latin-1")
+
+    def _monitor(self, command: str):
+        """monitor 명령을 처리합니다. 출력은 O 패킷으로 보냅니다.
+
+        reset, savevm NAME, loadvm NAME, info registers를 지원합니다.
+        실패는 QEMU처럼 "Error"로 시작하는 출력으로 알립니다.
+        """
+        words = command.split()
+        verb = words[0] if words else ""
+        if verb == "reset" or verb == "system_reset":
+            self.target.reset()
+            output = ""
+        elif verb == "savevm" and len(words) == 2:
+            self.target.save(words[1])
+            output = ""
+        elif verb == "loadvm" and len(words) == 2:
+            if self.target.load(words[1]):
+                output = ""
+            else:
+                output = f"Error: Snapshot '{words[1]}' does not exist\n"
+        elif command.strip() == "info registers":
+            output = "".join(
+                f"{name:>4}={value:08x}\n" for name, value in zip(REGISTER_NAMES, self.target.registers)
+            )
+        else:
+            output = f"Error: unknown command: '{command}'\n"
+        if output:
+            self._send("O" + output.encode().hex())
+        return "OK"
+
+
+# 응답하지 않음을 나타내는 값
+_NO_REPLY = object()
+
+_PACKET_HANDLERS = {
+    b"?": RSPConnection._handle_status,
+    b"g": RSPConnection._handle_read_registers,
+    b"G": RSPConnection._handle_write_registers,
+    b"p": RSPConnection._handle_read_register,
+    b"P": RSPConnection._handle_write_register,
+    b"m": RSPConnection._handle_read_memory,
+    b"M": RSPConnection._handle_write_memory,
+    b"X": RSPConnection._handle_write_binary,
+    b"Z": RSPConnection._handle_insert_breakpoint,
+    b"z": RSPConnection._handle_remove_breakpoint,
+    b"s": RSPConnection._handle_step,
+    b"c": RSPConnection._handle_continue,
+    b"H": RSPConnection._handle_thread,
+    b"D": RSPConnection._handle_detach,
+    b"k": RSPConnection._handle_kill,
+}
+
+
+class RSPStub:
+    """asyncio 기반 RSP 서버.
+
+    각 연결은 template 타겟의 복사본으로 시작하므로, 엔드포인트 하나를
+    여러 세션이 동시에 사용해도 서로 영향을 주지 않습니다.
+    """
+
+    def __init__(self, target: Optional[StubTarget] = None):
+        self.template = target or StubTarget()
+        self.endpoint: Optional[str] = None
+        self.connections: List[RSPConnection] = []
+        # 처리한 패킷 수와 주고받은 바이트 수
+        self.packets = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def start(self, host: str = "localhost", port: int = 0, path: Optional[str] = None) -> str:
+        """서버를 시작하고 GDB가 `target remote`에 사용할 엔드포인트를 반환합니다.
+
+        path를 지정하면 유닉스 소켓에서, 아니면 host:port에서 대기합니다.
+        port가 0이면 빈 포트를 자동으로 고릅니다.
+        """
+        if path:
+            self._server = await asyncio.start_unix_server(self._on_connect, path=path)
+            self.endpoint = path
+        else:
+            self._server = await asyncio.start_server(self._on_connect, host, port)
+            port = self._server.sockets[0].getsockname()[1]
+            self.endpoint = f"{host}:{port}"
+        logger.info(f"RSP 스텁 시작: {self.endpoint}")
+        return self.endpoint
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = RSPConnection(self, self.template.copy(), reader, writer)
+        self.connections.append(connection)
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        try:
+            await connection.serve()
+        finally:
+            self.connections.remove(connection)
+            if task is not None:
+                self._tasks.discard(task)
+
+    async def close(self) -> None:
+        """서버와 모든 연결을 닫습니다."""
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self.connections):
+                connection.writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        # 연결을 닫으면 처리 작업은 EOF를 받고 스스로 끝납니다
+        if self._tasks:
+            _, pending = await asyncio.wait(list(self._tasks), timeout=1.0)
+            for task in pending:
+                task.cancel()
+        if self.endpoint and self.endpoint.startswith("/") and os.path.exists(self.endpoint):
+            os.unlink(self.endpoint)
+        self.endpoint = None
+
+    async def __aenter__(self) -> "RSPStub":
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점."""
+    parser = argparse.ArgumentParser(prog="gdb-mcp-rsp-stub", description="GDB RSP 스텁 시뮬레이터")
+    parser.add_argument("--host", default="localhost", help="대기할 주소 (기본값: localhost)")
+    parser.add_argument("--port", type=int, default=3333, help="대기할 포트 (0이면 자동 할당)")
+    parser.add_argument("--unix", help="TCP 대신 대기할 유닉스 소켓 경로")
+    parser.add_argument("--elf", help="메모리에 미리 올릴 ELF 파일")
+    parser.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)],
+    )
+
+    target = StubTarget()
+    if args.elf:
+        target.load_elf(args.elf)
+
+    async def serve() -> None:
+        stub = RSPStub(target)
+        endpoint = await stub.start(args.host, args.port, args.unix)
+        print(f"RSP 스텁 대기 중: {endpoint}", file=sys.stderr, flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await stub.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
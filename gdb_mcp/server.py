@@ -1,12 +1,19 @@
 """GDB MCP 서버."""
 
 import asyncio
+import base64
+import contextvars
+import itertools
+import json
 import logging
-from typing import Any, Dict, List, Optional
-from mcp.server import Server
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import (
+    CallToolRequest,
     CallToolResult,
     ListToolsResult,
     Tool,
@@ -14,27 +21,93 @@ from mcp.types import (
 )
 
 from .models import (
+    GDBBatchCommandResult,
+    GDBBatchRequest,
+    GDBBatchResponse,
     GDBExecuteRequest,
     GDBExecuteResponse,
+    GDBHistoryEntry,
+    GDBHistoryRequest,
+    GDBHistoryResponse,
+    GDBJobRequest,
+    GDBJobResponse,
+    GDBMIExecuteResponse,
+    GDBPoolConfigureRequest,
+    GDBDiffMemoryRequest,
+    GDBDiffMemoryResponse,
+    GDBMemoryRun,
+    GDBReadMemoryRequest,
+    GDBReadMemoryResponse,
+    GDBSnapshotMemoryRequest,
+    GDBSnapshotMemoryResponse,
+    QEMUConsoleRequest,
+    QEMUConsoleResponse,
+    QEMUControlRequest,
+    QEMUWaitOutputRequest,
+    QEMUWaitOutputResponse,
+    QEMUControlResponse,
+    QEMUSnapshotRequest,
+    QEMUSnapshotResponse,
     QEMUStartRequest,
     QEMUStartResponse,
     GDBStartRequest,
     GDBStartResponse,
     GDBStatusResponse,
+    GDBStatusRequest,
     ProcessStopRequest,
     ProcessStopResponse,
+    ServerMetricsRequest,
+    SessionInfo,
+    SessionListResponse,
+    SymbolizedAddress,
+    SymbolizeRequest,
+    SymbolizeResponse,
 )
-from .process_manager import GDBManager, QEMUManager
+from .elf import load_symbol_index
+from .memory import MemorySnapshot, diff_memory
+from .metrics import METRICS, instrument_request_handler
+from .tracing import TRACER, detached_task, span, trace_request_handler
+from .gdb_pool import DEFAULT_POOL_TARGETS, GDBPool
+from .index_cache import DEFAULT_INDEX_CACHE_DIR, IndexCache
+from .process_manager import GDBManager, is_execution_command
+from .session import DEFAULT_SESSION_ID, DebugSession, SessionRegistry
+from .state import format_frame, is_cacheable_command, summarize_breakpoints
 
 logger = logging.getLogger(__name__)
 
 
+# qemu_control 동작별 QMP 명령
+_QMP_ACTIONS = {
+    "stop": "stop",
+    "cont": "cont",
+    "status": "query-status",
+    "system_reset": "system_reset",
+}
+
+
+# 현재 도구 요청이 사용한 세션 ID (지표의 세션 레이블)
+_request_session: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar(
+    "gdb_mcp_request_session", default=None
+)
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """데이터를 파일에 씁니다."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    """초 단위 시간을 밀리초로 변환합니다."""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
 class GDBMCPServer:
     """GDB MCP 서버."""
     
     def __init__(self):
-        self.gdb_manager = GDBManager()
-        self.qemu_manager = QEMUManager()
+        self.sessions = SessionRegistry()
+        self.pool = GDBPool()
         self.server = Server("gdb-mcp")
         
         # 도구 등록
@@ -55,8 +128,38 @@ class GDBMCPServer:
                             "type": "object",
                             "properties": {
                                 "target": {"type": "string", "description": "디버그할 파일 경로"},
-                                "remote": {"type": "string", "description": "원격 연결 주소 (예: localhost:1234)"},
-                                "options": {"type": "array", "items": {"type": "string"}, "description": "GDB 옵션들"}
+                                "remote": {"type": "string", "description": "원격 연결 주소 (예: localhost:1234, 생략 시 세션의 QEMU 스텁)"},
+                                "options": {"type": "array", "items": {"type": "string"}, "description": "GDB 옵션들"},
+                                "index_cache": {"type": "boolean", "description": "빌드 ID 기준 GDB 디버그 정보 색인 캐시 사용 여부"},
+                                "gdb_path": {"type": "string", "description": "실행할 GDB (예: arm-none-eabi-gdb, gdb-multiarch, 생략 시 GDB_MCP_GDB)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"},
+                                "new_session": {"type": "boolean", "description": "새 세션을 생성하여 시작할지 여부"}
+                            }
+                        }
+                    ),
+                    Tool(
+                        name="gdb_pool_configure",
+                        description="미리 시작해 두는 GDB 프로세스 풀을 설정하고 상태를 조회합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "size": {"type": "integer", "description": "구성별로 대기시킬 GDB 수 (0이면 풀 사용 안 함)"},
+                                "max_idle": {"type": "integer", "description": "전체 대기 GDB 최대 수 (초과 시 가장 오래 사용되지 않은 구성부터 종료)"},
+                                "max_age": {"type": "number", "description": "대기 GDB 최대 수명 (초, 0이면 제한 없음)"},
+                                "init_commands": {"type": "array", "items": {"type": "string"}, "description": "GDB 시작 직후 적용할 공통 명령"},
+                                "prewarm": {
+                                    "type": "array",
+                                    "description": "미리 시작할 GDB 구성 목록",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "target": {"type": "string", "description": "미리 로드할 ELF 파일 경로"},
+                                            "options": {"type": "array", "items": {"type": "string"}, "description": "GDB 옵션들"},
+                                            "index_cache": {"type": "boolean", "description": "색인 캐시 사용 여부"},
+                                            "gdb_path": {"type": "string", "description": "실행할 GDB (생략 시 GDB_MCP_GDB)"}
+                                        }
+                                    }
+                                }
                             }
                         }
                     ),
@@ -67,17 +170,127 @@ class GDBMCPServer:
                             "type": "object",
                             "properties": {
                                 "command": {"type": "string", "description": "실행할 GDB 명령"},
-                                "timeout": {"type": "number", "description": "명령 실행 타임아웃 (초)"}
+                                "timeout": {"type": "number", "description": "명령 실행 타임아웃 (초)"},
+                                "format": {"type": "string", "enum": ["text", "json"], "description": "응답 형식 (text: 콘솔 출력, json: MI 결과 페이로드)"},
+                                "background": {"type": "boolean", "description": "실행 명령(continue 등)을 백그라운드 작업으로 실행하고 즉시 반환할지 여부"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
                             },
                             "required": ["command"]
                         }
                     ),
+                    Tool(
+                        name="gdb_batch",
+                        description="여러 GDB 명령을 한 번의 호출로 순서대로 실행합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "commands": {"type": "array", "items": {"type": "string"}, "description": "순서대로 실행할 GDB 명령 목록"},
+                                "timeout": {"type": "number", "description": "명령별 실행 타임아웃 (초)"},
+                                "stop_on_error": {"type": "boolean", "description": "명령이 실패하면 이후 명령을 실행하지 않을지 여부"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["commands"]
+                        }
+                    ),
+                    Tool(
+                        name="gdb_job",
+                        description="백그라운드 실행 작업의 진행 상황과 결과를 조회합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "job_id": {"type": "string", "description": "작업 ID"},
+                                "wait": {"type": "number", "description": "작업이 끝날 때까지 기다릴 최대 시간 (초)"},
+                                "cursor": {"type": "integer", "description": "이 위치 이후의 출력만 반환"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["job_id"]
+                        }
+                    ),
+                    Tool(
+                        name="gdb_history",
+                        description="GDB 명령 출력 기록을 순번 단위로 조회하거나 검색합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "after_seq": {"type": "integer", "description": "이 순번 다음부터 조회 (생략 시 최근 기록)"},
+                                "limit": {"type": "integer", "description": "최대 조회 개수"},
+                                "search": {"type": "string", "description": "명령이나 출력에서 찾을 정규식"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            }
+                        }
+                    ),
+                    Tool(
+                        name="gdb_read_memory",
+                        description="타겟 메모리를 청크 단위로 읽어 base64로 반환하거나 파일로 저장합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "address": {"type": ["integer", "string"], "description": "시작 주소 (정수, 16진수 문자열 또는 GDB 표현식)"},
+                                "length": {"type": "integer", "description": "읽을 바이트 수"},
+                                "chunk_size": {"type": "integer", "description": "명령 하나로 읽을 바이트 수"},
+                                "output_path": {"type": "string", "description": "내용을 저장할 파일 경로 (생략 시 base64로 반환)"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["address", "length"]
+                        }
+                    ),
+                    Tool(
+                        name="gdb_snapshot_memory",
+                        description="메모리 영역을 이름 붙인 스냅샷으로 세션에 저장합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "스냅샷 이름 (같은 이름이 있으면 교체)"},
+                                "address": {"type": ["integer", "string"], "description": "시작 주소 (정수, 16진수 문자열 또는 GDB 표현식)"},
+                                "length": {"type": "integer", "description": "저장할 바이트 수"},
+                                "chunk_size": {"type": "integer", "description": "명령 하나로 읽을 바이트 수"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["name", "address", "length"]
+                        }
+                    ),
+                    Tool(
+                        name="gdb_diff_memory",
+                        description="메모리 스냅샷을 다른 스냅샷이나 현재 메모리와 비교하여 바뀐 구간을 반환합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "base": {"type": "string", "description": "기준 스냅샷 이름"},
+                                "target": {"type": "string", "description": "비교할 스냅샷 이름 (생략 시 현재 메모리)"},
+                                "save_as": {"type": "string", "description": "현재 메모리와 비교할 때 읽은 내용을 저장할 스냅샷 이름"},
+                                "merge_gap": {"type": "integer", "description": "이 바이트 수 이하로 떨어진 변경 구간을 하나로 합침"},
+                                "symbols": {"type": "boolean", "description": "각 구간을 포함하는 심볼을 함께 표시할지 여부"},
+                                "max_runs": {"type": "integer", "description": "반환할 최대 구간 수"},
+                                "bytes_limit": {"type": "integer", "description": "이 길이 이하인 구간은 이전/이후 바이트를 함께 반환"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["base"]
+                        }
+                    ),
+                    Tool(
+                        name="symbolize",
+                        description="여러 주소를 ELF 심볼 색인으로 한 번에 심볼 이름과 오프셋으로 변환합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "addresses": {"type": "array", "items": {"type": ["integer", "string"]}, "description": "변환할 주소 목록 (정수 또는 16진수 문자열)"},
+                                "elf": {"type": "string", "description": "심볼을 읽을 ELF 파일 (생략 시 세션의 GDB 타겟)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["addresses"]
+                        }
+                    ),
                     Tool(
                         name="gdb_status",
                         description="GDB 상태를 조회합니다",
                         inputSchema={
                             "type": "object",
-                            "properties": {}
+                            "properties": {
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            }
                         }
                     ),
                     Tool(
@@ -89,119 +302,766 @@ class GDBMCPServer:
                                 "arch": {"type": "string", "description": "아키텍처 (예: x86_64, arm, aarch64)"},
                                 "kernel": {"type": "string", "description": "커널 이미지 경로"},
                                 "options": {"type": "array", "items": {"type": "string"}, "description": "QEMU 옵션들"},
-                                "gdb_stub": {"type": "boolean", "description": "GDB 스텁 활성화 여부"}
+                                "gdb_stub": {"type": "boolean", "description": "GDB 스텁 활성화 여부"},
+                                "gdb_port": {"type": "integer", "description": "GDB 스텁 포트 (생략 시 자동 할당)"},
+                                "gdb_transport": {"type": "string", "enum": ["tcp", "unix"], "description": "GDB 스텁 전송 방식"},
+                                "snapshot_store": {"type": "boolean", "description": "qemu_snapshot/qemu_restore용 qcow2 스냅샷 드라이브를 붙일지 여부"},
+                                "qmp": {"type": "boolean", "description": "QMP 소켓을 열고 접속할지 여부 (기본값: true, Windows 제외)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"},
+                                "new_session": {"type": "boolean", "description": "새 세션을 생성하여 시작할지 여부"}
                             },
                             "required": ["arch"]
                         }
                     ),
+                    Tool(
+                        name="qemu_console",
+                        description="QEMU 콘솔(stdout/stderr) 출력을 커서 이후부터 조회합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "stream": {"type": "string", "enum": ["stdout", "stderr"], "description": "출력 스트림"},
+                                "cursor": {"type": "integer", "description": "이 오프셋 이후의 출력을 반환 (이전 응답의 cursor, 음수이면 끝에서부터)"},
+                                "max_bytes": {"type": "integer", "description": "반환할 최대 바이트 수"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            }
+                        }
+                    ),
+                    Tool(
+                        name="qemu_wait_output",
+                        description="QEMU 콘솔 출력에 정규식이 나타날 때까지 기다립니다 (타임아웃 시 마지막 출력 반환)",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "pattern": {"type": "string", "description": "기다릴 정규식 (예: TEST (PASS|FAIL))"},
+                                "stream": {"type": "string", "enum": ["stdout", "stderr"], "description": "출력 스트림"},
+                                "cursor": {"type": "integer", "description": "이 오프셋 이후의 출력부터 검사 (생략 시 지금 이후)"},
+                                "timeout": {"type": "number", "description": "최대 대기 시간 (초)"},
+                                "tail_bytes": {"type": "integer", "description": "매치되지 않았을 때 반환할 마지막 출력 크기 (바이트)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["pattern"]
+                        }
+                    ),
+                    Tool(
+                        name="qemu_control",
+                        description="QMP로 QEMU 머신을 제어합니다 (GDB를 거치지 않음)",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "action": {
+                                    "type": "string",
+                                    "enum": ["stop", "cont", "status", "system_reset", "hmp", "qmp"],
+                                    "description": "동작 (hmp: HMP 명령 실행, qmp: 임의의 QMP 명령 실행)"
+                                },
+                                "command": {"type": "string", "description": "hmp: HMP 명령줄 (예: info registers), qmp: QMP 명령 이름"},
+                                "arguments": {"type": "object", "description": "qmp: QMP 명령 인자"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["action"]
+                        }
+                    ),
+                    Tool(
+                        name="qemu_snapshot",
+                        description="QEMU 머신 상태를 이름 붙인 스냅샷으로 저장합니다 (savevm)",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "스냅샷 이름"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["name"]
+                        }
+                    ),
+                    Tool(
+                        name="qemu_restore",
+                        description="QEMU 머신을 스냅샷 시점으로 되돌립니다 (loadvm). GDB 연결과 브레이크포인트는 유지됩니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "스냅샷 이름"},
+                                "timeout": {"type": "number", "description": "실행 타임아웃 (초)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
+                            },
+                            "required": ["name"]
+                        }
+                    ),
                     Tool(
                         name="process_stop",
                         description="프로세스를 중지합니다",
                         inputSchema={
                             "type": "object",
                             "properties": {
-                                "process_type": {"type": "string", "description": "프로세스 타입 (gdb 또는 qemu)"}
+                                "process_type": {"type": "string", "description": "프로세스 타입 (gdb, qemu 또는 session)"},
+                                "session_id": {"type": "string", "description": "세션 ID (생략 시 기본 세션)"}
                             },
                             "required": ["process_type"]
                         }
                     ),
+                    Tool(
+                        name="session_list",
+                        description="디버그 세션 목록을 조회합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {}
+                        }
+                    ),
+                    Tool(
+                        name="server_metrics",
+                        description="서버 지표(도구/세션별 지연 시간 분포, 동시 실행 수, 실행기 대기, GDB 왕복 시간과 전송량)를 조회합니다",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "format": {"type": "string", "enum": ["summary", "json", "prometheus"], "description": "출력 형식"},
+                                "reset": {"type": "boolean", "description": "조회 후 누적 지표 초기화 여부"}
+                            }
+                        }
+                    ),
                 ]
             )
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """도구 호출을 처리합니다."""
+            started = time.perf_counter()
+            failed = False
+            session_token = _request_session.set(None)
+            METRICS.tool_started(name)
             try:
+                result = await self._dispatch_tool(name, arguments)
+                failed = bool(result.isError)
+                return result
+            finally:
+                session_id = _request_session.get() or (arguments or {}).get("session_id") or DEFAULT_SESSION_ID
+                _request_session.reset(session_token)
+                METRICS.tool_finished(name, session_id, time.perf_counter() - started, failed)
+                METRICS.maybe_export()
+
+        # 스키마 검증과 결과 변환을 포함한 요청 처리 시간도 기록하고, 샘플링된 요청은 추적합니다
+        self.server.request_handlers[CallToolRequest] = trace_request_handler(instrument_request_handler(
+            self.server.request_handlers[CallToolRequest]
+        ))
+    
+    async def _dispatch_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """도구 이름에 맞는 핸들러를 호출합니다."""
+        try:
+            with span(f"_handle_{name}", "handler"):
                 if name == "gdb_start":
                     return await self._handle_gdb_start(arguments)
+                elif name == "gdb_pool_configure":
+                    return await self._handle_gdb_pool_configure(arguments)
                 elif name == "gdb_execute":
                     return await self._handle_gdb_execute(arguments)
+                elif name == "gdb_batch":
+                    return await self._handle_gdb_batch(arguments)
+                elif name == "gdb_job":
+                    return await self._handle_gdb_job(arguments)
+                elif name == "gdb_history":
+                    return await self._handle_gdb_history(arguments)
+                elif name == "gdb_read_memory":
+                    return await self._handle_gdb_read_memory(arguments)
+                elif name == "gdb_snapshot_memory":
+                    return await self._handle_gdb_snapshot_memory(arguments)
+                elif name == "gdb_diff_memory":
+                    return await self._handle_gdb_diff_memory(arguments)
+                elif name == "symbolize":
+                    return await self._handle_symbolize(arguments)
                 elif name == "gdb_status":
                     return await self._handle_gdb_status(arguments)
                 elif name == "qemu_start":
                     return await self._handle_qemu_start(arguments)
+                elif name == "qemu_console":
+                    return await self._handle_qemu_console(arguments)
+                elif name == "qemu_wait_output":
+                    return await self._handle_qemu_wait_output(arguments)
+                elif name == "qemu_control":
+                    return await self._handle_qemu_control(arguments)
+                elif name == "qemu_snapshot":
+                    return await self._handle_qemu_snapshot(arguments)
+                elif name == "qemu_restore":
+                    return await self._handle_qemu_restore(arguments)
                 elif name == "process_stop":
                     return await self._handle_process_stop(arguments)
+                elif name == "session_list":
+                    return await self._handle_session_list(arguments)
+                elif name == "server_metrics":
+                    return await self._handle_server_metrics(arguments)
                 else:
                     return CallToolResult(
-                        content=[TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+                        content=[TextContent(type="text", text=f"알 수 없는 도구: {name}")],
+                        isError=True
                     )
-            except Exception as e:
-                logger.error(f"도구 실행 중 오류: {e}")
-                return CallToolResult(
-                    content=[TextContent(type="text", text=f"오류: {str(e)}")]
-                )
+        except Exception as e:
+            logger.error(f"도구 실행 중 오류: {e}")
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"오류: {str(e)}")],
+                isError=True
+            )
     
     async def _handle_gdb_start(self, arguments: Dict[str, Any]) -> CallToolResult:
         """GDB 시작을 처리합니다."""
         try:
             request = GDBStartRequest(**arguments)
-            success, error = await self.gdb_manager.start(
-                target=request.target,
-                remote=request.remote,
-                options=request.options
-            )
+            session = self._session_for_start(request.session_id, request.new_session)
+            # 원격 주소를 생략하면 같은 세션의 QEMU 스텁에 연결합니다
+            remote = request.remote
+            if remote is None and session.qemu.is_running():
+                remote = session.qemu.endpoint
+            success, error = await self._start_gdb(session, request, remote)
             
             response = GDBStartResponse(
                 success=success,
-                pid=self.gdb_manager.pid,
+                pid=session.gdb.pid,
+                session_id=session.session_id,
+                startup_ms=_to_ms(session.gdb.startup_time),
+                index_cache=session.gdb.index_cache_state,
+                cold_startup_ms=session.gdb.index_cache_times.get("cold_ms"),
+                warm_startup_ms=session.gdb.index_cache_times.get("warm_ms"),
+                pooled=success and session.gdb.from_pool,
                 error=error
             )
             
             content = f"GDB 시작: {'성공' if success else '실패'}"
             if response.pid:
                 content += f" (PID: {response.pid})"
+            if response.startup_ms is not None:
+                content += f" (준비 시간: {response.startup_ms:.1f}ms)"
+            if response.pooled:
+                content += " (풀에서 할당)"
+            if success and response.index_cache:
+                content += f"\n색인 캐시: {response.index_cache}"
+                times = [
+                    f"{label} {value:.1f}ms"
+                    for label, value in (("cold", response.cold_startup_ms), ("warm", response.warm_startup_ms))
+                    if value is not None
+                ]
+                if times:
+                    content += f" ({', '.join(times)})"
+            content += f"\n세션: {response.session_id}"
             if response.error:
                 content += f"\n오류: {response.error}"
                 
             return CallToolResult(
-                content=[TextContent(type="text", text=content)]
+                content=[TextContent(type="text", text=content)],
+                isError=not success
             )
             
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"GDB 시작 오류: {str(e)}")]
+                content=[TextContent(type="text", text=f"GDB 시작 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _start_gdb(self, session: DebugSession, request: GDBStartRequest,
+                         remote: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """풀에 대기 중인 GDB가 있으면 사용하고, 없으면 새로 시작합니다."""
+        # 빌드 ID는 여기서 한 번만 읽어 실행 명령 구성과 GDB 시작에 함께 넘깁니다
+        build_id = None
+        if request.index_cache and DEFAULT_INDEX_CACHE_DIR and request.target:
+            build_id = await METRICS.run_in_executor(IndexCache.build_id, request.target)
+        index_cache = build_id is not None
+        command = GDBManager.build_command(request.target, request.options, index_cache, build_id, request.gdb_path)
+        transport = self.pool.acquire(command, request.target)
+        if transport is not None:
+            success, error = await session.gdb.start(
+                target=request.target, remote=remote, options=request.options,
+                index_cache=index_cache, transport=transport, build_id=build_id,
+                gdb_path=request.gdb_path
+            )
+            if success:
+                return success, error
+            logger.warning(f"풀에서 받은 GDB를 사용하지 못해 새로 시작합니다: {error}")
+            
+        success, error = await session.gdb.start(
+            target=request.target, remote=remote, options=request.options,
+            index_cache=index_cache, build_id=build_id, gdb_path=request.gdb_path
+        )
+        # 풀의 GDB와 같은 상태가 되도록 공통 초기화 명령을 적용합니다
+        if success and self.pool.init_commands:
+            await session.gdb.execute_commands(self.pool.init_commands)
+        return success, error
+    
+    async def _handle_gdb_pool_configure(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """GDB 프로세스 풀 설정을 처리합니다."""
+        try:
+            request = GDBPoolConfigureRequest(**arguments)
+            self.pool.configure(
+                size=request.size,
+                max_idle=request.max_idle,
+                max_age=request.max_age,
+                init_commands=request.init_commands
+            )
+            for spec in request.prewarm:
+                self.pool.prewarm(
+                    GDBManager.build_command(spec.target, spec.options, spec.index_cache, gdb_path=spec.gdb_path),
+                    spec.target
+                )
+                
+            return CallToolResult(
+                content=[TextContent(type="text", text=json.dumps(self.pool.stats(), ensure_ascii=False))]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"GDB 풀 설정 오류: {str(e)}")],
+                isError=True
             )
     
     async def _handle_gdb_execute(self, arguments: Dict[str, Any]) -> CallToolResult:
         """GDB 명령 실행을 처리합니다."""
         try:
-            request = GDBExecuteRequest(**arguments)
-            success, output, error = await self.gdb_manager.execute_command(
+            with span("validate"):
+                request = GDBExecuteRequest(**arguments)
+                session = self._get_session(request.session_id)
+            if request.format == "json":
+                return await self._execute_mi(session, request)
+            if request.format != "text":
+                return CallToolResult(
+                    content=[TextContent(type="text", text=f"알 수 없는 응답 형식: {request.format}")],
+                    isError=True
+                )
+            if is_execution_command(request.command):
+                # 실행 중인 백그라운드 작업이 타겟을 재개한 상태이므로 새 실행 명령을 받지 않습니다
+                running = session.jobs.running()
+                if running is not None:
+                    return CallToolResult(
+                        content=[TextContent(type="text", text=(
+                            f"작업 {running.job_id} ({running.command})이(가) 아직 실행 중입니다. "
+                            "gdb_job으로 끝날 때까지 기다리거나 interrupt 후 다시 시도하세요."
+                        ))],
+                        isError=True
+                    )
+                if request.background:
+                    return self._start_execution_job(session, request)
+                return await self._run_execution(session, request)
+            hits = session.gdb.cache.hits
+            success, output, error = await session.gdb.execute_command(
                 request.command, request.timeout
             )
             
-            content = f"명령: {request.command}\n"
-            content += f"결과: {'성공' if success else '실패'}\n"
-            if output:
-                content += f"출력:\n{output}\n"
-            if error:
-                content += f"오류: {error}"
+            with span("format"):
+                content = f"명령: {request.command}\n"
+                content += f"결과: {'성공' if success else '실패'}\n"
+                if output:
+                    content += f"출력:\n{output}\n"
+                if is_cacheable_command(request.command):
+                    content += self._format_cache_note(session, hits)
+                if error:
+                    content += f"오류: {error}"
+                    
+                return CallToolResult(
+                    content=[TextContent(type="text", text=content)],
+                    isError=not success
+                )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"GDB 명령 실행 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _run_execution(self, session: DebugSession, request: GDBExecuteRequest) -> CallToolResult:
+        """실행 명령을 타겟이 멈출 때까지 실행하며, 중간 출력을 진행 알림으로 보냅니다."""
+        success, output, error, stop_record = await session.gdb.execute_until_stopped(
+            request.command, request.timeout, on_output=self._progress_reporter()
+        )
+        
+        content = f"명령: {request.command}\n"
+        content += f"결과: {'성공' if success else '실패'}\n"
+        if output:
+            content += f"출력:\n{output}\n"
+        if stop_record:
+            content += f"정지 사유: {stop_record.get('reason', '알 수 없음')}\n"
+            if stop_record.get("frame"):
+                content += f"현재 프레임: {format_frame(stop_record['frame'])}\n"
+        if error:
+            content += f"오류: {error}"
+            
+        return CallToolResult(
+            content=[TextContent(type="text", text=content)],
+            isError=not success
+        )
+    
+    def _start_execution_job(self, session: DebugSession, request: GDBExecuteRequest) -> CallToolResult:
+        """실행 명령을 백그라운드 작업으로 시작하고 작업 ID를 반환합니다."""
+        job = session.jobs.create(request.command)
+        job.task = detached_task(job.run(
+            session.gdb.execute_until_stopped(request.command, request.timeout, on_output=job.append_output)
+        ))
+        
+        content = f"명령: {request.command}\n"
+        content += f"백그라운드 작업 시작: {job.job_id}\n"
+        content += "gdb_job 도구로 진행 상황과 결과를 조회하세요."
+        return CallToolResult(
+            content=[TextContent(type="text", text=content)]
+        )
+    
+    def _progress_reporter(self) -> Optional[Callable[[str], None]]:
+        """요청에 진행 토큰이 있으면 출력을 진행 알림으로 보내는 콜백을 반환합니다."""
+        try:
+            context = self.server.request_context
+        except LookupError:
+            return None
+        token = context.meta.progressToken if context.meta else None
+        if token is None:
+            return None
+        counter = itertools.count(1)
+        
+        async def send(progress: int, message: str) -> None:
+            try:
+                await context.session.send_progress_notification(
+                    progress_token=token, progress=progress, message=message
+                )
+            except Exception as e:
+                logger.debug(f"진행 알림 전송 실패: {e}")
                 
+        def report(text: str) -> None:
+            asyncio.ensure_future(send(next(counter), text))
+            
+        return report
+    
+    def _format_cache_note(self, session: DebugSession, hits_before: int) -> str:
+        """정지 세대 캐시 적중 여부와 통계를 한 줄로 표시합니다."""
+        stats = session.gdb.cache.stats()
+        hit = session.gdb.cache.hits > hits_before
+        return (
+            f"캐시: {'적중' if hit else '미스'} "
+            f"(세대 {stats['epoch']}, 적중 {stats['hits']} / 미스 {stats['misses']})\n"
+        )
+    
+    async def _handle_gdb_job(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """백그라운드 실행 작업 조회를 처리합니다."""
+        try:
+            request = GDBJobRequest(**arguments)
+            session = self._get_session(request.session_id)
+            job = session.jobs.get(request.job_id)
+            await job.wait(request.wait)
+            
+            output, cursor = job.output_since(request.cursor)
+            response = GDBJobResponse(
+                job_id=job.job_id,
+                command=job.command,
+                state=job.state,
+                output=output,
+                cursor=cursor,
+                stop_reason=(job.stop_record or {}).get("reason"),
+                frame=(job.stop_record or {}).get("frame"),
+                elapsed=(job.finished_at or time.time()) - job.started_at,
+                error=job.error
+            )
+            
+            content = f"작업 {response.job_id} ({response.command}): {response.state}"
+            content += f" ({response.elapsed:.2f}초)\n"
+            if request.cursor < job.first_cursor:
+                content += f"(출력 한도를 넘어 앞의 출력 {job.first_cursor - request.cursor}개를 생략했습니다)\n"
+            if response.output:
+                content += f"출력:\n{response.output.rstrip()}\n"
+            if response.stop_reason:
+                content += f"정지 사유: {response.stop_reason}\n"
+            if response.frame:
+                content += f"현재 프레임: {format_frame(response.frame)}\n"
+            if response.error:
+                content += f"오류: {response.error}\n"
+            content += f"cursor: {response.cursor}"
+            
             return CallToolResult(
                 content=[TextContent(type="text", text=content)]
             )
             
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"GDB 명령 실행 오류: {str(e)}")]
+                content=[TextContent(type="text", text=f"작업 조회 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _execute_mi(self, session: DebugSession, request: GDBExecuteRequest) -> CallToolResult:
+        """명령을 실행하고 MI 결과 페이로드를 JSON으로 반환합니다."""
+        hits = session.gdb.cache.hits
+        success, response, error = await session.gdb.execute_mi(request.command, request.timeout)
+        
+        result = GDBMIExecuteResponse(command=request.command, success=success, error=error)
+        if is_cacheable_command(request.command):
+            result.cache = dict(session.gdb.cache.stats(), hit=session.gdb.cache.hits > hits)
+        if response is not None:
+            result.result = response.message
+            result.payload = response.payload
+            console = "".join(record["payload"] for record in response.stream_output("console"))
+            if console:
+                result.console = console
+                
+        return CallToolResult(
+            content=[TextContent(type="text", text=result.model_dump_json(exclude_none=True))],
+            isError=not success
+        )
+    
+    async def _handle_gdb_batch(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """GDB 명령 일괄 실행을 처리합니다."""
+        try:
+            request = GDBBatchRequest(**arguments)
+            session = self._get_session(request.session_id)
+            results = await session.gdb.execute_batch(
+                request.commands, request.timeout, request.stop_on_error
+            )
+            
+            response = GDBBatchResponse(
+                results=[
+                    GDBBatchCommandResult(command=command, success=success, output=output, error=error)
+                    for command, (success, output, error) in zip(request.commands, results)
+                ],
+                skipped=len(request.commands) - len(results)
+            )
+            
+            succeeded = sum(1 for result in response.results if result.success)
+            content = f"일괄 실행: {succeeded}/{len(request.commands)} 성공"
+            if response.skipped:
+                content += f" ({response.skipped}개 건너뜀)"
+            content += "\n"
+            for index, result in enumerate(response.results, 1):
+                content += f"\n[{index}] 명령: {result.command}\n"
+                content += f"결과: {'성공' if result.success else '실패'}\n"
+                if result.output:
+                    content += f"출력:\n{result.output}\n"
+                if result.error:
+                    content += f"오류: {result.error}\n"
+                    
+            return CallToolResult(
+                content=[TextContent(type="text", text=content)],
+                isError=succeeded < len(request.commands)
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"GDB 일괄 실행 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_gdb_history(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """GDB 출력 기록 조회를 처리합니다."""
+        try:
+            request = GDBHistoryRequest(**arguments)
+            session = self._get_session(request.session_id)
+            history = session.gdb.history
+            
+            if request.search is not None:
+                entries = history.search(request.search, request.after_seq or 0, request.limit)
+            elif request.after_seq is None:
+                entries = history.tail(request.limit)
+            else:
+                entries = history.page(request.after_seq, request.limit)
+                
+            response = GDBHistoryResponse(
+                entries=[GDBHistoryEntry(**entry.to_dict()) for entry in entries],
+                next_seq=entries[-1].seq if entries else request.after_seq,
+                first_seq=history.first_seq,
+                last_seq=history.last_seq
+            )
+            
+            content = (
+                f"출력 기록 (세션: {session.session_id}, "
+                f"순번 {response.first_seq}~{response.last_seq}): {len(response.entries)}개\n"
+            )
+            for entry in response.entries:
+                content += f"\n[{entry.seq}] $ {entry.command}\n"
+                if entry.output:
+                    content += f"{entry.output}\n"
+            if response.next_seq is not None:
+                content += f"\n다음 after_seq: {response.next_seq}"
+                
+            return CallToolResult(
+                content=[TextContent(type="text", text=content)]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"출력 기록 조회 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_gdb_read_memory(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """타겟 메모리 읽기를 처리합니다."""
+        try:
+            request = GDBReadMemoryRequest(**arguments)
+            session = self._get_session(request.session_id)
+            success, address, data, unreadable, error = await session.gdb.read_memory(
+                str(request.address), request.length, request.chunk_size, request.timeout
+            )
+            
+            response = GDBReadMemoryResponse(success=success, address=address, error=error)
+            if success:
+                response.length = len(data)
+                response.unreadable = [[begin, length] for begin, length in unreadable]
+                if request.output_path:
+                    # 최대 64MB를 쓰므로 이벤트 루프를 막지 않도록 실행기에서 씁니다
+                    await METRICS.run_in_executor(_write_file, request.output_path, data)
+                    response.output_path = request.output_path
+                else:
+                    response.data = base64.b64encode(data).decode("ascii")
+                    
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"메모리 읽기 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_gdb_snapshot_memory(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """메모리 스냅샷 생성을 처리합니다."""
+        try:
+            request = GDBSnapshotMemoryRequest(**arguments)
+            session = self._get_session(request.session_id)
+            success, address, data, unreadable, error = await session.gdb.read_memory(
+                str(request.address), request.length, request.chunk_size, request.timeout
+            )
+            
+            response = GDBSnapshotMemoryResponse(success=success, name=request.name, address=address, error=error)
+            if success:
+                session.snapshots.add(MemorySnapshot(request.name, address, bytes(data), unreadable))
+                response.length = len(data)
+                response.unreadable = [[begin, length] for begin, length in unreadable]
+            response.snapshots = [snapshot.name for snapshot in session.snapshots.list()]
+            
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"메모리 스냅샷 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_gdb_diff_memory(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """메모리 스냅샷 비교를 처리합니다."""
+        try:
+            request = GDBDiffMemoryRequest(**arguments)
+            session = self._get_session(request.session_id)
+            base = session.snapshots.get(request.base)
+            
+            if request.target is not None:
+                target = session.snapshots.get(request.target)
+            else:
+                success, address, data, unreadable, error = await session.gdb.read_memory(
+                    str(base.address), len(base.data), timeout=request.timeout
+                )
+                if not success:
+                    return CallToolResult(
+                        content=[TextContent(type="text", text=GDBDiffMemoryResponse(
+                            success=False, error=error
+                        ).model_dump_json(exclude_none=True))],
+                        isError=True
+                    )
+                target = MemorySnapshot(request.save_as or "(current)", address, bytes(data), unreadable)
+                if request.save_as:
+                    session.snapshots.add(target)
+                    
+            # 두 영역이 겹치는 부분만 비교합니다
+            start, end = max(base.address, target.address), min(base.end, target.end)
+            if start >= end:
+                raise ValueError(f"스냅샷 영역이 겹치지 않습니다: {base.name}, {target.name}")
+            old = base.data[start - base.address:end - base.address]
+            new = target.data[start - target.address:end - target.address]
+            runs = diff_memory(old, new, start, request.merge_gap)
+            
+            shown = runs[:max(request.max_runs, 0)]
+            symbols = {}
+            if request.symbols and shown:
+                symbols = await session.gdb.lookup_symbols([begin for begin, _ in shown], request.timeout)
+                
+            response = GDBDiffMemoryResponse(
+                success=True,
+                address=start,
+                length=end - start,
+                changed_bytes=sum(length for _, length in runs),
+                total_runs=len(runs)
+            )
+            for begin, length in shown:
+                run = GDBMemoryRun(address=begin, length=length, symbol=symbols.get(begin))
+                if length <= request.bytes_limit:
+                    run.old = old[begin - start:begin - start + length].hex()
+                    run.new = new[begin - start:begin - start + length].hex()
+                response.runs.append(run)
+                
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"메모리 비교 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_symbolize(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """주소 일괄 심볼 변환을 처리합니다."""
+        try:
+            request = SymbolizeRequest(**arguments)
+            addresses = [
+                address if isinstance(address, int) else int(address, 0)
+                for address in request.addresses
+            ]
+            if request.elf:
+                elf = request.elf
+                index = await METRICS.run_in_executor(load_symbol_index, elf)
+            else:
+                session = self._get_session(request.session_id)
+                elf = session.gdb.target
+                index = await session.gdb.get_symbol_index()
+                
+            response = SymbolizeResponse(success=True, elf=elf, symbol_count=len(index))
+            for address in addresses:
+                found = index.lookup(address)
+                if found is None:
+                    response.results.append(SymbolizedAddress(address=address))
+                else:
+                    response.results.append(SymbolizedAddress(address=address, symbol=found[0], offset=found[1]))
+                    response.resolved += 1
+                    
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"심볼 변환 오류: {str(e)}")],
+                isError=True
             )
     
     async def _handle_gdb_status(self, arguments: Dict[str, Any]) -> CallToolResult:
         """GDB 상태 조회를 처리합니다."""
         try:
-            status = await self.gdb_manager.get_status()
+            request = GDBStatusRequest(**arguments)
+            session = self._get_session(request.session_id)
+            status = await session.gdb.get_status()
             
-            content = f"GDB 상태:\n"
+            content = f"GDB 상태 (세션: {session.session_id}):\n"
             content += f"실행 중: {'예' if status['running'] else '아니오'}\n"
             if status['pid']:
                 content += f"PID: {status['pid']}\n"
             if status['target']:
                 content += f"타겟: {status['target']}\n"
+            if status.get('execution_state'):
+                content += f"타겟 상태: {status['execution_state']}"
+                if status.get('stop_reason'):
+                    content += f" ({status['stop_reason']})"
+                content += "\n"
             if status['breakpoints']:
                 content += f"브레이크포인트 수: {len(status['breakpoints'])}\n"
+                for line in summarize_breakpoints(status['breakpoints']):
+                    content += f"  {line}\n"
             if status['current_frame']:
-                content += f"현재 프레임: {status['current_frame']['info']}\n"
+                content += f"현재 프레임: {format_frame(status['current_frame'])}\n"
+            if status.get('cache'):
+                cache = status['cache']
+                content += (
+                    f"조회 캐시: 세대 {status['epoch']}, 항목 {cache['entries']}개, "
+                    f"적중 {cache['hits']} / 미스 {cache['misses']}\n"
+                )
                 
             return CallToolResult(
                 content=[TextContent(type="text", text=content)]
@@ -209,24 +1069,34 @@ class GDBMCPServer:
             
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"GDB 상태 조회 오류: {str(e)}")]
+                content=[TextContent(type="text", text=f"GDB 상태 조회 오류: {str(e)}")],
+                isError=True
             )
     
     async def _handle_qemu_start(self, arguments: Dict[str, Any]) -> CallToolResult:
         """QEMU 시작을 처리합니다."""
         try:
             request = QEMUStartRequest(**arguments)
-            success, error = await self.qemu_manager.start(
+            session = self._session_for_start(request.session_id, request.new_session)
+            success, error = await session.qemu.start(
                 arch=request.arch,
                 kernel=request.kernel,
                 options=request.options,
-                gdb_stub=request.gdb_stub
+                gdb_stub=request.gdb_stub,
+                gdb_port=request.gdb_port,
+                gdb_transport=request.gdb_transport,
+                snapshot_store=request.snapshot_store,
+                qmp=request.qmp
             )
             
             response = QEMUStartResponse(
                 success=success,
-                pid=self.qemu_manager.pid,
-                port=self.qemu_manager.port,
+                pid=session.qemu.pid,
+                port=session.qemu.port,
+                endpoint=session.qemu.endpoint,
+                startup_ms=_to_ms(session.qemu.startup_time),
+                qmp=session.qemu.has_qmp(),
+                session_id=session.session_id,
                 error=error
             )
             
@@ -235,60 +1105,347 @@ class GDBMCPServer:
                 content += f" (PID: {response.pid})"
             if response.port:
                 content += f" (포트: {response.port})"
+            if response.startup_ms is not None:
+                content += f" (준비 시간: {response.startup_ms:.1f}ms)"
+            if response.endpoint:
+                content += f"\nGDB 엔드포인트: {response.endpoint}"
+            if response.qmp:
+                content += f"\nQMP: 연결됨 (상태: {session.qemu.status})"
+            content += f"\n세션: {response.session_id}"
             if response.error:
                 content += f"\n오류: {response.error}"
                 
             return CallToolResult(
-                content=[TextContent(type="text", text=content)]
+                content=[TextContent(type="text", text=content)],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"QEMU 시작 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_qemu_console(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """QEMU 콘솔 출력 조회를 처리합니다."""
+        try:
+            request = QEMUConsoleRequest(**arguments)
+            session = self._get_session(request.session_id)
+            data, cursor, dropped = session.qemu.read_console(request.stream, request.cursor, request.max_bytes)
+            buffer = session.qemu.consoles.get(request.stream)
+            
+            response = QEMUConsoleResponse(
+                stream=request.stream,
+                output=data.decode(errors="replace"),
+                cursor=cursor,
+                end=buffer.end if buffer else 0,
+                dropped=dropped,
+                running=session.qemu.is_running()
+            )
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json())]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"QEMU 콘솔 조회 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_qemu_wait_output(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """QEMU 콘솔 출력 대기를 처리합니다."""
+        try:
+            request = QEMUWaitOutputRequest(**arguments)
+            session = self._get_session(request.session_id)
+            try:
+                result = await session.qemu.wait_output(
+                    request.pattern, request.stream, request.cursor, request.timeout, request.tail_bytes
+                )
+            except re.error as e:
+                raise ValueError(f"잘못된 정규식: {e}")
+            
+            response = QEMUWaitOutputResponse(
+                matched=result["matched"],
+                match=result.get("match"),
+                groups=result.get("groups", []),
+                offset=result.get("offset"),
+                cursor=result["cursor"],
+                elapsed_ms=_to_ms(result["elapsed"]),
+                exited=result["exited"],
+                tail=result.get("tail")
+            )
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))]
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"QEMU 출력 대기 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_qemu_control(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """QMP를 통한 QEMU 머신 제어를 처리합니다."""
+        try:
+            request = QEMUControlRequest(**arguments)
+            session = self._get_session(request.session_id)
+            qemu = session.qemu
+            
+            if request.action in _QMP_ACTIONS:
+                success, result, error = await qemu.qmp_execute(_QMP_ACTIONS[request.action], timeout=request.timeout)
+            elif request.action == "hmp":
+                if not request.command:
+                    raise ValueError("hmp 동작에는 command가 필요합니다")
+                success, result, error = await qemu.human_monitor(request.command, request.timeout)
+            elif request.action == "qmp":
+                if not request.command:
+                    raise ValueError("qmp 동작에는 command가 필요합니다")
+                success, result, error = await qemu.qmp_execute(request.command, request.arguments, request.timeout)
+            else:
+                raise ValueError(f"알 수 없는 동작: {request.action}")
+                
+            if success and request.action == "status" and isinstance(result, dict):
+                qemu.status = result.get("status", qemu.status)
+            # 리셋은 GDB 모르게 레지스터를 바꾸므로 GDB가 보는 상태를 다시 맞춥니다
+            if success and request.action == "system_reset" and session.gdb.is_running() \
+                    and session.gdb.state.execution_state != "running":
+                await session.gdb.resync_target(request.timeout)
+                
+            response = QEMUControlResponse(
+                success=success,
+                action=request.action,
+                result=result,
+                status=qemu.status,
+                events=list(qemu.qmp.events)[-10:] if qemu.qmp is not None else [],
+                error=error
+            )
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"QEMU 제어 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_qemu_snapshot(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """QEMU 머신 스냅샷 저장을 처리합니다."""
+        try:
+            request = QEMUSnapshotRequest(**arguments)
+            session = self._get_session(request.session_id)
+            success, elapsed, error = await session.save_snapshot(request.name, request.timeout)
+            
+            response = QEMUSnapshotResponse(
+                success=success,
+                name=request.name,
+                elapsed_ms=_to_ms(elapsed),
+                snapshots=list(session.qemu.vm_snapshots),
+                error=error
+            )
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))],
+                isError=not success
             )
             
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"QEMU 시작 오류: {str(e)}")]
+                content=[TextContent(type="text", text=f"QEMU 스냅샷 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_qemu_restore(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """QEMU 머신 스냅샷 복원을 처리합니다."""
+        try:
+            request = QEMUSnapshotRequest(**arguments)
+            session = self._get_session(request.session_id)
+            success, elapsed, error = await session.restore_snapshot(request.name, request.timeout)
+            
+            response = QEMUSnapshotResponse(
+                success=success,
+                name=request.name,
+                elapsed_ms=_to_ms(elapsed),
+                frame=session.gdb.state.current_frame if success else None,
+                snapshots=list(session.qemu.vm_snapshots),
+                error=error
+            )
+            return CallToolResult(
+                content=[TextContent(type="text", text=response.model_dump_json(exclude_none=True))],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"QEMU 복원 오류: {str(e)}")],
+                isError=True
             )
     
     async def _handle_process_stop(self, arguments: Dict[str, Any]) -> CallToolResult:
         """프로세스 중지를 처리합니다."""
         try:
             request = ProcessStopRequest(**arguments)
+            session = self._get_session(request.session_id)
             
             if request.process_type.lower() == "gdb":
-                success, error = await self.gdb_manager.stop()
+                success, error = await session.gdb.stop()
             elif request.process_type.lower() == "qemu":
-                success, error = await self.qemu_manager.stop()
+                success, error = await session.qemu.stop()
+            elif request.process_type.lower() == "session":
+                success, error = await self.sessions.close(session.session_id)
             else:
                 return CallToolResult(
-                    content=[TextContent(type="text", text=f"알 수 없는 프로세스 타입: {request.process_type}")]
+                    content=[TextContent(type="text", text=f"알 수 없는 프로세스 타입: {request.process_type}")],
+                    isError=True
                 )
             
             response = ProcessStopResponse(success=success, error=error)
             
-            content = f"{request.process_type.upper()} 중지: {'성공' if success else '실패'}"
+            content = f"{request.process_type.upper()} 중지 (세션: {session.session_id}): {'성공' if success else '실패'}"
             if response.error:
                 content += f"\n오류: {response.error}"
                 
+            return CallToolResult(
+                content=[TextContent(type="text", text=content)],
+                isError=not success
+            )
+            
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"프로세스 중지 오류: {str(e)}")],
+                isError=True
+            )
+    
+    async def _handle_session_list(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """세션 목록 조회를 처리합니다."""
+        try:
+            response = SessionListResponse(
+                sessions=[SessionInfo(**session.describe()) for session in self.sessions.list()]
+            )
+            
+            content = f"세션 수: {len(response.sessions)}\n"
+            for info in response.sessions:
+                content += (
+                    f"- {info.session_id}: "
+                    f"GDB {'실행 중' if info.gdb_running else '중지'}"
+                    f"{f' (PID: {info.gdb_pid})' if info.gdb_pid else ''}, "
+                    f"QEMU {'실행 중' if info.qemu_running else '중지'}"
+                    f"{f' (PID: {info.qemu_pid})' if info.qemu_pid else ''}"
+                    f"{f' [GDB 엔드포인트: {info.qemu_endpoint}]' if info.qemu_endpoint else ''}"
+                    f"{f' [QEMU 상태: {info.qemu_status}]' if info.qemu_status else ''}\n"
+                )
+                
             return CallToolResult(
                 content=[TextContent(type="text", text=content)]
             )
             
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"프로세스 중지 오류: {str(e)}")]
+                content=[TextContent(type="text", text=f"세션 목록 조회 오류: {str(e)}")],
+                isError=True
             )
     
+    async def _handle_server_metrics(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """서버 지표 조회를 처리합니다."""
+        try:
+            request = ServerMetricsRequest(**arguments)
+            if request.format == "prometheus":
+                content = METRICS.to_prometheus()
+            elif request.format == "json":
+                content = json.dumps(METRICS.snapshot(), ensure_ascii=False)
+            else:
+                content = self._format_metrics(METRICS.snapshot())
+            if request.reset:
+                METRICS.reset()
+
+            return CallToolResult(
+                content=[TextContent(type="text", text=content)]
+            )
+
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"서버 지표 조회 오류: {str(e)}")],
+                isError=True
+            )
+
+    @staticmethod
+    def _format_metrics(snapshot: Dict[str, Any]) -> str:
+        """지표 요약을 사람이 읽기 쉬운 텍스트로 만듭니다."""
+        def latency(summary: Dict[str, Any]) -> str:
+            if not summary["count"]:
+                return "0회"
+            return (
+                f"{summary['count']}회, p50 {summary['p50_ms']:.3f}ms, p90 {summary['p90_ms']:.3f}ms, "
+                f"p99 {summary['p99_ms']:.3f}ms, 최대 {summary['max_ms']:.3f}ms"
+            )
+
+        content = f"서버 지표 (가동 {snapshot['uptime_s']:.0f}초, 실행 중 {snapshot['in_flight']}개):\n"
+        content += f"MCP 요청: {latency(snapshot['requests'])}\n"
+        if snapshot["tools"]:
+            content += "도구별:\n"
+            for tool, summary in snapshot["tools"].items():
+                content += f"  {tool}: {latency(summary)}"
+                if summary["errors"]:
+                    content += f", 에러 {summary['errors']}"
+                if summary["in_flight"]:
+                    content += f", 실행 중 {summary['in_flight']}"
+                content += "\n"
+        if snapshot["sessions"]:
+            content += "세션별:\n"
+            for session_id, summary in snapshot["sessions"].items():
+                content += f"  {session_id}: {latency(summary)}\n"
+        executor = snapshot["executor"]
+        content += (
+            f"실행기: 대기 {executor['queued']}, 실행 {executor['running']}, "
+            f"대기 시간 {latency(executor['wait'])}\n"
+        )
+        gdb = snapshot["gdb"]
+        content += (
+            f"GDB: 명령 {gdb['commands']}개, 수신 {gdb['bytes_in']}B / 송신 {gdb['bytes_out']}B, "
+            f"왕복 {latency(gdb['roundtrip'])}\n"
+        )
+        return content
+
+    def _get_session(self, session_id: Optional[str]) -> DebugSession:
+        """요청이 가리키는 세션을 조회하고 지표의 세션 레이블로 기록합니다."""
+        session = self.sessions.get(session_id)
+        _request_session.set(session.session_id)
+        return session
+    
+    def _session_for_start(self, session_id: Optional[str], new_session: bool) -> DebugSession:
+        """시작 요청에 사용할 세션을 결정합니다."""
+        if new_session:
+            session = self.sessions.create(session_id)
+        else:
+            session = self.sessions.get_or_create(session_id)
+        _request_session.set(session.session_id)
+        return session
+    
     async def run(self):
         """서버를 실행합니다."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="gdb-mcp",
-                    server_version="0.1.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None,
-                        experimental_capabilities={},
+        for target in DEFAULT_POOL_TARGETS:
+            self.pool.prewarm(GDBManager.build_command(target), target)
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="gdb-mcp",
+                        server_version="0.1.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={},
+                        ),
                     ),
-                ),
-            )
+                )
+        finally:
+            # 남아 있는 세션의 GDB와 QEMU 프로세스를 모두 정리합니다
+            try:
+                await self.sessions.close_all()
+            except Exception as e:
+                logger.error(f"세션 정리 실패: {e}")
+            await self.pool.close()
+            METRICS.export()
+            TRACER.close()
 
@@ -0,0 +1,187 @@
+"""디버그 세션 레지스트리 모듈."""
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .jobs import JobRegistry
+from .memory import SnapshotStore
+from .process_manager import GDBManager, QEMUManager
+
+logger = logging.getLogger(__name__)
+
+# 세션 ID를 지정하지 않은 요청이 사용하는 기본 세션
+DEFAULT_SESSION_ID = "default"
+
+# GDB 밖에서 머신 상태가 바뀌었음을 알리는 QMP 이벤트
+_VM_STATE_EVENTS = {"STOP", "RESUME", "RESET", "SHUTDOWN", "WAKEUP", "SUSPEND"}
+
+
+class SessionNotFoundError(Exception):
+    """존재하지 않는 세션을 참조했을 때 발생합니다."""
+
+
+class DebugSession:
+    """GDB와 QEMU 한 쌍을 묶는 독립 디버그 세션."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.gdb = GDBManager()
+        self.qemu = QEMUManager()
+        self.jobs = JobRegistry()
+        self.snapshots = SnapshotStore()
+        self.created_at = time.time()
+        self.qemu.add_event_listener(self._on_qemu_event)
+
+    def is_active(self) -> bool:
+        """세션에 실행 중인 프로세스가 있는지 확인합니다."""
+        return self.gdb.is_running() or self.qemu.is_running()
+
+    async def close(self) -> Tuple[bool, Optional[str]]:
+        """세션의 모든 프로세스를 중지합니다."""
+        self.jobs.cancel_all()
+        self.snapshots.clear()
+        errors = []
+        for manager in (self.gdb, self.qemu):
+            success, error = await manager.stop()
+            if not success and error:
+                errors.append(error)
+        if errors:
+            return False, "; ".join(errors)
+        return True, None
+
+    async def save_snapshot(self, name: str, timeout: float = 30.0) -> Tuple[bool, Optional[float], Optional[str]]:
+        """QEMU 머신 상태를 이름이 붙은 스냅샷으로 저장합니다.
+
+        QMP가 연결되어 있으면 QMP로, 아니면 GDB 모니터 명령으로 실행합니다.
+        (성공 여부, 걸린 시간(초), 에러)를 반환합니다.
+        """
+        error = self._check_vm_control()
+        if error:
+            return False, None, error
+        started = time.perf_counter()
+        success, _, error = await self._monitor(f"savevm {name}", timeout)
+        if not success:
+            return False, None, f"스냅샷 저장 실패: {error}"
+        self.qemu.vm_snapshots[name] = time.time()
+        return True, time.perf_counter() - started, None
+
+    async def restore_snapshot(self, name: str, timeout: float = 30.0) -> Tuple[bool, Optional[float], Optional[str]]:
+        """QEMU 머신을 스냅샷 시점으로 되돌립니다.
+
+        QEMU와 GDB 연결, 브레이크포인트는 유지되며 GDB 캐시만 다시 맞춥니다.
+        (성공 여부, 걸린 시간(초), 에러)를 반환합니다.
+        """
+        error = self._check_vm_control()
+        if error:
+            return False, None, error
+        started = time.perf_counter()
+        success, _, error = await self._monitor(f"loadvm {name}", timeout)
+        if not success:
+            return False, None, f"스냅샷 복원 실패: {error}"
+        if self.gdb.is_running():
+            error = await self.gdb.resync_target(timeout)
+            if error:
+                logger.warning(f"스냅샷 복원 후 GDB 상태 갱신 실패: {error}")
+        return True, time.perf_counter() - started, None
+
+    async def _monitor(self, command_line: str, timeout: float) -> Tuple[bool, str, Optional[str]]:
+        """QEMU 모니터 명령을 QMP로 실행하고, QMP가 없으면 GDB를 거쳐 실행합니다."""
+        if self.qemu.has_qmp():
+            return await self.qemu.human_monitor(command_line, timeout)
+        return await self.gdb.monitor(command_line, timeout)
+
+    def _check_vm_control(self) -> Optional[str]:
+        """머신 스냅샷을 다룰 수 있는 상태인지 확인합니다."""
+        if not self.qemu.is_running():
+            return "QEMU가 실행 중이 아닙니다"
+        if not self.gdb.is_running():
+            return None if self.qemu.has_qmp() else "GDB가 시작되지 않았고 QMP도 연결되어 있지 않습니다"
+        if self.gdb.state.execution_state == "running":
+            return "타겟이 실행 중입니다. 먼저 정지하세요"
+        return None
+
+    def _on_qemu_event(self, event: Dict[str, Any]) -> None:
+        """QMP 이벤트를 세션 상태에 반영합니다.
+
+        GDB를 거치지 않고 머신이 멈추거나 재개, 리셋되면 GDB의 조회 캐시가
+        더 이상 유효하지 않으므로 정지 세대를 올립니다.
+        """
+        if event.get("event") in _VM_STATE_EVENTS:
+            self.gdb.state.bump_epoch()
+
+    def describe(self) -> Dict[str, object]:
+        """세션 요약 정보를 반환합니다."""
+        return {
+            "session_id": self.session_id,
+            "gdb_running": self.gdb.is_running(),
+            "gdb_pid": self.gdb.pid,
+            "qemu_running": self.qemu.is_running(),
+            "qemu_pid": self.qemu.pid,
+            "qemu_endpoint": self.qemu.endpoint,
+            "qemu_status": self.qemu.status,
+            "created_at": self.created_at,
+        }
+
+
+class SessionRegistry:
+    """세션 ID로 디버그 세션을 관리하는 레지스트리."""
+
+    def __init__(self):
+        self._sessions: Dict[str, DebugSession] = {}
+
+    def create(self, session_id: Optional[str] = None) -> DebugSession:
+        """새 세션을 생성합니다."""
+        if session_id is None:
+            session_id = uuid.uuid4().hex[:12]
+        if session_id in self._sessions:
+            raise ValueError(f"이미 존재하는 세션입니다: {session_id}")
+        session = DebugSession(session_id)
+        self._sessions[session_id] = session
+        logger.info(f"세션 생성: {session_id}")
+        return session
+
+    def get(self, session_id: Optional[str] = None) -> DebugSession:
+        """세션을 조회합니다. 없으면 SessionNotFoundError를 발생시킵니다.
+
+        기본 세션은 처음 참조될 때 생성됩니다.
+        """
+        session_id = session_id or DEFAULT_SESSION_ID
+        if session_id == DEFAULT_SESSION_ID:
+            return self.get_or_create(session_id)
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(f"알 수 없는 세션: {session_id}")
+        return session
+
+    def get_or_create(self, session_id: Optional[str] = None) -> DebugSession:
+        """세션을 조회하고, 없으면 새로 생성합니다."""
+        session_id = session_id or DEFAULT_SESSION_ID
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self.create(session_id)
+        return session
+
+    async def close(self, session_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """세션을 종료하고 레지스트리에서 제거합니다."""
+        session = self.get(session_id)
+        success, error = await session.close()
+        self._sessions.pop(session.session_id, None)
+        logger.info(f"세션 종료: {session.session_id}")
+        return success, error
+
+    async def close_all(self) -> None:
+        """모든 세션을 종료합니다."""
+        for session_id in list(self._sessions):
+            await self.close(session_id)
+
+    def list(self) -> List[DebugSession]:
+        """등록된 세션 목록을 반환합니다."""
+        return list(self._sessions.values())
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
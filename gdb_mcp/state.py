@@ -0,0 +1,347 @@
+"""GDB/MI 비동기 레코드 기반 세션 상태 캐시 모듈."""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 정지 세대별 캐시에 보관하는 최대 항목 수
+_STOP_CACHE_MAX_ENTRIES = 128
+
+# 타겟이 멈춰 있는 동안 결과가 바뀌지 않는 조회 명령
+_CACHEABLE_COMMANDS = (
+    "info registers", "info all-registers", "info reg", "i r",
+    "bt", "backtrace", "where", "info stack",
+    "info frame", "info f", "info locals", "info args", "info threads",
+    "-stack-list-frames", "-stack-list-locals", "-stack-list-arguments",
+    "-stack-list-variables", "-stack-info-frame", "-stack-info-depth",
+    "-data-list-register-values", "-data-list-register-names", "-thread-info",
+)
+
+# 타겟 상태(메모리, 레지스터, 선택된 프레임 등)나 출력 형식을 바꿀 수 있는 명령
+_STATE_CHANGING_COMMANDS = {
+    "set", "call", "frame", "f", "up", "down", "select-frame", "thread",
+    "load", "restore", "monitor", "maintenance", "flushregs", "file", "symbol-file",
+    "-data-write-memory", "-data-write-memory-bytes", "-data-write-register-values",
+    "-var-assign", "-stack-select-frame", "-thread-select", "-target-download",
+    "-interpreter-exec", "-gdb-set", "-file-exec-and-symbols", "-file-symbol-file",
+    # *stopped 레코드 없이 프레임이나 레지스터를 바꾸는 명령
+    "return", "-exec-return", "kill", "-exec-abort", "detach", "-target-detach",
+    "disconnect", "-target-disconnect", "target", "-target-select", "attach", "-target-attach",
+    # 임의의 명령을 실행할 수 있는 명령
+    "source", "python", "py", "python-interactive", "pi",
+}
+
+# 식을 인자로 받아 평가하는 명령 (식 안의 대입/증감 연산은 타겟 상태를 바꿉니다)
+_CLI_EXPRESSION_COMMANDS = {"print", "p", "inspect", "output", "call"}
+_MI_EXPRESSION_COMMANDS = {"-data-evaluate-expression"}
+
+# 값을 하나 더 받는 MI 옵션
+_MI_OPTIONS_WITH_VALUE = {"--thread", "--frame", "--language"}
+
+# 식 안에서 대입이나 증감 연산을 찾는 패턴
+_ASSIGNMENT_RE = re.compile(r"(?<![=!<>])=(?!=)|\+\+|--")
+
+
+def normalize_command(command: str) -> str:
+    """공백을 정규화한 명령 문자열을 반환합니다."""
+    return " ".join(command.split())
+
+
+def is_cacheable_command(command: str) -> bool:
+    """타겟이 멈춰 있는 동안 결과를 캐시할 수 있는 조회 명령인지 확인합니다."""
+    command = normalize_command(command)
+    return any(command == prefix or command.startswith(prefix + " ") for prefix in _CACHEABLE_COMMANDS)
+
+
+def _expression_argument(command: str) -> Optional[str]:
+    """print/call 등 식을 평가하는 명령이면 식 부분을, 아니면 None을 반환합니다."""
+    words = command.split(None, 1)
+    name = words[0].split("/", 1)[0]
+    rest = words[1] if len(words) > 1 else ""
+    if name in _CLI_EXPRESSION_COMMANDS:
+        # print -pretty -elements 4 -- expr 형식의 옵션은 "--" 뒤부터가 식입니다
+        if rest.startswith("-"):
+            match = re.search(r"(?:^|\s)--(?:\s|$)", rest)
+            if match:
+                rest = rest[match.end():]
+        return rest
+    if name in _MI_EXPRESSION_COMMANDS:
+        tokens = rest.split()
+        index = 0
+        while index < len(tokens) and tokens[index].startswith("--"):
+            index += 2 if tokens[index] in _MI_OPTIONS_WITH_VALUE else 1
+        return " ".join(tokens[index:])
+    return None
+
+
+def is_state_changing_command(command: str) -> bool:
+    """메모리나 레지스터 등 캐시된 결과를 바꿀 수 있는 명령인지 확인합니다."""
+    words = command.split(None, 1)
+    if not words:
+        return False
+    if words[0] in _STATE_CHANGING_COMMANDS:
+        return True
+    expression = _expression_argument(command)
+    return expression is not None and bool(_ASSIGNMENT_RE.search(expression))
+
+
+class SessionState:
+    """MI 비동기 레코드로 갱신되는 GDB 세션 상태.
+
+    `*stopped`/`*running`, `=breakpoint-*`, `=thread-group-*` 등의 레코드를
+    받아 메모리에 유지하므로, 상태 조회 시 GDB에 명령을 보내지 않습니다.
+    """
+
+    def __init__(self):
+        self.execution_state: Optional[str] = None
+        self.stop_reason: Optional[str] = None
+        self.stop_record: Optional[Dict[str, Any]] = None
+        self.current_frame: Optional[Dict[str, Any]] = None
+        self.current_thread: Optional[str] = None
+        self.breakpoints: Dict[str, Dict[str, Any]] = {}
+        self.thread_groups: Dict[str, Dict[str, Any]] = {}
+        self.threads: Dict[str, Dict[str, Any]] = {}
+        self.updated_at: Optional[float] = None
+        self.epoch = 0
+
+    def handle_record(self, record: Dict[str, Any]) -> None:
+        """MI 레코드 하나를 상태에 반영합니다."""
+        record_type = record["type"]
+        if record_type == "notify":
+            handler = self._NOTIFY_HANDLERS.get(record["message"])
+            if handler is not None:
+                handler(self, record.get("payload") or {})
+                self.updated_at = time.time()
+        elif record_type == "result":
+            payload = record.get("payload") or {}
+            # MI -break-insert 결과는 =breakpoint-created 없이 결과에만 담깁니다
+            if "bkpt" in payload:
+                self._on_breakpoint_created(payload)
+                self.updated_at = time.time()
+            elif "BreakpointTable" in payload:
+                self._load_breakpoint_table(payload["BreakpointTable"])
+                self.updated_at = time.time()
+
+    def apply_command(self, command: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        """성공한 MI 명령의 효과를 상태에 반영합니다.
+
+        GDB는 MI 명령으로 바꾼 브레이크포인트와 선택 스레드에 대해서는
+        =breakpoint-modified, =thread-selected 등의 알림을 보내지 않습니다.
+        """
+        words = command.split()
+        handler = self._COMMAND_HANDLERS.get(words[0]) if words else None
+        if handler is not None:
+            handler(self, words[1:], payload or {})
+            self.updated_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태를 딕셔너리로 반환합니다."""
+        return {
+            "execution_state": self.execution_state,
+            "stop_reason": self.stop_reason,
+            "current_frame": self.current_frame,
+            "current_thread": self.current_thread,
+            "breakpoints": list(self.breakpoints.values()),
+            "thread_groups": dict(self.thread_groups),
+            "updated_at": self.updated_at,
+            "epoch": self.epoch,
+        }
+
+    def bump_epoch(self) -> int:
+        """정지 세대를 증가시켜 이전 세대에 캐시된 결과를 무효화합니다."""
+        self.epoch += 1
+        return self.epoch
+
+    def _on_stopped(self, payload: Dict[str, Any]) -> None:
+        self.bump_epoch()
+        self.execution_state = "stopped"
+        self.stop_reason = payload.get("reason")
+        self.stop_record = payload
+        if "frame" in payload:
+            self.current_frame = payload["frame"]
+        if "thread-id" in payload:
+            self.current_thread = payload["thread-id"]
+        if self.stop_reason in ("exited", "exited-normally", "exited-signalled"):
+            self.execution_state = "exited"
+            self.current_frame = None
+
+    def _on_running(self, payload: Dict[str, Any]) -> None:
+        self.bump_epoch()
+        self.execution_state = "running"
+        self.stop_reason = None
+        self.current_frame = None
+
+    def _on_memory_changed(self, payload: Dict[str, Any]) -> None:
+        self.bump_epoch()
+
+    def _on_thread_selected(self, payload: Dict[str, Any]) -> None:
+        self.bump_epoch()
+        self.current_thread = payload.get("id", self.current_thread)
+        if "frame" in payload:
+            self.current_frame = payload["frame"]
+
+    def _on_breakpoint_created(self, payload: Dict[str, Any]) -> None:
+        bkpt = payload.get("bkpt")
+        if isinstance(bkpt, dict) and "number" in bkpt:
+            self.breakpoints[bkpt["number"]] = bkpt
+
+    def _on_breakpoint_deleted(self, payload: Dict[str, Any]) -> None:
+        self.breakpoints.pop(payload.get("id"), None)
+
+    def _load_breakpoint_table(self, table: Dict[str, Any]) -> None:
+        self.breakpoints = {}
+        for bkpt in table.get("body") or []:
+            if isinstance(bkpt, dict) and "number" in bkpt:
+                self.breakpoints[bkpt["number"]] = bkpt
+
+    def _on_thread_group_added(self, payload: Dict[str, Any]) -> None:
+        self.thread_groups[payload["id"]] = {"status": "added"}
+
+    def _on_thread_group_removed(self, payload: Dict[str, Any]) -> None:
+        self.thread_groups.pop(payload.get("id"), None)
+
+    def _on_thread_group_started(self, payload: Dict[str, Any]) -> None:
+        self.thread_groups[payload["id"]] = {"status": "started", "pid": payload.get("pid")}
+
+    def _on_thread_group_exited(self, payload: Dict[str, Any]) -> None:
+        group = {"status": "exited"}
+        if "exit-code" in payload:
+            group["exit_code"] = payload["exit-code"]
+        self.thread_groups[payload["id"]] = group
+
+    def _on_thread_created(self, payload: Dict[str, Any]) -> None:
+        self.threads[payload["id"]] = {"group_id": payload.get("group-id")}
+
+    def _on_thread_exited(self, payload: Dict[str, Any]) -> None:
+        self.threads.pop(payload.get("id"), None)
+
+    def _cmd_break_delete(self, args: List[str], payload: Dict[str, Any]) -> None:
+        numbers = [arg for arg in args if not arg.startswith("-")]
+        if not numbers:
+            self.breakpoints = {}
+        for number in numbers:
+            self.breakpoints.pop(number, None)
+
+    def _set_breakpoints_enabled(self, args: List[str], enabled: str) -> None:
+        numbers = [arg for arg in args if not arg.startswith("-")] or list(self.breakpoints)
+        for number in numbers:
+            if number in self.breakpoints:
+                self.breakpoints[number] = dict(self.breakpoints[number], enabled=enabled)
+
+    def _cmd_break_enable(self, args: List[str], payload: Dict[str, Any]) -> None:
+        self._set_breakpoints_enabled(args, "y")
+
+    def _cmd_break_disable(self, args: List[str], payload: Dict[str, Any]) -> None:
+        self._set_breakpoints_enabled(args, "n")
+
+    def _cmd_break_condition(self, args: List[str], payload: Dict[str, Any]) -> None:
+        args = [arg for arg in args if arg != "--force"]
+        if not args or args[0] not in self.breakpoints:
+            return
+        bkpt = dict(self.breakpoints[args[0]])
+        condition = " ".join(args[1:])
+        if condition:
+            bkpt["cond"] = condition
+        else:
+            bkpt.pop("cond", None)
+        self.breakpoints[args[0]] = bkpt
+
+    def _cmd_thread_select(self, args: List[str], payload: Dict[str, Any]) -> None:
+        self.current_thread = payload.get("new-thread-id", args[0] if args else self.current_thread)
+        if "frame" in payload:
+            self.current_frame = payload["frame"]
+
+    _COMMAND_HANDLERS = {
+        "-break-delete": _cmd_break_delete,
+        "-break-enable": _cmd_break_enable,
+        "-break-disable": _cmd_break_disable,
+        "-break-condition": _cmd_break_condition,
+        "-thread-select": _cmd_thread_select,
+    }
+
+    _NOTIFY_HANDLERS = {
+        "stopped": _on_stopped,
+        "running": _on_running,
+        "thread-selected": _on_thread_selected,
+        "memory-changed": _on_memory_changed,
+        "breakpoint-created": _on_breakpoint_created,
+        "breakpoint-modified": _on_breakpoint_created,
+        "breakpoint-deleted": _on_breakpoint_deleted,
+        "thread-group-added": _on_thread_group_added,
+        "thread-group-removed": _on_thread_group_removed,
+        "thread-group-started": _on_thread_group_started,
+        "thread-group-exited": _on_thread_group_exited,
+        "thread-created": _on_thread_created,
+        "thread-exited": _on_thread_exited,
+    }
+
+
+class StopEpochCache:
+    """정지 세대(epoch)별 조회 결과 캐시.
+
+    타겟이 멈춰 있는 동안에는 레지스터, 프레임, 지역 변수가 바뀌지 않으므로
+    같은 세대 안에서 반복되는 조회는 GDB에 보내지 않고 캐시에서 응답합니다.
+    세대가 바뀌면 이전 세대의 항목을 모두 버립니다.
+    """
+
+    def __init__(self, max_entries: int = _STOP_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._epoch: Optional[int] = None
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, epoch: int, key: Hashable) -> Optional[Any]:
+        """현재 세대에 캐시된 결과를 반환합니다. 없으면 None."""
+        if epoch == self._epoch and key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, epoch: int, key: Hashable, value: Any) -> None:
+        """결과를 저장합니다. 조회 중에 세대가 바뀌었으면 저장하지 않습니다."""
+        if epoch != self._epoch:
+            if self._epoch is not None and epoch < self._epoch:
+                return
+            self._epoch = epoch
+            self._entries.clear()
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        return {
+            "epoch": self._epoch,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def format_frame(frame: Optional[Dict[str, Any]]) -> str:
+    """MI 프레임 정보를 한 줄 문자열로 변환합니다."""
+    if not frame:
+        return ""
+    text = frame.get("func") or "??"
+    if frame.get("file"):
+        text += f" ({frame['file']}:{frame.get('line', '?')})"
+    if frame.get("addr"):
+        text += f" @ {frame['addr']}"
+    return text
+
+
+def summarize_breakpoints(breakpoints: List[Dict[str, Any]]) -> List[str]:
+    """브레이크포인트 목록을 사람이 읽기 쉬운 문자열로 변환합니다."""
+    lines = []
+    for bkpt in breakpoints:
+        location = bkpt.get("original-location") or format_frame(bkpt) or bkpt.get("what", "")
+        lines.append(f"#{bkpt.get('number')} {bkpt.get('type', 'breakpoint')} {location}".rstrip())
+    return lines
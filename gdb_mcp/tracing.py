@@ -0,0 +1,247 @@
+"""요청 단위 구간(span) 추적 모듈.
+
+MCP 도구 요청 하나를 샘플링하여, 요청 처리(스키마 검증 포함) → 도구 핸들러 →
+GDBManager/QEMUManager → GDB/MI, QMP 입출력까지의 구간을 기록합니다.
+현재 구간은 contextvars로 전달되므로 같은 요청에서 만든 태스크와 실행기 작업도
+같은 추적에 이어집니다. 요청보다 오래 사는 백그라운드 태스크(전송 계층 읽기 루프,
+풀 채우기, 백그라운드 작업 등)는 detached_task로 시작하여 추적을 물려받지 않게 합니다.
+샘플링되지 않은 요청은 컨텍스트 변수 조회 한 번만 합니다.
+
+구간은 Chrome 추적 형식("X" 이벤트)의 JSON Lines로 저장합니다. 첫 줄이 "["이고
+이벤트마다 한 줄씩 쉼표로 끝나므로, 서버가 실행 중이어도 그대로
+chrome://tracing 이나 Perfetto UI에서 열 수 있습니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, TextIO
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 구간을 기록할 파일 (설정하지 않으면 추적하지 않음)
+TRACE_FILE = os.environ.get("GDB_MCP_TRACE_FILE")
+
+# 추적할 요청의 비율 (0.0 ~ 1.0)
+TRACE_SAMPLE = float(os.environ.get("GDB_MCP_TRACE_SAMPLE", 1.0))
+
+# 기록할 인자 문자열의 최대 길이
+_ARG_LIMIT = 200
+
+
+class Span:
+    """진행 중인 구간."""
+
+    __slots__ = ("name", "cat", "trace_id", "start", "args")
+
+    def __init__(self, name: str, cat: str, trace_id: int, args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.trace_id = trace_id
+        self.start = time.perf_counter()
+        self.args = args
+
+
+# 현재 요청에서 열려 있는 가장 안쪽 구간 (샘플링되지 않았으면 None)
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "gdb_mcp_current_span", default=None
+)
+
+
+class _SpanScope:
+    """구간을 열고 닫는 컨텍스트 관리자."""
+
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self.tracer = tracer
+        self.span = span
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.span.start = time.perf_counter()
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_span.reset(self.token)
+        if exc_type is not None:
+            self.span.args["error"] = exc_type.__name__
+        self.tracer.finish(self.span)
+
+
+class _NullScope:
+    """추적하지 않을 때 사용하는 빈 컨텍스트 관리자."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Tracer:
+    """구간을 샘플링하고 Chrome 추적 형식 파일로 내보냅니다."""
+
+    def __init__(self, path: Optional[str] = TRACE_FILE, sample: float = TRACE_SAMPLE):
+        self.path = path
+        self.sample = min(max(sample, 0.0), 1.0)
+        self.pid = os.getpid()
+        self._trace_ids = itertools.count(1)
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """추적 파일이 설정되어 있고 샘플링 비율이 0보다 큰지 여부."""
+        return bool(self.path) and self.sample > 0
+
+    def trace(self, name: str, cat: str = "mcp", **args: Any):
+        """새 추적의 최상위 구간을 엽니다. 샘플링되지 않으면 아무것도 기록하지 않습니다."""
+        if not self.enabled or (self.sample < 1.0 and random.random() >= self.sample):
+            return _NULL_SCOPE
+        return _SpanScope(self, Span(name, cat, next(self._trace_ids), args))
+
+    def span(self, name: str, cat: str = "server", **args: Any):
+        """현재 추적 안에 하위 구간을 엽니다. 추적 중이 아니면 아무것도 기록하지 않습니다."""
+        parent = _current_span.get()
+        if parent is None:
+            return _NULL_SCOPE
+        return _SpanScope(self, Span(name, cat, parent.trace_id, args))
+
+    def record(self, name: str, cat: str, start: float, end: float, **args: Any) -> None:
+        """이미 끝난 구간(perf_counter 기준 시작/끝)을 현재 추적에 기록합니다."""
+        parent = _current_span.get()
+        if parent is None:
+            return
+        span = Span(name, cat, parent.trace_id, args)
+        span.start = start
+        self.finish(span, end)
+
+    def finish(self, span: Span, end: Optional[float] = None) -> None:
+        """구간을 닫고 이벤트를 파일에 씁니다."""
+        end = time.perf_counter() if end is None else end
+        event = {
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": round(span.start * 1e6, 3),
+            "dur": round((end - span.start) * 1e6, 3),
+            "pid": self.pid,
+            # 요청마다 한 줄에 보이도록 추적 ID를 스레드 ID로 사용합니다
+            "tid": span.trace_id,
+        }
+        thread = threading.current_thread()
+        if thread is not threading.main_thread():
+            span.args["thread"] = thread.name
+        if span.args:
+            event["args"] = {key: _format_arg(value) for key, value in span.args.items()}
+        self._write(event, flush=_current_span.get() is None)
+
+    def _write(self, event: Dict[str, Any], flush: bool) -> None:
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._file = self._open()
+                self._file.write(json.dumps(event, ensure_ascii=False) + ",\n")
+                if flush:
+                    self._file.flush()
+            except OSError as e:
+                logger.warning(f"추적 파일 쓰기 실패 ({self.path}): {e}")
+                self.path = None
+
+    def _open(self) -> TextIO:
+        """추적 파일을 이어 쓰기로 엽니다. 새 파일이면 배열 시작과 프로세스 이름을 씁니다."""
+        f = open(self.path, "a", encoding="utf-8")
+        if f.tell() == 0:
+            f.write("[\n")
+            f.write(json.dumps({
+                "name": "process_name", "ph": "M", "pid": self.pid, "tid": 0,
+                "args": {"name": f"gdb-mcp ({self.pid})"},
+            }) + ",\n")
+        return f
+
+    def close(self) -> None:
+        """추적 파일을 닫습니다."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _format_arg(value: Any) -> Any:
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    text = str(value)
+    return text if len(text) <= _ARG_LIMIT else text[:_ARG_LIMIT] + "..."
+
+
+# 프로세스 전체에서 공유하는 추적기
+TRACER = Tracer()
+
+
+def span(name: str, cat: str = "server", **args: Any):
+    """현재 추적 안에 하위 구간을 엽니다."""
+    return TRACER.span(name, cat, **args)
+
+
+def detached_task(awaitable: Awaitable[Any]) -> "asyncio.Future[Any]":
+    """현재 추적과 분리된 컨텍스트에서 백그라운드 태스크를 시작합니다.
+
+    태스크는 생성 시점의 컨텍스트를 복사하므로, 그대로 두면 요청이 끝난 뒤의
+    입출력까지 그 요청의 추적에 기록됩니다.
+    """
+    context = contextvars.copy_context()
+    context.run(_current_span.set, None)
+    return context.run(asyncio.ensure_future, awaitable)
+
+
+def traced(name: Optional[str] = None, cat: str = "manager",
+           capture: Sequence[str] = ()) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """비동기 메서드 실행을 구간으로 기록하는 데코레이터.
+
+    capture에 지정한 인자는 구간의 args에 기록합니다 (예: command).
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if capture else None
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_span.get() is None:
+                return await func(*args, **kwargs)
+            span_args = {}
+            if signature is not None:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                span_args = {key: bound[key] for key in capture if key in bound}
+            with TRACER.span(span_name, cat, **span_args):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_request_handler(handler: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """MCP 도구 요청 핸들러를 감싸 샘플링된 요청의 최상위 구간을 기록합니다.
+
+    응답 직렬화는 핸들러가 반환한 뒤 MCP 전송 계층에서 일어나므로 구간에 포함되지 않습니다.
+    """
+    @functools.wraps(handler)
+    async def wrapper(request: Any) -> Any:
+        if not TRACER.enabled:
+            return await handler(request)
+        with TRACER.trace(f"tools/call {request.params.name}", "mcp", tool=request.params.name):
+            return await handler(request)
+    return wrapper
@@ -0,0 +1,13 @@
+"""공통 테스트 픽스처."""
+
+import pytest
+
+from gdb_mcp.metrics import METRICS
+from gdb_mcp.server import GDBMCPServer
+
+
+@pytest.fixture
+def server():
+    METRICS.reset()
+    yield GDBMCPServer()
+    METRICS.reset()
@@ -0,0 +1,48 @@
+"""테스트용 최소 GDB/MI 프로세스.
+
+첫 프롬프트 전에 --delay 초만큼 기다리고, 모든 명령에 ^done으로 응답합니다.
+-gdb-exit를 받으면 종료합니다. 전송 계층 테스트용으로 다음 명령을 지원합니다.
+
+    -fake-echo TEXT  토큰 없는 콘솔 레코드로 TEXT를 출력한 뒤 응답합니다
+    -fake-hold       응답하지 않고 보류합니다
+    -fake-release    자신에게 먼저 응답한 뒤, 보류한 명령에 나중 것부터 응답합니다
+    -fake-exit       응답하지 않고 즉시 종료합니다
+"""
+
+import re
+import sys
+import time
+
+
+def write(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def main() -> None:
+    if "--delay" in sys.argv:
+        time.sleep(float(sys.argv[sys.argv.index("--delay") + 1]))
+    write("(gdb) \n")
+    held = []
+    for line in sys.stdin:
+        token, command = re.match(r"^(\d*)(.*)$", line.rstrip("\n")).groups()
+        command = command.strip()
+        if command in ("-gdb-exit", "quit"):
+            write(f"{token}^exit\n")
+            break
+        if command == "-fake-exit":
+            break
+        if command == "-fake-hold":
+            held.append(token)
+            continue
+        if command.startswith("-fake-echo "):
+            write(f'~"{command[len("-fake-echo "):]}\\n"\n')
+        write(f"{token}^done\n(gdb) \n")
+        if command == "-fake-release":
+            for held_token in reversed(held):
+                write(f'{held_token}^done,value="{held_token}"\n(gdb) \n')
+            held.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""테스트용 최소 QEMU 프로세스.
+
+-gdb tcp::PORT 또는 -gdb unix:PATH,... 인자로 받은 GDB 스텁 주소에서 접속을
+받고, 종료 신호를 받을 때까지 실행됩니다. 다음 옵션을 지원합니다.
+
+    -fake-delay N  스텁을 열기 전에 N초 기다립니다
+    -fake-exit     stderr에 에러를 출력하고 즉시 종료합니다
+"""
+
+import socket
+import sys
+import time
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if "-fake-exit" in args:
+        sys.stderr.write("qemu-system-fake: could not load kernel\n")
+        sys.stderr.flush()
+        sys.exit(1)
+    if "-fake-delay" in args:
+        time.sleep(float(args[args.index("-fake-delay") + 1]))
+    if "-gdb" not in args:
+        while True:
+            time.sleep(1)
+    address = args[args.index("-gdb") + 1]
+    if address.startswith("tcp::"):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", int(address[len("tcp::"):])))
+    else:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(address[len("unix:"):].split(",", 1)[0])
+    server.listen()
+    while True:
+        connection, _ = server.accept()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""테스트에서 함께 쓰는 가짜 GDB 전송 계층과 프로세스."""
+
+import asyncio
+import os
+import sys
+
+from gdb_mcp.mi_transport import MIResponse
+
+# 최소 GDB/MI 프로세스와 QEMU 프로세스 (fake_gdb.py, fake_qemu.py 참고)
+FAKE_GDB = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_gdb.py")]
+FAKE_QEMU = os.path.join(os.path.dirname(__file__), "fake_qemu.py")
+
+
+class FakeTransport:
+    """명령마다 미리 정한 응답을 돌려주는 GDB/MI 전송 계층.
+
+    -data-read-memory-bytes는 base 주소부터의 memory를 읽고 (readable 구간 밖은
+    읽기 실패), -data-evaluate-expression은 value를, show index-cache는
+    show_output을 돌려줍니다. 그 밖의 명령은 명령 문자열을 콘솔 출력으로 돌려줍니다.
+    """
+
+    pid = 4242
+    command = ["gdb", "--interpreter=mi2"]
+
+    def __init__(self, memory: bytes = b"", base: int = 0, readable=None,
+                 value: str = "0x20000010 <buffer>", show_output: str = ""):
+        self.memory = memory
+        self.base = base
+        # 읽을 수 있는 구간 목록 [(시작 주소, 끝 주소)], None이면 전체
+        self.readable = readable
+        self.value = value
+        self.show_output = show_output
+        self.listeners = []
+        self.sent = []
+
+    def is_alive(self):
+        return True
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _read(self, command: str) -> MIResponse:
+        _, address, size = command.split()
+        address, size = int(address, 0), int(size)
+        blocks = []
+        ranges = self.readable or [(self.base, self.base + len(self.memory))]
+        for start, end in ranges:
+            begin, stop = max(start, address), min(end, address + size)
+            if begin >= stop:
+                continue
+            data = self.memory[begin - self.base:stop - self.base]
+            blocks.append({
+                "begin": f"{begin:#x}",
+                "offset": f"{begin - address:#x}",
+                "end": f"{stop:#x}",
+                "contents": data.hex(),
+            })
+        if not blocks:
+            return MIResponse(command, [], {"message": "error", "payload": {"msg": "Unable to read memory."}})
+        return MIResponse(command, [], {"message": "done", "payload": {"memory": blocks}})
+
+    def _respond(self, command: str) -> MIResponse:
+        self.sent.append(command)
+        if command.startswith("-data-read-memory-bytes "):
+            return self._read(command)
+        if command.startswith("-data-evaluate-expression "):
+            return MIResponse(command, [], {"message": "done", "payload": {"value": self.value}})
+        output = self.show_output if command == "show index-cache" else f"{command}\n"
+        return MIResponse(command, [{"type": "console", "payload": output}], {"message": "done", "payload": None})
+
+    async def execute(self, command, timeout=None):
+        return self._respond(command)
+
+    async def execute_many(self, commands, timeout=None):
+        return [self._respond(command) for command in commands]
+
+
+class ExecutionTransport(FakeTransport):
+    """실행 명령에 ^running으로 응답한 뒤 출력과 *stopped 레코드를 보내는 전송 계층."""
+
+    def __init__(self, outputs=("hello\n",), stop=True, error=None):
+        super().__init__()
+        self.outputs = outputs
+        self.stop = stop
+        self.error = error
+
+    def _emit(self, record):
+        for listener in list(self.listeners):
+            listener(record)
+
+    async def _run(self):
+        await asyncio.sleep(0)
+        for text in self.outputs:
+            self._emit({"type": "target", "payload": text})
+            await asyncio.sleep(0)
+        if self.stop:
+            self._emit({"type": "notify", "message": "stopped",
+                        "payload": {"reason": "breakpoint-hit", "frame": {"addr": "0x100"}}})
+
+    async def execute(self, command, timeout=None):
+        self.sent.append(command)
+        if self.error is not None:
+            return MIResponse(command, [], {"message": "error", "payload": {"msg": self.error}})
+        self._emit({"type": "notify", "message": "running", "payload": {"thread-id": "all"}})
+        asyncio.ensure_future(self._run())
+        return MIResponse(command, [], {"message": "running", "payload": None})
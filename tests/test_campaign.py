@@ -0,0 +1,188 @@
+"""캠페인 실행기 테스트."""
+
+import asyncio
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from gdb_mcp import process_manager
+from gdb_mcp.campaign import CampaignRunner, load_gdb_script, main, write_json, write_junit
+from gdb_mcp.models import CampaignManifest
+from gdb_mcp.process_manager import GDBManager, QEMUManager
+from gdb_mcp.session import DebugSession
+from tests.fakes import FAKE_GDB
+
+
+def write_script(tmp_path, text):
+    path = tmp_path / "run.gdb"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_gdb_script_skips_comments_and_blank_lines(tmp_path):
+    path = write_script(tmp_path, "# setup\n\nbreak main\n  continue  \n")
+    assert load_gdb_script(path) == ["break main", "continue"]
+
+
+def test_load_gdb_script_groups_blocks(tmp_path):
+    path = write_script(tmp_path, """\
+define dump_regs
+  # 블록 안의 주석
+  if $pc != 0
+    info registers
+  end
+end
+document dump_regs
+if this line is text, not a command
+end
+break done
+commands
+  silent
+  print result
+end
+python
+if True:
+    gdb.execute("info frame")
+end
+python print(1)
+define-prefix mine
+continue
+""")
+    assert load_gdb_script(path) == [
+        "define dump_regs\nif $pc != 0\ninfo registers\nend\nend",
+        "document dump_regs\nif this line is text, not a command\nend",
+        "break done",
+        "commands\nsilent\nprint result\nend",
+        'python\nif True:\ngdb.execute("info frame")\nend',
+        "python print(1)",
+        "define-prefix mine",
+        "continue",
+    ]
+
+
+@pytest.mark.parametrize("text", ["while $i < 3\nset $i = $i + 1\n", "break main\nend\n"])
+def test_load_gdb_script_rejects_unbalanced_blocks(tmp_path, text):
+    with pytest.raises(ValueError):
+        load_gdb_script(write_script(tmp_path, text))
+
+
+def test_source_block_runs_block_from_temporary_file():
+    session = DebugSession("campaign-test")
+    sourced = []
+
+    async def execute_command(command, timeout=30.0):
+        path = command.split(" ", 1)[1]
+        with open(path, encoding="utf-8") as f:
+            sourced.append((command.split(" ", 1)[0], path, f.read()))
+        return True, "", None
+
+    session.gdb.execute_command = execute_command
+    block = "define hello\necho hi\\n\nend"
+    result = asyncio.run(CampaignRunner._source_block(session, block, 1.0))
+    assert result == (True, "", None)
+    (verb, path, content), = sourced
+    assert verb == "source"
+    assert content == block + "\n"
+    with pytest.raises(FileNotFoundError):
+        open(path)
+
+
+def make_summary():
+    return {
+        "jobs": 2,
+        "total": 3,
+        "passed": 1,
+        "failed": 1,
+        "error": 1,
+        "wall_ms": 1500.0,
+        "case_ms_sum": 2500.0,
+        "cases": [
+            {"name": "uart", "status": "passed", "duration_ms": 1000.0, "message": None,
+             "console_tail": None, "gdb_output": "$1 = 0"},
+            {"name": "crc", "status": "failed", "duration_ms": 1000.0, "message": "실패 출력: TEST FAIL",
+             "console_tail": "TEST FAIL\n", "gdb_output": None},
+            {"name": "boot", "status": "error", "duration_ms": 500.0, "message": None,
+             "console_tail": None, "gdb_output": None},
+        ],
+    }
+
+
+def test_write_json_round_trip(tmp_path):
+    path = tmp_path / "report.json"
+    summary = make_summary()
+    write_json(str(path), summary)
+    text = path.read_text(encoding="utf-8")
+    assert "실패 출력" in text
+    assert json.loads(text) == summary
+
+
+def test_write_junit(tmp_path):
+    path = tmp_path / "report.xml"
+    write_junit(str(path), make_summary(), suite_name="suite")
+    root = ET.parse(str(path)).getroot()
+    assert root.tag == "testsuites"
+    suite, = root
+    assert suite.attrib == {"name": "suite", "tests": "3", "failures": "1", "errors": "1", "time": "1.500"}
+    uart, crc, boot = suite
+    assert uart.attrib == {"name": "uart", "classname": "suite", "time": "1.000"}
+    assert uart.find("failure") is None and uart.find("error") is None
+    assert uart.find("system-out").text == "$1 = 0"
+    failure = crc.find("failure")
+    assert failure.attrib["message"] == "실패 출력: TEST FAIL"
+    assert failure.text == "TEST FAIL\n"
+    assert crc.find("system-out") is None
+    assert boot.find("error").attrib["message"] == "error"
+
+
+def test_run_case_reports_script_error(tmp_path):
+    script = write_script(tmp_path, "if 1\n")
+    manifest = CampaignManifest(cases=[{"name": "broken", "elf": "fw.elf", "gdb_script": script}])
+    summary = asyncio.run(CampaignRunner(manifest, str(tmp_path), jobs=1).run())
+    case, = summary["cases"]
+    assert case["status"] == "error"
+    assert "end로 닫히지 않았습니다" in case["message"]
+
+
+@pytest.fixture
+def gdb_paths(monkeypatch):
+    """QEMU 없이 fake_gdb로 케이스를 실행하고, 요청된 GDB 실행 파일을 기록합니다."""
+    paths = []
+
+    def build_command(target=None, options=None, index_cache=True, build_id=None, gdb_path=None):
+        paths.append(gdb_path)
+        return FAKE_GDB
+
+    async def start_qemu(self, *args, **kwargs):
+        return True, None
+
+    monkeypatch.setattr(GDBManager, "build_command", staticmethod(build_command))
+    monkeypatch.setattr(QEMUManager, "start", start_qemu)
+    return paths
+
+
+def test_build_command_uses_selected_gdb(monkeypatch):
+    monkeypatch.setattr(process_manager, "DEFAULT_GDB_PATH", "arm-none-eabi-gdb")
+    assert GDBManager.build_command(index_cache=False) == ["arm-none-eabi-gdb", "--interpreter=mi2"]
+    assert GDBManager.build_command(index_cache=False, gdb_path="gdb-multiarch")[0] == "gdb-multiarch"
+
+
+def test_run_case_uses_case_gdb_over_manifest(tmp_path, gdb_paths):
+    manifest = CampaignManifest(gdb="arm-none-eabi-gdb", cases=[
+        {"name": "default", "elf": "fw.elf"},
+        {"name": "multiarch", "elf": "fw.elf", "gdb": "gdb-multiarch"},
+    ])
+    summary = asyncio.run(CampaignRunner(manifest, str(tmp_path), jobs=1).run())
+    assert [case["status"] for case in summary["cases"]] == ["passed", "passed"]
+    assert gdb_paths == ["arm-none-eabi-gdb", "gdb-multiarch"]
+
+
+@pytest.mark.parametrize("argv, expected", [
+    ([], "arm-none-eabi-gdb"),
+    (["--gdb", "gdb-multiarch"], "gdb-multiarch"),
+])
+def test_main_gdb_option_overrides_manifest(tmp_path, gdb_paths, argv, expected):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"gdb": "arm-none-eabi-gdb", "cases": [{"name": "boot", "elf": "fw.elf"}]}))
+    assert main([str(manifest)] + argv) == 0
+    assert gdb_paths == [expected]
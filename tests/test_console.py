@@ -0,0 +1,142 @@
+"""QEMU 콘솔 출력 버퍼와 패턴 대기 테스트."""
+
+import asyncio
+
+from gdb_mcp.console import ConsoleBuffer, compile_output_pattern, wait_for_pattern
+
+
+def wait(buffer, pattern, cursor=0, timeout=0.0, overlap=4096):
+    return asyncio.run(wait_for_pattern(buffer, compile_output_pattern(pattern), cursor, timeout, overlap))
+
+
+def test_wait_for_pattern_matches_across_appends_within_overlap():
+    async def main():
+        buffer = ConsoleBuffer()
+        buffer.append(b"booting... TEST ")
+        waiter = asyncio.ensure_future(
+            wait_for_pattern(buffer, compile_output_pattern("TEST PASS"), 0, 5, overlap=8)
+        )
+        await asyncio.sleep(0.01)
+        buffer.append(b"PASS\n")
+        return await waiter
+
+    match, base, cursor = asyncio.run(main())
+    assert match is not None
+    assert base + match.start() == 11
+    assert cursor == 20
+
+
+def test_wait_for_pattern_anchor_does_not_match_mid_line_in_overlap():
+    async def main():
+        buffer = ConsoleBuffer()
+        buffer.append(b"zzz Boot OK")
+        pattern = compile_output_pattern("^Boot OK\n")
+        # 다시 검사하는 구간(끝에서 7바이트)은 줄 중간인 "Boot OK"에서 시작합니다
+        waiter = asyncio.ensure_future(wait_for_pattern(buffer, pattern, 0, 0.2, overlap=7))
+        await asyncio.sleep(0.01)
+        buffer.append(b"\n")
+        match, _, _ = await waiter
+        assert match is None
+
+        waiter = asyncio.ensure_future(wait_for_pattern(buffer, pattern, buffer.end, 5, overlap=7))
+        await asyncio.sleep(0.01)
+        buffer.append(b"Boot OK\n")
+        match, base, cursor = await waiter
+        assert match is not None
+        assert base + match.start() == 12
+        assert cursor == buffer.end
+
+    asyncio.run(main())
+
+
+def test_wait_for_pattern_anchor_at_real_line_start_and_stream_start():
+    buffer = ConsoleBuffer()
+    buffer.append(b"Boot OK\n")
+    match, base, _ = wait(buffer, "^Boot OK")
+    assert (base, match.start()) == (0, 0)
+
+    buffer = ConsoleBuffer()
+    buffer.append(b"line\nBoot OK\n")
+    match, base, _ = wait(buffer, "^Boot OK", cursor=5)
+    assert base + match.start() == 5
+
+
+def test_wait_for_pattern_ignores_output_before_cursor():
+    buffer = ConsoleBuffer()
+    buffer.append(b"TEST PASS\n")
+    match, _, cursor = wait(buffer, "TEST PASS", cursor=buffer.end)
+    assert match is None
+    assert cursor == buffer.end
+
+
+def test_wait_for_pattern_returns_when_stream_closes():
+    async def main():
+        buffer = ConsoleBuffer()
+        waiter = asyncio.ensure_future(wait_for_pattern(buffer, compile_output_pattern("never"), 0, 5))
+        await asyncio.sleep(0.01)
+        buffer.append(b"partial output")
+        buffer.close()
+        return await waiter, buffer
+
+    (match, _, cursor), buffer = asyncio.run(main())
+    assert match is None
+    assert cursor == buffer.end
+
+
+def test_console_buffer_offsets_are_absolute_across_wraparound():
+    buffer = ConsoleBuffer(max_bytes=8)
+    buffer.append(b"abcdef")
+    assert (buffer.start, buffer.end) == (0, 6)
+    buffer.append(b"ghijk")
+    # 한도(8바이트)만큼 최근 출력만 남기고 오프셋은 계속 증가합니다
+    assert (buffer.start, buffer.end) == (3, 11)
+    assert buffer.read(3) == (b"defghijk", 11, 0)
+    assert buffer.read(9) == (b"jk", 11, 0)
+    assert buffer.read(11) == (b"", 11, 0)
+    assert buffer.read(4, max_bytes=2) == (b"ef", 6, 0)
+    assert buffer.tail(3) == b"ijk"
+
+
+def test_console_buffer_append_larger_than_limit_keeps_newest_bytes():
+    buffer = ConsoleBuffer(max_bytes=4)
+    buffer.append(b"0123456789")
+    assert (buffer.start, buffer.end) == (6, 10)
+    assert buffer.read(0) == (b"6789", 10, 6)
+
+
+def test_console_buffer_read_from_evicted_cursor_reports_dropped_bytes():
+    buffer = ConsoleBuffer(max_bytes=4)
+    buffer.append(b"abcd")
+    data, cursor, dropped = buffer.read(0)
+    buffer.append(b"efghij")
+    data, cursor, dropped = buffer.read(cursor)
+    assert (data, cursor, dropped) == (b"ghij", 10, 2)
+    # 음수 커서는 끝에서부터, 범위를 넘는 커서는 끝으로 맞춥니다
+    assert buffer.read(-2) == (b"ij", 10, 0)
+    assert buffer.read(-100) == (b"ghij", 10, 6)
+    assert buffer.read(50) == (b"", 10, 0)
+
+
+def test_console_buffer_clear_keeps_offsets_increasing():
+    buffer = ConsoleBuffer(max_bytes=16)
+    buffer.append(b"hello")
+    buffer.clear()
+    assert (buffer.start, buffer.end) == (5, 5)
+    buffer.append(b"!")
+    assert buffer.read(0) == (b"!", 6, 5)
+
+
+def test_console_buffer_wait_wakes_on_append_and_times_out():
+    async def main():
+        buffer = ConsoleBuffer()
+        waiter = asyncio.ensure_future(buffer.wait(0, 5))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        buffer.append(b"x")
+        await asyncio.wait_for(waiter, 1)
+        # 이미 커서 뒤에 출력이 있으면 바로 반환하고, 없으면 타임아웃 후 조용히 반환합니다
+        await asyncio.wait_for(buffer.wait(0, 5), 1)
+        await buffer.wait(buffer.end, 0.01)
+        assert buffer._waiters == []
+
+    asyncio.run(main())
@@ -0,0 +1,200 @@
+"""ELF 파서와 심볼 색인 테스트."""
+
+import struct
+
+import pytest
+
+from gdb_mcp import elf as elf_module
+from gdb_mcp.elf import ElfError, ElfSymbolIndex, load_symbol_index, read_build_id
+
+EM_ARM = 40
+EM_X86_64 = 62
+BUILD_ID = bytes.fromhex("00112233445566778899aabbccddeeff01234567")
+
+# (이름, 값, 크기, 타입, 바인딩, 섹션 인덱스)
+SYMBOLS = [
+    ("main", 0x100, 0x20, 2, 1, 1),
+    ("$t", 0x100, 0, 0, 0, 1),
+    ("helper", 0x120, 0x10, 2, 0, 1),
+    ("helper_alias", 0x120, 0, 0, 0, 1),
+    ("label", 0x140, 0, 0, 0, 1),
+    ("table", 0x180, 8, 1, 1, 1),
+    ("ABS_VALUE", 0x5000, 0, 0, 1, 0xFFF1),
+    ("external", 0, 0, 2, 1, 0),
+    ("file.c", 0, 0, 4, 0, 0xFFF1),
+]
+
+
+def build_elf(is_64: bool, machine: int, symbols=SYMBOLS, build_id=BUILD_ID) -> bytes:
+    """.text, 빌드 ID 노트, 심볼 테이블을 가진 작은 ELF를 만듭니다."""
+    endian = "<"
+    strtab = b"\0"
+    symtab = b""
+    sym_fmt = endian + ("IBBHQQ" if is_64 else "IIIBBH")
+    symtab += bytes(struct.calcsize(sym_fmt))
+    for name, value, size, sym_type, binding, shndx in symbols:
+        if machine == EM_ARM and sym_type == 2:
+            value |= 1
+        name_offset = len(strtab)
+        strtab += name.encode() + b"\0"
+        info = (binding << 4) | sym_type
+        if is_64:
+            symtab += struct.pack(sym_fmt, name_offset, info, 0, shndx, value, size)
+        else:
+            symtab += struct.pack(sym_fmt, name_offset, value, size, info, 0, shndx)
+
+    note = b""
+    if build_id is not None:
+        note = struct.pack(endian + "III", 4, len(build_id), 3) + b"GNU\0" + build_id
+
+    names = [b"", b".text", b".note.gnu.build-id", b".symtab", b".strtab", b".shstrtab"]
+    shstrtab = b"\0"
+    name_offsets = []
+    for name in names:
+        name_offsets.append(len(shstrtab) - 1 if not name else len(shstrtab))
+        if name:
+            shstrtab += name + b"\0"
+    name_offsets[0] = 0
+
+    header_size = 64 if is_64 else 52
+    text = bytes(0x100)
+    contents = [text, note, symtab, strtab, shstrtab]
+    offsets = []
+    body = b""
+    for data in contents:
+        offsets.append(header_size + len(body))
+        body += data + bytes(-len(data) % 8)
+    shoff = header_size + len(body)
+
+    # (타입, 플래그, 주소, link, entsize)
+    layout = [
+        (1, 0x6, 0x100, 0, 0),
+        (7, 0x2, 0, 0, 0),
+        (2, 0, 0, 4, struct.calcsize(sym_fmt)),
+        (3, 0, 0, 0, 0),
+        (3, 0, 0, 0, 0),
+    ]
+    sh_fmt = endian + ("IIQQQQIIQQ" if is_64 else "IIIIIIIIII")
+    sections = bytes(struct.calcsize(sh_fmt))
+    for index, (sh_type, flags, addr, link, entsize) in enumerate(layout, 1):
+        sections += struct.pack(sh_fmt, name_offsets[index], sh_type, flags, addr, offsets[index - 1],
+                                len(contents[index - 1]), link, 0, 8, entsize)
+
+    ident = b"\x7fELF" + bytes([2 if is_64 else 1, 1, 1]) + bytes(9)
+    shentsize = struct.calcsize(sh_fmt)
+    if is_64:
+        header = struct.pack(endian + "HHIQQQIHHHHHH", 2, machine, 1, 0x101, 0, shoff, 0,
+                             header_size, 0, 0, shentsize, len(names), len(names) - 1)
+    else:
+        header = struct.pack(endian + "HHIIIIIHHHHHH", 2, machine, 1, 0x101, 0, shoff, 0,
+                             header_size, 0, 0, shentsize, len(names), len(names) - 1)
+    return ident + header + body + sections
+
+
+@pytest.fixture(params=[(False, EM_ARM), (True, EM_X86_64)], ids=["elf32-arm", "elf64-x86_64"])
+def elf_path(request, tmp_path):
+    path = tmp_path / "fw.elf"
+    path.write_bytes(build_elf(*request.param))
+    return str(path)
+
+
+def test_read_build_id(elf_path, tmp_path):
+    assert read_build_id(elf_path) == BUILD_ID.hex()
+    plain = tmp_path / "plain.elf"
+    plain.write_bytes(build_elf(False, EM_ARM, build_id=None))
+    assert read_build_id(str(plain)) is None
+
+
+def test_rejects_non_elf_and_truncated_files(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not an elf file at all")
+    with pytest.raises(ElfError):
+        read_build_id(str(path))
+    path.write_bytes(build_elf(False, EM_ARM)[:40])
+    with pytest.raises(ElfError):
+        read_build_id(str(path))
+
+
+@pytest.mark.parametrize("address, expected", [
+    (0xFF, None),
+    (0x100, ("main", 0)),
+    (0x11F, ("main", 0x1F)),
+    (0x120, ("helper", 0)),
+    (0x12F, ("helper", 0xF)),
+    (0x130, None),
+    # 크기가 없는 레이블은 다음 심볼까지
+    (0x140, ("label", 0)),
+    (0x17F, ("label", 0x3F)),
+    (0x180, ("table", 0)),
+    (0x187, ("table", 7)),
+    (0x188, None),
+    # 크기가 없는 절대 심볼은 같은 주소만
+    (0x5000, ("ABS_VALUE", 0)),
+    (0x5001, None),
+])
+def test_symbol_lookup_boundaries(elf_path, address, expected):
+    index = ElfSymbolIndex.from_elf(elf_path)
+    assert index.lookup(address) == expected
+
+
+def test_index_skips_mapping_undefined_and_file_symbols(elf_path):
+    index = ElfSymbolIndex.from_elf(elf_path)
+    assert index.names == ["main", "helper", "label", "table", "ABS_VALUE"]
+    assert index.symbolize(0x104) == "main + 4"
+    assert index.symbolize(0x120) == "helper"
+
+
+def test_index_round_trips_through_file(elf_path, tmp_path):
+    index = ElfSymbolIndex.from_elf(elf_path)
+    saved = tmp_path / "cache" / "fw.idx"
+    index.save(str(saved))
+    loaded = ElfSymbolIndex.load(str(saved))
+    assert list(loaded.addresses) == list(index.addresses)
+    assert list(loaded.sizes) == list(index.sizes)
+    assert loaded.names == index.names
+
+    saved.write_bytes(saved.read_bytes()[:-3])
+    with pytest.raises(ElfError):
+        ElfSymbolIndex.load(str(saved))
+
+
+@pytest.fixture
+def loaded_indexes(monkeypatch):
+    monkeypatch.setattr(elf_module, "_loaded_indexes", type(elf_module._loaded_indexes)())
+    return elf_module._loaded_indexes
+
+
+def test_load_symbol_index_uses_memory_then_disk_cache(elf_path, tmp_path, loaded_indexes, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = load_symbol_index(elf_path, str(cache_dir))
+    assert load_symbol_index(elf_path, str(cache_dir)) is first
+    assert len(list((cache_dir / "symbols").glob("*.idx"))) == 1
+
+    # 메모리 색인을 비우면 ELF를 다시 파싱하지 않고 디스크 캐시에서 읽습니다
+    loaded_indexes.clear()
+
+    def from_elf(cls, path):
+        raise AssertionError("디스크 캐시를 사용하지 않았습니다")
+    monkeypatch.setattr(ElfSymbolIndex, "from_elf", classmethod(from_elf))
+    cached = load_symbol_index(elf_path, str(cache_dir))
+    assert cached is not first
+    assert cached.names == first.names
+
+
+def test_loaded_indexes_are_bounded_and_replaced_on_rebuild(tmp_path, loaded_indexes, monkeypatch):
+    monkeypatch.setattr(elf_module, "_MAX_LOADED_INDEXES", 2)
+    paths = []
+    for name in ("a.elf", "b.elf", "c.elf"):
+        path = tmp_path / name
+        path.write_bytes(build_elf(False, EM_ARM))
+        paths.append(path)
+        load_symbol_index(str(path), None)
+    assert [key[0] for key in loaded_indexes] == [str(paths[1].resolve()), str(paths[2].resolve())]
+
+    # 다시 빌드된 ELF는 같은 경로의 이전 색인을 대체합니다
+    symbols = SYMBOLS + [("added", 0x1C0, 4, 1, 1, 1)]
+    paths[2].write_bytes(build_elf(False, EM_ARM, symbols=symbols) + b"\0")
+    index = load_symbol_index(str(paths[2]), None)
+    assert "added" in index.names
+    assert len(loaded_indexes) == 2
+    assert [key[0] for key in loaded_indexes].count(str(paths[2].resolve())) == 1
@@ -0,0 +1,57 @@
+"""GDB 프로세스 풀 테스트."""
+
+import asyncio
+
+from gdb_mcp.gdb_pool import GDBPool
+from tests.fakes import FAKE_GDB
+
+
+def test_rebuilt_elf_invalidates_idle_gdb(tmp_path):
+    elf = tmp_path / "fw.elf"
+    elf.write_bytes(b"\x7fELF" + bytes(60))
+    command = FAKE_GDB + [str(elf)]
+
+    async def main():
+        pool = GDBPool(size=1, max_age=0)
+        try:
+            pool.prewarm(command, str(elf))
+            await pool.wait_idle()
+            assert pool.stats()["idle"] == 1
+
+            # 다시 빌드되어 크기와 수정 시각이 바뀐 ELF
+            elf.write_bytes(b"\x7fELF" + bytes(120))
+            assert pool.acquire(command, str(elf)) is None
+            assert pool.evicted == 1
+            await pool.wait_idle()
+
+            transport = pool.acquire(command, str(elf))
+            assert transport is not None
+            await transport.close(timeout=1.0)
+            assert len(pool.stats()["entries"]) == 1
+        finally:
+            await pool.close()
+
+    asyncio.run(main())
+
+
+def test_spawn_started_before_configure_is_dropped():
+    command = FAKE_GDB + ["--delay", "0.3"]
+
+    async def main():
+        pool = GDBPool(size=1, max_age=0)
+        try:
+            pool.prewarm(command)
+            await asyncio.sleep(0.05)
+            # 첫 프로세스가 시작되는 동안 초기화 명령이 바뀝니다
+            pool.configure(init_commands=["-gdb-set confirm off"])
+            await pool.wait_idle()
+
+            assert pool.generation == 1
+            assert [entry.generation for entries in pool._idle.values() for entry in entries] == [1]
+            transport = pool.acquire(command)
+            assert transport is not None
+            await transport.close(timeout=1.0)
+        finally:
+            await pool.close()
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""출력 기록 링 버퍼 테스트."""
+
+import json
+
+from gdb_mcp.history import HistoryEntry, OutputHistory
+
+
+def entry_size(command: str, output: str) -> int:
+    return HistoryEntry(0, 0.0, command, output).size
+
+
+def test_ring_evicts_oldest_by_byte_budget():
+    size = entry_size("cmd1", "x" * 96)
+    history = OutputHistory(max_bytes=size * 3)
+    for i in range(1, 6):
+        history.append(f"cmd{i}", "x" * 96)
+    assert [entry.seq for entry in history] == [3, 4, 5]
+    stats = history.stats()
+    assert stats["bytes"] == size * 3
+    assert stats["dropped"] == 2
+    assert stats["spilled"] == 0
+    assert history.first_seq == 3
+    assert history.last_seq == 5
+    # 스필 경로가 없으면 밀려난 기록은 조회되지 않습니다
+    assert [entry.seq for entry in history.page(0, 10)] == [3, 4, 5]
+
+
+def test_ring_keeps_single_entry_larger_than_budget():
+    history = OutputHistory(max_bytes=10)
+    history.append("a", "x" * 100)
+    history.append("b", "y" * 100)
+    assert [entry.command for entry in history] == ["b"]
+
+
+def test_spill_round_trip(tmp_path):
+    spill_path = tmp_path / "spill" / "history.jsonl"
+    size = entry_size("cmd000", "out000")
+    history = OutputHistory(max_bytes=size * 4, spill_path=str(spill_path))
+    for i in range(1, 601):
+        history.append(f"cmd{i:03d}", f"out{i:03d}")
+
+    assert [entry.seq for entry in history] == [597, 598, 599, 600]
+    assert history.stats()["spilled"] == 596
+    assert history.first_seq == 1
+
+    # 스필 파일과 메모리를 이어서 순서대로 읽습니다
+    entries = history.page(0, 1000)
+    assert [entry.seq for entry in entries] == list(range(1, 601))
+    assert all(entry.output == f"out{entry.seq:03d}" for entry in entries)
+
+    # 색인 간격 중간에서 시작하는 페이지와 경계를 넘는 페이지
+    assert [entry.seq for entry in history.page(300, 3)] == [301, 302, 303]
+    assert [entry.seq for entry in history.page(594, 4)] == [595, 596, 597, 598]
+    assert [entry.seq for entry in history.search(r"^cmd51[0-2]$")] == [510, 511, 512]
+
+    lines = spill_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 596
+    assert json.loads(lines[0])["command"] == "cmd001"
+
+
+def test_clear_resets_spill_index(tmp_path):
+    spill_path = tmp_path / "history.jsonl"
+    size = entry_size("old00", "o")
+    history = OutputHistory(max_bytes=size * 2, spill_path=str(spill_path))
+    for i in range(10):
+        history.append(f"old{i:02d}", "o")
+    assert history.stats()["spilled"] == 8
+
+    history.clear()
+    stats = history.stats()
+    assert stats["spilled"] == 0
+    assert stats["entries"] == 0
+    assert history.first_seq == history.last_seq + 1
+    assert history.page(0, 100) == []
+
+    for i in range(5):
+        history.append(f"new{i:02d}", "n")
+    # 비우기 전의 기록은 스필 파일에 남아 있어도 조회되지 않습니다
+    commands = [entry.command for entry in history.page(0, 100)]
+    assert commands == [f"new{i:02d}" for i in range(5)]
+    assert history.first_seq == 11
+    assert history.stats()["spilled"] == 3
@@ -0,0 +1,78 @@
+"""GDB index-cache 관리 테스트."""
+
+import asyncio
+
+import pytest
+
+from gdb_mcp import process_manager
+from gdb_mcp.index_cache import IndexCache
+from gdb_mcp.process_manager import GDBManager
+from tests.fakes import FAKE_GDB, FakeTransport
+
+BUILD_ID = "0123456789abcdef"
+
+
+@pytest.mark.parametrize("output, enabled", [
+    ("The index cache is currently enabled.\n", True),
+    ("The index cache is currently disabled.\n", False),
+    ("enabled:  The index cache is on.\ndirectory:  The directory of the index cache is \"/tmp\".\n", True),
+    ("enabled:  The index cache is off.\n", False),
+    ("Undefined show command: \"index-cache\".\n", None),
+])
+def test_parse_enabled(output, enabled):
+    assert IndexCache.parse_enabled(output) is enabled
+
+
+def test_gdb_args_send_both_forms(tmp_path):
+    args = IndexCache(str(tmp_path)).gdb_args()
+    assert "set index-cache on" in args
+    assert "set index-cache enabled on" in args
+
+
+@pytest.fixture
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_manager, "DEFAULT_INDEX_CACHE_DIR", str(tmp_path))
+
+    def read_build_id(target):
+        raise AssertionError("빌드 ID를 다시 읽었습니다")
+    monkeypatch.setattr(IndexCache, "build_id", staticmethod(read_build_id))
+    return tmp_path
+
+
+@pytest.mark.parametrize("output, state", [
+    ("The index cache is currently disabled.\n", "off"),
+    ("enabled:  The index cache is on.\n", "cold"),
+])
+def test_start_reports_index_cache_state(index_dir, output, state):
+    manager = GDBManager()
+    success, error = asyncio.run(manager.start(
+        target="fw.elf", transport=FakeTransport(show_output=output), build_id=BUILD_ID
+    ))
+    assert success, error
+    assert manager.build_id == BUILD_ID
+    assert manager.index_cache_state == state
+    assert GDBManager.build_command("fw.elf", build_id=BUILD_ID)[2:4] == ["-iex", f"set index-cache directory {index_dir}"]
+
+
+def test_restart_without_index_cache_clears_previous_state(index_dir, monkeypatch):
+    monkeypatch.setattr(GDBManager, "build_command", staticmethod(lambda *args, **kwargs: FAKE_GDB))
+
+    async def main():
+        manager = GDBManager()
+        try:
+            success, error = await manager.start(target="fw.elf", build_id=BUILD_ID)
+            assert success, error
+            assert manager.index_cache_state == "cold"
+            assert manager.index_cache_times["cold_ms"] > 0
+            await manager.stop()
+            assert manager.build_id is None and manager.index_cache_state is None
+
+            success, error = await manager.start(target="fw.elf", index_cache=False)
+            assert success, error
+            assert manager.build_id is None
+            assert manager.index_cache_state is None
+            assert manager.index_cache_times == {}
+        finally:
+            await manager.stop()
+
+    asyncio.run(main())
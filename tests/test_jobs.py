@@ -0,0 +1,124 @@
+"""실행 명령 스트리밍과 백그라운드 작업 테스트."""
+
+import asyncio
+
+import pytest
+
+from gdb_mcp.jobs import ExecutionJob, JobBusyError, JobNotFoundError, JobRegistry
+from gdb_mcp.process_manager import GDBManager
+from tests.fakes import ExecutionTransport
+
+
+def make_manager(transport):
+    manager = GDBManager()
+    manager.transport = transport
+    manager.transport.add_listener(manager.state.handle_record)
+    return manager
+
+
+def test_execute_until_stopped_streams_output_and_returns_stop_record():
+    manager = make_manager(ExecutionTransport(outputs=("a\n", "b\n")))
+    streamed = []
+    success, output, error, stop = asyncio.run(
+        manager.execute_until_stopped("continue", 5, on_output=streamed.append)
+    )
+    assert success and error is None
+    assert streamed == ["a\n", "b\n"]
+    assert output == "a\nb"
+    assert stop["reason"] == "breakpoint-hit"
+    assert manager.state.execution_state == "stopped"
+    assert manager.transport.listeners == [manager.state.handle_record]
+    assert manager.history.tail(1)[0].command == "continue"
+
+
+def test_execute_until_stopped_times_out_when_target_keeps_running():
+    manager = make_manager(ExecutionTransport(outputs=("tick\n",), stop=False))
+    success, output, error, stop = asyncio.run(manager.execute_until_stopped("continue", 0.1))
+    assert not success
+    assert output == "tick"
+    assert "멈추지 않았습니다" in error
+    assert stop is None
+
+
+def test_execute_until_stopped_reports_error_result():
+    manager = make_manager(ExecutionTransport(error="The program is not being run."))
+    success, _, error, stop = asyncio.run(manager.execute_until_stopped("continue", 1))
+    assert not success
+    assert error == "The program is not being run."
+    assert stop is None
+
+
+def test_job_output_is_capped_and_cursor_stays_absolute():
+    job = ExecutionJob("job1", "continue", max_output_bytes=10)
+    for index in range(6):
+        job.append_output(f"{index}abc")
+    assert job.output_bytes <= 10
+    assert job.first_cursor == 4
+    assert job.output_since(0) == ("4abc5abc", 6)
+    assert job.output_since(5) == ("5abc", 6)
+    assert job.output_since(6) == ("", 6)
+
+
+def test_job_run_records_result_and_failure():
+    async def main():
+        job = ExecutionJob("job1", "continue")
+
+        async def execution():
+            return True, "", None, {"reason": "end-stepping-range"}
+
+        job.task = asyncio.ensure_future(job.run(execution()))
+        assert await job.wait(1)
+        assert job.state == "done"
+        assert job.stop_record == {"reason": "end-stepping-range"}
+
+        failed = ExecutionJob("job2", "continue")
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        failed.task = asyncio.ensure_future(failed.run(broken()))
+        assert await failed.wait(1)
+        assert failed.state == "failed" and failed.error == "boom"
+
+    asyncio.run(main())
+
+
+def test_registry_rejects_second_running_job_and_prunes_finished():
+    registry = JobRegistry()
+    job = registry.create("continue")
+    assert registry.running() is job
+    with pytest.raises(JobBusyError):
+        registry.create("next")
+    job.finished_at = job.started_at
+    assert registry.running() is None
+
+    for _ in range(70):
+        registry.create("stepi").finished_at = 0.0
+    registry.create("continue")
+    # 완료된 작업 64개와 실행 중인 작업 하나
+    assert len(registry.list()) == 65
+    with pytest.raises(JobNotFoundError):
+        registry.get(job.job_id)
+
+
+def test_second_execution_is_rejected_while_background_job_runs(server):
+    session = server.sessions.get()
+    session.gdb.transport = ExecutionTransport(stop=False)
+    session.gdb.transport.add_listener(session.gdb.state.handle_record)
+
+    async def main():
+        handler_args = {"command": "continue", "background": True}
+        first = await server._handle_gdb_execute(handler_args)
+        await asyncio.sleep(0.01)
+        second = await server._handle_gdb_execute({"command": "next"})
+        third = await server._handle_gdb_execute(handler_args)
+        job = session.jobs.running()
+        session.jobs.cancel_all()
+        await asyncio.gather(job.task, return_exceptions=True)
+        return first, second, third
+
+    first, second, third = asyncio.run(main())
+    assert not first.isError
+    assert second.isError and "아직 실행 중" in second.content[0].text
+    assert third.isError
+    assert session.gdb.transport.sent == ["continue"]
@@ -0,0 +1,62 @@
+"""메모리 읽기/비교 모듈 테스트."""
+
+import asyncio
+
+import pytest
+
+from gdb_mcp.memory import MemoryReadError, diff_memory, read_memory, resolve_address
+from tests.fakes import FakeTransport
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_read_memory_in_chunks():
+    memory = bytes(range(256)) * 4
+    transport = FakeTransport(memory, 0x20000000)
+    data, unreadable = run(read_memory(transport, 0x20000000, len(memory), chunk_size=100))
+    assert bytes(data) == memory
+    assert unreadable == []
+    assert len(transport.sent) == 11
+
+
+def test_read_memory_partial_chunk_uses_absolute_begin():
+    memory = bytes(range(256))
+    # 청크 중간(0x1030)부터만 읽을 수 있어 블록의 offset이 0이 아닙니다
+    transport = FakeTransport(memory, 0x1000, readable=[(0x1030, 0x1100)])
+    data, unreadable = run(read_memory(transport, 0x1000, 0x100, chunk_size=0x40))
+    assert unreadable == [(0x1000, 0x30)]
+    assert bytes(data[:0x30]) == bytes(0x30)
+    assert bytes(data[0x30:]) == memory[0x30:]
+
+
+def test_read_memory_gap_in_the_middle():
+    memory = bytes(range(1, 129))
+    transport = FakeTransport(memory, 0x0, readable=[(0x0, 0x10), (0x50, 0x80)])
+    data, unreadable = run(read_memory(transport, 0x0, 0x80, chunk_size=0x20))
+    assert unreadable == [(0x10, 0x40)]
+    assert bytes(data[0x50:]) == memory[0x50:]
+
+
+def test_read_memory_rejects_oversized_request():
+    with pytest.raises(MemoryReadError):
+        run(read_memory(FakeTransport(b"", 0), 0, 1 << 40))
+
+
+def test_resolve_address_quotes_expression():
+    transport = FakeTransport(b"", 0)
+    address = run(resolve_address(transport, 'symbol("a\\b")', 1.0))
+    assert address == 0x20000010
+    assert transport.sent == ['-data-evaluate-expression "symbol(\\"a\\\\b\\")"']
+
+
+def test_diff_memory_reports_changed_runs():
+    old = bytearray(10000)
+    new = bytearray(old)
+    new[5] = 1
+    new[6] = 1
+    new[9000] = 7
+    assert diff_memory(bytes(old), bytes(new), address=0x100) == [(0x105, 2), (0x100 + 9000, 1)]
+    assert diff_memory(bytes(old), bytes(new), merge_gap=10000) == [(5, 8996)]
+    assert diff_memory(bytes(old), bytes(old)) == []
@@ -0,0 +1,122 @@
+"""GDB/MI 전송 계층 테스트."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gdb_mcp import mi_transport
+from gdb_mcp.mi_transport import GDBMITransport, GDBTransportClosed
+from tests.fakes import FAKE_GDB
+
+
+def read_records(chunks):
+    """청크로 나뉜 GDB 출력을 읽기 루프에 넣고 파싱된 레코드를 반환합니다."""
+
+    async def main():
+        stdout = asyncio.StreamReader()
+        for chunk in chunks:
+            stdout.feed_data(chunk)
+        stdout.feed_eof()
+        transport = GDBMITransport(["gdb"])
+        transport.process = SimpleNamespace(stdout=stdout, returncode=None, pid=1)
+        records = []
+        transport.add_listener(records.append)
+        await transport._read_loop()
+        return transport, records
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 16])
+def test_read_loop_splits_lines_across_chunks(monkeypatch, chunk_size):
+    monkeypatch.setattr(mi_transport, "_READ_CHUNK_SIZE", chunk_size)
+    output = b'=thread-group-added,id="i1"\r\n(gdb) \n~"hello\\n"\n\n*stopped,reason="end-stepping-range"\n'
+    chunks = [output[i:i + chunk_size] for i in range(0, len(output), chunk_size)]
+    transport, records = read_records(chunks)
+    assert [record["type"] for record in records] == ["notify", "console", "notify"]
+    assert records[1]["payload"] == "hello\n"
+    assert records[2]["payload"] == {"reason": "end-stepping-range"}
+    assert transport._ready.is_set()
+
+
+def test_read_loop_handles_large_single_line_record():
+    contents = "ab" * (3 * 1024 * 1024)
+    line = f'^done,memory=[{{begin="0x0",offset="0x0",end="0x300000",contents="{contents}"}}]\n'.encode()
+    chunks = [line[i:i + 65536] for i in range(0, len(line), 65536)] + [b"(gdb) \n"]
+    _, records = read_records(chunks)
+    assert len(records) == 1
+    assert records[0]["payload"]["memory"][0]["contents"] == contents
+
+
+def test_read_loop_keeps_trailing_partial_line_until_newline():
+    _, records = read_records([b'~"par', b'tial"', b'\n~"next"'])
+    # 줄바꿈 없이 끝난 마지막 줄은 레코드가 아닙니다
+    assert [record["payload"] for record in records] == ["partial"]
+
+
+def with_transport(test):
+    """fake_gdb.py를 실행하는 전송 계층을 만들어 테스트 코루틴에 넘깁니다."""
+
+    def wrapper():
+        async def main():
+            transport = GDBMITransport(FAKE_GDB)
+            await transport.start(timeout=10)
+            try:
+                await test(transport)
+            finally:
+                await transport.close(timeout=1)
+
+        asyncio.run(main())
+
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@with_transport
+async def test_pipelined_commands_get_their_own_stream_records(transport):
+    responses = await transport.execute_many(["-fake-echo first", "-fake-echo second", "-list-features"], 5)
+    assert [response.command for response in responses] == ["-fake-echo first", "-fake-echo second", "-list-features"]
+    assert [[record["payload"] for record in response.stream_output("console")]
+            for response in responses] == [["first\n"], ["second\n"], []]
+    assert transport.in_flight == 0
+
+
+@with_transport
+async def test_out_of_order_results_are_matched_by_token(transport):
+    held = await transport.send_many(["-fake-hold", "-fake-hold"])
+    release = await transport.execute("-fake-release", 5)
+    assert release.message == "done"
+    first, second = await asyncio.gather(*held)
+    # 나중에 보낸 명령의 결과가 먼저 도착해도 각자의 토큰 결과를 받습니다
+    first_token, second_token = (int(response.payload["value"]) for response in (first, second))
+    assert second_token == first_token + 1
+    assert first.command == second.command == "-fake-hold"
+    assert transport.in_flight == 0
+
+
+@with_transport
+async def test_late_result_after_timeout_does_not_leak_into_next_command(transport):
+    with pytest.raises(asyncio.TimeoutError):
+        await transport.execute("-fake-hold", 0.1)
+    # 타임아웃된 명령은 결과가 올 때까지 대기 항목으로 남습니다
+    assert transport.in_flight == 1
+    release = await transport.execute("-fake-release", 5)
+    assert release.payload is None
+    await asyncio.sleep(0.1)
+    assert transport.in_flight == 0
+    echo = await transport.execute("-fake-echo after", 5)
+    assert [record["payload"] for record in echo.stream_output("console")] == ["after\n"]
+
+
+@with_transport
+async def test_process_exit_fails_pending_commands(transport):
+    held = await transport.send("-fake-hold")
+    exiting = await transport.send("-fake-exit")
+    for future in (held, exiting):
+        with pytest.raises(GDBTransportClosed):
+            await asyncio.wait_for(future, 5)
+    assert transport.in_flight == 0
+    assert not transport.is_alive()
+    with pytest.raises(GDBTransportClosed):
+        await transport.execute("-list-features", 1)
@@ -0,0 +1,59 @@
+"""QMP 클라이언트 테스트."""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+from gdb_mcp.qmp import QMPClient, QMPClosed
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="유닉스 소켓 필요")
+
+
+async def serve_qmp(path, handler):
+    """인사말과 qmp_capabilities 응답 뒤 요청마다 handler(request, writer)를 호출하는 QMP 서버."""
+    async def on_client(reader, writer):
+        writer.write(json.dumps({"QMP": {"version": {}, "capabilities": []}}).encode() + b"\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            if request["execute"] == "qmp_capabilities":
+                writer.write(json.dumps({"return": {}, "id": request["id"]}).encode() + b"\n")
+            elif not await handler(request, writer):
+                break
+            await writer.drain()
+        writer.close()
+    return await asyncio.start_unix_server(on_client, path)
+
+
+def test_large_response_and_disconnect(tmp_path):
+    path = os.fspath(tmp_path / "qmp.sock")
+    output = "x" * (4 * 1024 * 1024)
+
+    async def handler(request, writer):
+        if request["execute"] == "human-monitor-command":
+            writer.write(json.dumps({"return": output, "id": request["id"]}).encode() + b"\n")
+            return True
+        # 응답 없이 연결을 끊습니다
+        return False
+
+    async def main():
+        server = await serve_qmp(path, handler)
+        client = QMPClient(path)
+        try:
+            await client.connect(timeout=5)
+            assert await client.human_monitor_command("info mtree", timeout=5) == output
+            with pytest.raises(QMPClosed, match="연결을 닫았습니다"):
+                await client.execute("query-status", timeout=5)
+            assert not client.is_connected()
+            assert client.error == "QMP 서버가 연결을 닫았습니다"
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
@@ -0,0 +1,283 @@
+"""RSP 스텁 시뮬레이터 테스트.
+
+원시 RSP 패킷 테스트는 항상 실행하고, 스텁에 실제 GDB를 붙여 MI 전송 계층,
+정지 세대 캐시, 메모리 읽기/비교, 브레이크포인트 경로를 확인하는 테스트는
+ARM을 지원하는 GDB가 있을 때만 실행합니다.
+"""
+
+import asyncio
+import functools
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from gdb_mcp.memory import diff_memory
+from gdb_mcp.process_manager import GDBManager
+from gdb_mcp.rsp_stub import RSPStub, StubTarget, checksum
+
+SRAM = 0x20000000
+SRAM_SIZE = 64 * 1024
+FLASH_SIZE = 256 * 1024
+
+
+class RSPClient:
+    """테스트용 최소 RSP 클라이언트 (확인 응답 모드)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.acks = []
+
+    @classmethod
+    async def connect(cls, endpoint: str) -> "RSPClient":
+        host, port = endpoint.rsplit(":", 1)
+        return cls(*await asyncio.open_connection(host, int(port)))
+
+    def send_raw(self, data: bytes) -> None:
+        self.writer.write(data)
+
+    async def send(self, payload: str) -> None:
+        data = payload.encode()
+        self.send_raw(b"$" + data + b"#" + f"{checksum(data):02x}".encode())
+        await self.writer.drain()
+
+    async def read_packet(self) -> str:
+        """확인 응답을 건너뛰고 다음 패킷의 내용을 반환합니다."""
+        while True:
+            first = await asyncio.wait_for(self.reader.readexactly(1), 5)
+            if first in (b"+", b"-"):
+                self.acks.append(first)
+                continue
+            assert first == b"$"
+            body = await asyncio.wait_for(self.reader.readuntil(b"#"), 5)
+            received = await self.reader.readexactly(2)
+            payload = body[:-1]
+            assert received == f"{checksum(payload):02x}".encode()
+            self.send_raw(b"+")
+            return payload.decode("latin-1")
+
+    async def request(self, payload: str) -> str:
+        await self.send(payload)
+        return await self.read_packet()
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def with_stub(test):
+    """스텁과 연결된 클라이언트를 만들어 테스트 코루틴에 넘깁니다."""
+
+    def wrapper():
+        async def main():
+            target = StubTarget()
+            # 벡터 테이블: 초기 SP와 리셋 핸들러(Thumb)
+            target.write_memory(0, struct.pack("<II", SRAM + 0x1000, 0x101))
+            target.reset()
+            stub = RSPStub(target)
+            endpoint = await stub.start()
+            client = await RSPClient.connect(endpoint)
+            try:
+                await test(stub, client)
+            finally:
+                await client.close()
+                await stub.close()
+
+        asyncio.run(main())
+
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+def register(registers: str, index: int) -> int:
+    return struct.unpack("<I", bytes.fromhex(registers[index * 8:index * 8 + 8]))[0]
+
+
+@with_stub
+async def test_handshake_and_reset_registers(stub, client):
+    supported = await client.request("qSupported:multiprocess+")
+    assert "qXfer:features:read+" in supported
+    assert await client.request("?") == "S05"
+    registers = await client.request("g")
+    assert register(registers, 13) == SRAM + 0x1000
+    assert register(registers, 15) == 0x100
+    assert register(registers, 16) == 0x01000000
+    features = await client.request("qXfer:features:read:target.xml:0,fff")
+    assert features.startswith("l") and "org.gnu.gdb.arm.m-profile" in features
+    assert b"+" in client.acks
+
+
+@with_stub
+async def test_memory_read_write_and_region_edges(stub, client):
+    assert await client.request(f"M{SRAM:x},4:78563412") == "OK"
+    assert await client.request(f"m{SRAM:x},4") == "78563412"
+    # 영역 끝을 넘는 읽기는 영역 안의 바이트만 돌려줍니다
+    assert await client.request(f"M{SRAM + SRAM_SIZE - 2:x},2:aabb") == "OK"
+    assert await client.request(f"m{SRAM + SRAM_SIZE - 2:x},10") == "aabb"
+    # 영역 밖 읽기와 영역에 걸친 쓰기는 실패합니다
+    assert await client.request(f"m{FLASH_SIZE:x},4") == "E0e"
+    assert await client.request(f"M{SRAM + SRAM_SIZE - 1:x},2:0000") == "E0e"
+    assert await client.request("X20000010,0:") == "OK"
+
+
+@with_stub
+async def test_breakpoint_continue_and_interrupt(stub, client):
+    assert await client.request("Z0,108,2") == "OK"
+    assert await client.request("c") == "S05"
+    assert register(await client.request("g"), 15) == 0x108
+    assert await client.request("s") == "S05"
+    assert register(await client.request("g"), 15) == 0x10a
+    assert await client.request("z0,108,2") == "OK"
+    # 앞쪽에 브레이크포인트가 없으면 인터럽트가 올 때까지 실행 중입니다
+    await client.send("c")
+    client.send_raw(b"\x03")
+    assert await client.read_packet() == "S02"
+    assert await client.request("Z2,2000,4") == ""
+
+
+@with_stub
+async def test_monitor_snapshots(stub, client):
+    assert await client.request(f"M{SRAM:x},1:01") == "OK"
+    assert await client.request("qRcmd," + b"savevm base".hex()) == "OK"
+    assert await client.request(f"M{SRAM:x},1:02") == "OK"
+    assert await client.request("qRcmd," + b"loadvm base".hex()) == "OK"
+    assert await client.request(f"m{SRAM:x},1") == "01"
+    output = await client.request("qRcmd," + b"loadvm missing".hex())
+    assert output.startswith("O")
+    assert bytes.fromhex(output[1:]).decode().startswith("Error: Snapshot 'missing'")
+    assert await client.read_packet() == "OK"
+
+
+@with_stub
+async def test_bad_checksum_is_rejected(stub, client):
+    client.send_raw(b"$?#00")
+    assert await client.request("?") == "S05"
+    assert client.acks[0] == b"-"
+
+
+@with_stub
+async def test_connections_get_independent_targets(stub, client):
+    other = await RSPClient.connect(stub.endpoint)
+    try:
+        assert await client.request(f"M{SRAM:x},1:ff") == "OK"
+        assert await other.request(f"m{SRAM:x},1") == "00"
+        assert len(stub.connections) == 2
+    finally:
+        await other.close()
+    assert stub.packets == 2
+
+
+@functools.lru_cache(maxsize=None)
+def _arm_gdb_available() -> bool:
+    """PATH의 gdb가 ARM 타겟을 지원하는지 확인합니다."""
+    if not shutil.which("gdb"):
+        return False
+    try:
+        result = subprocess.run(["gdb", "-nx", "-batch", "-ex", "set architecture arm"],
+                                capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0 and "Undefined" not in result.stderr
+
+
+requires_gdb = pytest.mark.skipif(not _arm_gdb_available(), reason="ARM을 지원하는 gdb가 필요합니다")
+
+
+def with_gdb(test):
+    """스텁에 접속한 GDBManager를 만들어 테스트 코루틴에 넘깁니다."""
+
+    def wrapper():
+        async def main():
+            stub = RSPStub()
+            endpoint = await stub.start()
+            gdb = GDBManager()
+            try:
+                success, error = await gdb.start(remote=endpoint, options=["-nx"], index_cache=False)
+                assert success, error
+                await test(gdb)
+            finally:
+                await gdb.stop()
+                await stub.close()
+
+        asyncio.run(main())
+
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@requires_gdb
+@with_gdb
+async def test_gdb_mi_transport_over_stub(gdb):
+    success, response, error = await gdb.execute_mi("-data-evaluate-expression $sp")
+    assert success, error
+    assert int(response.payload["value"].split()[-1], 0) == SRAM + SRAM_SIZE
+    success, output, error = await gdb.execute_command("info registers pc")
+    assert success, error
+    assert "pc" in output
+    results = await gdb.execute_commands(["print 1 + 1", "print 2 + 2"])
+    assert [ok for ok, _, _ in results] == [True, True]
+    assert "= 4" in results[1][1]
+
+
+@requires_gdb
+@with_gdb
+async def test_gdb_stop_epoch_cache_over_stub(gdb):
+    first = await gdb.execute_command("info registers")
+    hits = gdb.cache.hits
+    assert await gdb.execute_command("info registers") == first
+    assert gdb.cache.hits == hits + 1
+    epoch = gdb.state.epoch
+    success, _, error = await gdb.execute_command("set $pc = 0x200")
+    assert success, error
+    assert gdb.state.epoch > epoch
+    success, output, error = await gdb.execute_command("info registers pc")
+    assert success, error
+    assert "0x200" in output
+
+
+@requires_gdb
+@with_gdb
+async def test_gdb_memory_read_and_diff_over_stub(gdb):
+    success, _, error = await gdb.execute_command(f"set {{unsigned int}}{SRAM:#x} = 0x12345678")
+    assert success, error
+    success, start, before, unreadable, error = await gdb.read_memory(f"{SRAM:#x}", 64, chunk_size=16)
+    assert success, error
+    assert start == SRAM and unreadable == []
+    assert bytes(before[:4]) == struct.pack("<I", 0x12345678)
+
+    success, _, error = await gdb.execute_command(f"set {{unsigned char}}{SRAM + 33:#x} = 0xff")
+    assert success, error
+    success, _, after, _, error = await gdb.read_memory(f"{SRAM:#x}", 64, chunk_size=16)
+    assert success, error
+    assert diff_memory(bytes(before), bytes(after), address=SRAM) == [(SRAM + 33, 1)]
+
+    # SRAM 끝을 넘는 읽기는 영역 안의 부분만 읽고 나머지를 읽지 못한 구간으로 보고합니다
+    end = SRAM + SRAM_SIZE
+    success, start, data, unreadable, error = await gdb.read_memory(f"{end - 16:#x}", 64, chunk_size=32)
+    assert success, error
+    assert len(data) == 64
+    assert unreadable == [(end, 48)]
+
+
+@requires_gdb
+@with_gdb
+async def test_gdb_breakpoints_over_stub(gdb):
+    success, _, error = await gdb.execute_command("break *0x120")
+    assert success, error
+    assert [bkpt["addr"] for bkpt in gdb.state.breakpoints.values()] == ["0x00000120"]
+
+    success, _, error, stop = await gdb.execute_until_stopped("continue", 10)
+    assert success, error
+    assert stop["reason"] == "breakpoint-hit"
+    assert int(stop["frame"]["addr"], 0) == 0x120
+    assert gdb.state.execution_state == "stopped"
+
+    number = next(iter(gdb.state.breakpoints))
+    success, _, error = await gdb.execute_mi(f"-break-disable {number}")
+    assert success, error
+    assert gdb.state.breakpoints[number]["enabled"] == "n"
+    success, _, error = await gdb.execute_mi(f"-break-delete {number}")
+    assert success, error
+    assert gdb.state.breakpoints == {}
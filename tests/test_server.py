@@ -0,0 +1,48 @@
+"""MCP 서버 도구 호출 테스트."""
+
+import asyncio
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from gdb_mcp.metrics import METRICS
+from tests.fakes import FakeTransport
+
+
+def call_tool(server, name, arguments):
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+    return asyncio.run(handler(request)).root
+
+
+def test_handler_failure_sets_is_error_and_counts_tool_error(server):
+    result = call_tool(server, "gdb_status", {"session_id": "missing"})
+    assert result.isError
+    assert METRICS.snapshot()["tools"]["gdb_status"]["errors"] == 1
+
+    result = call_tool(server, "gdb_status", {})
+    assert not result.isError
+    assert METRICS.snapshot()["tools"]["gdb_status"]["errors"] == 1
+    assert 'tool_errors_total{tool="gdb_status"} 1' in METRICS.to_prometheus()
+
+
+def test_metrics_use_resolved_session_id(server):
+    result = call_tool(server, "qemu_start", {"arch": "no-such-arch", "new_session": True, "qmp": False})
+    assert result.isError
+    sessions = [session.session_id for session in server.sessions.list()]
+    assert len(sessions) == 1
+    assert list(METRICS.snapshot()["sessions"]) == sessions
+
+
+def test_read_memory_writes_output_path_in_executor(server, tmp_path):
+    memory = bytes(range(256)) * 16
+    session = server.sessions.get()
+    session.gdb.transport = FakeTransport(memory, 0x20000010)
+    output = tmp_path / "dump.bin"
+
+    result = call_tool(server, "gdb_read_memory", {
+        "address": "&buffer", "length": len(memory), "output_path": str(output)
+    })
+
+    assert not result.isError
+    assert output.read_bytes() == memory
+    assert METRICS.snapshot()["executor"]["wait"]["count"] == 1
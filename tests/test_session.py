@@ -0,0 +1,277 @@
+"""세션 레지스트리, GDB 스텁 포트 할당과 준비 상태 확인 테스트."""
+
+import asyncio
+import contextlib
+import os
+import sys
+
+import pytest
+
+import gdb_mcp.server as server_module
+from gdb_mcp import process_manager
+from gdb_mcp.mi_transport import GDBMITransport
+from gdb_mcp.process_manager import (
+    GDBManager, QEMUManager, allocate_gdb_port, probe_gdb_endpoint, release_gdb_port,
+)
+from gdb_mcp.server import GDBMCPServer
+from gdb_mcp.session import DEFAULT_SESSION_ID, SessionNotFoundError, SessionRegistry
+from tests.fakes import FAKE_GDB, FAKE_QEMU
+
+requires_unix = pytest.mark.skipif(os.name == "nt", reason="유닉스 소켓이 필요합니다")
+
+
+@pytest.fixture
+def fake_gdb(monkeypatch):
+    monkeypatch.setattr(GDBManager, "build_command", staticmethod(lambda *args, **kwargs: FAKE_GDB))
+
+
+@pytest.fixture
+def fake_qemu(tmp_path, monkeypatch):
+    """PATH에 qemu-system-fake를 두고 아키텍처 이름을 반환합니다."""
+    shim = tmp_path / "bin" / "qemu-system-fake"
+    shim.parent.mkdir()
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_QEMU}" "$@"\n')
+    shim.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{shim.parent}{os.pathsep}{os.environ['PATH']}")
+    return "fake"
+
+
+def test_registry_create_get_and_default():
+    registry = SessionRegistry()
+    session = registry.create("a")
+    assert registry.get("a") is session
+    with pytest.raises(ValueError):
+        registry.create("a")
+    with pytest.raises(SessionNotFoundError):
+        registry.get("missing")
+    assert registry.get_or_create("b") is not session
+
+    # 기본 세션은 처음 조회할 때 생성됩니다
+    assert DEFAULT_SESSION_ID not in registry
+    default = registry.get()
+    assert default.session_id == DEFAULT_SESSION_ID
+    assert registry.get(None) is default
+    assert len(registry) == 3
+    assert len(registry.create().session_id) == 12
+
+
+def test_close_and_close_all_stop_processes(fake_gdb):
+    async def main():
+        registry = SessionRegistry()
+        sessions = [registry.create(name) for name in ("a", "b", "c")]
+        for session in sessions:
+            success, error = await session.gdb.start(target="fw.elf", index_cache=False)
+            assert success, error
+
+        success, error = await registry.close("a")
+        assert success, error
+        assert "a" not in registry
+        assert not sessions[0].gdb.is_running()
+        with pytest.raises(SessionNotFoundError):
+            await registry.close("a")
+
+        await registry.close_all()
+        assert len(registry) == 0
+        assert not any(session.gdb.is_running() for session in sessions)
+
+    asyncio.run(main())
+
+
+def test_server_run_closes_sessions_on_shutdown(fake_gdb, monkeypatch):
+    @contextlib.asynccontextmanager
+    async def fake_stdio_server():
+        yield None, None
+
+    monkeypatch.setattr(server_module, "stdio_server", fake_stdio_server)
+    monkeypatch.setattr(server_module, "DEFAULT_POOL_TARGETS", ())
+
+    async def main():
+        server = GDBMCPServer()
+
+        async def serve(*args, **kwargs):
+            raise ConnectionResetError("클라이언트 연결 종료")
+
+        server.server.run = serve
+        session = server.sessions.create("worker")
+        success, error = await session.gdb.start(target="fw.elf", index_cache=False)
+        assert success, error
+
+        with pytest.raises(ConnectionResetError):
+            await server.run()
+        assert len(server.sessions) == 0
+        assert not session.gdb.is_running()
+
+    asyncio.run(main())
+
+
+def test_allocate_gdb_port_reserves_unique_ports():
+    ports = [allocate_gdb_port() for _ in range(16)]
+    try:
+        assert len(set(ports)) == len(ports)
+        assert set(ports) <= process_manager._reserved_ports
+    finally:
+        for port in ports:
+            release_gdb_port(port)
+    assert not set(ports) & process_manager._reserved_ports
+    release_gdb_port(None)
+
+
+def test_allocate_gdb_port_skips_reserved_ports(monkeypatch):
+    ports = iter([40001, 40001, 40002])
+
+    class FakeSocket:
+        def __init__(self, *args):
+            self.port = next(ports)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def bind(self, address):
+            pass
+
+        def getsockname(self):
+            return ("0.0.0.0", self.port)
+
+    monkeypatch.setattr(process_manager.socket, "socket", FakeSocket)
+    monkeypatch.setattr(process_manager, "_reserved_ports", set())
+    assert allocate_gdb_port() == 40001
+    assert allocate_gdb_port() == 40002
+
+
+def test_probe_gdb_endpoint_tcp():
+    async def main():
+        server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            assert await probe_gdb_endpoint(f"localhost:{port}")
+            assert await probe_gdb_endpoint(f":{port}")
+        finally:
+            server.close()
+            await server.wait_closed()
+        assert not await probe_gdb_endpoint(f"127.0.0.1:{port}")
+
+    asyncio.run(main())
+
+
+@requires_unix
+def test_probe_gdb_endpoint_unix(tmp_path):
+    path = str(tmp_path / "gdb.sock")
+
+    async def main():
+        assert not await probe_gdb_endpoint(path)
+        server = await asyncio.start_unix_server(lambda reader, writer: writer.close(), path)
+        try:
+            assert await probe_gdb_endpoint(path)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_gdb_stub_args():
+    manager = QEMUManager()
+    assert manager._gdb_stub_args(["-gdb", "tcp::9999"], None, "tcp") == []
+    assert manager._gdb_stub_args(["-s", "-S"], None, "tcp") == []
+    assert manager.endpoint == "localhost:1234"
+    assert manager._gdb_stub_args(["-s"], None, "tcp") == ["-S"]
+
+    assert manager._gdb_stub_args([], 4321, "tcp") == ["-gdb", "tcp::4321", "-S"]
+    assert manager.endpoint == "localhost:4321"
+    assert not manager._owns_port
+
+    args = manager._gdb_stub_args([], None, "tcp")
+    try:
+        assert manager._owns_port
+        assert args == ["-gdb", f"tcp::{manager.port}", "-S"]
+        assert manager.port in process_manager._reserved_ports
+    finally:
+        manager._cleanup()
+    assert manager.port is None
+
+    with pytest.raises(ValueError):
+        manager._gdb_stub_args([], None, "serial")
+
+
+@requires_unix
+def test_gdb_stub_args_unix():
+    manager = QEMUManager()
+    try:
+        args = manager._gdb_stub_args([], None, "unix")
+        assert manager.endpoint.endswith("gdb.sock")
+        assert args == ["-gdb", f"unix:{manager.endpoint},server=on,wait=off", "-S"]
+    finally:
+        manager._cleanup()
+
+
+@requires_unix
+@pytest.mark.parametrize("gdb_transport", ["tcp", "unix"])
+def test_qemu_start_waits_for_gdb_stub(fake_qemu, gdb_transport):
+    async def main():
+        manager = QEMUManager()
+        try:
+            success, error = await manager.start(fake_qemu, options=["-fake-delay", "0.2"],
+                                                 gdb_transport=gdb_transport, qmp=False)
+            assert success, error
+            # 스텁이 열리기 전에 반환하지 않습니다
+            assert manager.startup_time >= 0.2
+            assert await probe_gdb_endpoint(manager.endpoint)
+            port = manager.port
+        finally:
+            await manager.stop()
+        assert not manager.is_running()
+        assert port is None or port not in process_manager._reserved_ports
+
+    asyncio.run(main())
+
+
+@requires_unix
+def test_qemu_start_reports_immediate_exit(fake_qemu):
+    async def main():
+        manager = QEMUManager()
+        success, error = await manager.start(fake_qemu, options=["-fake-exit"], qmp=False)
+        assert not success
+        assert error.startswith("QEMU 프로세스가 즉시 종료되었습니다")
+        assert manager.process is None and manager.port is None
+
+        success, error = await manager.start(fake_qemu, options=["-fake-exit"], gdb_stub=False, qmp=False)
+        assert not success
+        assert error.startswith("QEMU 프로세스가 즉시 종료되었습니다")
+
+    asyncio.run(main())
+
+
+@requires_unix
+def test_qemu_start_times_out_when_stub_never_opens(fake_qemu):
+    async def main():
+        manager = QEMUManager()
+        success, error = await manager.start(fake_qemu, options=["-fake-delay", "30"],
+                                             startup_timeout=0.3, qmp=False)
+        assert not success
+        assert error.startswith("GDB 스텁 준비 타임아웃")
+        assert not manager.is_running()
+
+    asyncio.run(main())
+
+
+def test_gdb_transport_waits_for_first_prompt():
+    async def main():
+        transport = GDBMITransport(FAKE_GDB + ["--delay", "0.2"])
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await transport.start(timeout=5)
+        try:
+            assert loop.time() - started >= 0.2
+            assert transport.is_alive()
+        finally:
+            await transport.close()
+
+        transport = GDBMITransport(FAKE_GDB + ["--delay", "5"])
+        with pytest.raises(asyncio.TimeoutError):
+            await transport.start(timeout=0.2)
+        assert not transport.is_alive()
+
+    asyncio.run(main())
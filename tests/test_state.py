@@ -0,0 +1,156 @@
+"""세션 상태 캐시와 명령 분류 테스트."""
+
+import asyncio
+
+import pytest
+
+from gdb_mcp.process_manager import GDBManager
+from gdb_mcp.state import SessionState, StopEpochCache, is_cacheable_command, is_state_changing_command
+from tests.fakes import FakeTransport
+
+
+@pytest.mark.parametrize("command", [
+    "print x = 1",
+    "p/x counter++",
+    "p --i",
+    "print -pretty -- x = 2",
+    "call reset()",
+    "set var x = 3",
+    "-data-evaluate-expression \"x=1\"",
+    "-data-evaluate-expression --thread 1 --frame 0 x++",
+    "-data-write-memory-bytes 0x20000000 00",
+    "-thread-select 2",
+    "return",
+    "-exec-return",
+    "kill",
+    "detach",
+    "target remote localhost:1234",
+    "source scripts/setup.gdb",
+    "python gdb.execute('set $pc = 0')",
+])
+def test_state_changing_commands(command):
+    assert is_state_changing_command(command)
+
+
+@pytest.mark.parametrize("command", [
+    "print x == 1",
+    "p x <= y",
+    "print -pretty -- x",
+    "-stack-list-locals --simple-values",
+    "-stack-list-variables --all-values",
+    "-stack-list-arguments --simple-values 0 1",
+    "-data-evaluate-expression --thread 1 --frame 0 x",
+    "info registers",
+    "x/4x $sp",
+    "",
+])
+def test_read_only_commands(command):
+    assert not is_state_changing_command(command)
+
+
+def test_cacheable_commands():
+    assert is_cacheable_command("info  registers")
+    assert is_cacheable_command("-stack-list-locals --simple-values")
+    assert not is_cacheable_command("info breakpoints")
+
+
+def test_stop_epoch_cache_drops_old_epoch():
+    cache = StopEpochCache(max_entries=2)
+    cache.put(1, "a", 1)
+    assert cache.get(1, "a") == 1
+    assert cache.get(2, "a") is None
+    cache.put(2, "b", 2)
+    cache.put(1, "c", 3)
+    assert cache.get(2, "b") == 2
+    assert cache.get(1, "a") is None
+    cache.put(2, "c", 3)
+    cache.put(2, "d", 4)
+    assert cache.get(2, "b") is None
+
+
+def make_manager():
+    manager = GDBManager()
+    manager.transport = FakeTransport()
+    manager.state.execution_state = "stopped"
+    return manager
+
+
+@pytest.mark.parametrize("stop_on_error", [False, True])
+def test_execute_batch_uses_stop_epoch_cache(stop_on_error):
+    manager = make_manager()
+    commands = ["info registers", "bt"]
+
+    first = asyncio.run(manager.execute_batch(commands, stop_on_error=stop_on_error))
+    second = asyncio.run(manager.execute_batch(commands, stop_on_error=stop_on_error))
+
+    assert first == second == [(True, "info registers", None), (True, "bt", None)]
+    assert manager.transport.sent == commands
+    assert manager.cache.hits == 2
+
+
+@pytest.mark.parametrize("stop_on_error", [False, True])
+def test_execute_batch_state_change_invalidates_cache(stop_on_error):
+    manager = make_manager()
+    asyncio.run(manager.execute_batch(["info registers"], stop_on_error=stop_on_error))
+    manager.transport.sent.clear()
+
+    asyncio.run(manager.execute_batch(["set var x = 1", "info registers"], stop_on_error=stop_on_error))
+
+    assert manager.transport.sent == ["set var x = 1", "info registers"]
+
+
+@pytest.mark.parametrize("command", [
+    "return", "-exec-return", "kill", "detach", "target remote localhost:1234",
+    "source scripts/setup.gdb", "python gdb.execute('set $pc = 0')",
+])
+def test_state_changing_command_invalidates_cached_queries(command):
+    manager = make_manager()
+    asyncio.run(manager.execute_command("bt"))
+    asyncio.run(manager.execute_command(command))
+    asyncio.run(manager.execute_command("bt"))
+    assert manager.transport.sent == ["bt", command, "bt"]
+    assert manager.cache.hits == 0
+
+
+def make_state_with_breakpoints():
+    state = SessionState()
+    for number in ("1", "2", "3"):
+        state.handle_record({"type": "result", "message": "done",
+                             "payload": {"bkpt": {"number": number, "enabled": "y"}}})
+    return state
+
+
+def test_break_commands_update_breakpoints_without_notifications():
+    state = make_state_with_breakpoints()
+
+    state.apply_command("-break-disable 1 2")
+    assert [bkpt["enabled"] for bkpt in state.breakpoints.values()] == ["n", "n", "y"]
+    state.apply_command("-break-enable 2")
+    assert state.breakpoints["2"]["enabled"] == "y"
+
+    state.apply_command("-break-condition 3 count > 5")
+    assert state.breakpoints["3"]["cond"] == "count > 5"
+    state.apply_command("-break-condition 3")
+    assert "cond" not in state.breakpoints["3"]
+
+    state.apply_command("-break-delete 1 3")
+    assert list(state.breakpoints) == ["2"]
+    state.apply_command("-break-delete")
+    assert state.breakpoints == {}
+
+
+def test_thread_select_updates_current_thread_and_frame():
+    state = SessionState()
+    frame = {"level": "0", "addr": "0x08000100", "func": "worker"}
+    state.apply_command("-thread-select 2", {"new-thread-id": "2", "frame": frame})
+    assert state.current_thread == "2"
+    assert state.current_frame == frame
+
+
+def test_manager_applies_successful_break_commands():
+    manager = make_manager()
+    manager.state = make_state_with_breakpoints()
+    asyncio.run(manager.execute_mi("-break-disable 1"))
+    asyncio.run(manager.execute_command("-break-delete 2"))
+    assert manager.state.breakpoints["1"]["enabled"] == "n"
+    assert "2" not in manager.state.breakpoints
@@ -0,0 +1,63 @@
+"""요청 추적 테스트."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from gdb_mcp.tracing import TRACER, detached_task, span, trace_request_handler
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / "trace.json"
+    monkeypatch.setattr(TRACER, "path", str(path))
+    monkeypatch.setattr(TRACER, "sample", 1.0)
+    yield path
+    TRACER.close()
+
+
+def read_events(path):
+    return [json.loads(line.rstrip(",\n")) for line in path.read_text().splitlines()[1:]]
+
+
+def test_detached_task_does_not_inherit_trace(trace_file):
+    async def background(name):
+        with span(name):
+            await asyncio.sleep(0)
+
+    async def main():
+        with TRACER.trace("tools/call test"):
+            with span("handler"):
+                inherited = asyncio.ensure_future(background("inherited"))
+                detached = detached_task(background("detached"))
+                await asyncio.gather(inherited, detached)
+
+    asyncio.run(main())
+    TRACER.close()
+    names = [event["name"] for event in read_events(trace_file) if event["ph"] == "X"]
+    assert "inherited" in names
+    assert "detached" not in names
+    assert names[-1] == "tools/call test"
+
+
+def test_request_handler_serializes_result_once(trace_file):
+    dumps = []
+
+    class Result:
+        def model_dump_json(self, **kwargs):
+            dumps.append(kwargs)
+            return "{}"
+
+    async def handler(request):
+        with span("handler"):
+            return Result()
+
+    request = SimpleNamespace(params=SimpleNamespace(name="gdb_status"))
+    asyncio.run(trace_request_handler(handler)(request))
+    TRACER.close()
+    names = [event["name"] for event in read_events(trace_file) if event["ph"] == "X"]
+    assert names == ["handler", "tools/call gdb_status"]
+    # 직렬화는 MCP 전송 계층이 한 번만 합니다
+    assert dumps == []